@@ -0,0 +1,416 @@
+import os
+import re
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from requests.compat import chardet
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import RequestHistory
+from tqdm import tqdm
+
+try:
+    import aiohttp
+except ImportError:  # 선택 의존성: --engine async에서만 필요
+    aiohttp = None
+
+import config
+import utils
+import parsers
+import blob_store
+from rate_limiter import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+def response_encoding(headers, content):
+    """requests의 Response.encoding(없으면 apparent_encoding)과 같은 규칙으로 본문 인코딩 결정"""
+    encoding = get_encoding_from_headers(headers)
+    if encoding:
+        return encoding
+    return chardet.detect(content)['encoding'] if chardet is not None else 'utf-8'
+
+
+class AsyncCrawlEngine:
+    """
+    asyncio + aiohttp 기반 수집 엔진 (--engine async).
+
+    PressReleaseScraper의 저장소, 중복 제거 인덱스, 속도 제한, 재시도 정책(_retry_strategy),
+    레코드 구성을 그대로 쓰고 네트워크 I/O만 이벤트 루프에서 처리합니다.
+    get_list_page / get_detail_page / download_attachment는 스크래퍼와 같은 값을 반환하는 코루틴입니다.
+
+    - 동시에 진행 중인 HTTP 요청 수는 세마포어(concurrency)로 제한하고,
+      요청 속도는 스레드 엔진과 같은 공유 속도 제한기를 따릅니다.
+    - 목록은 앞서 읽어 상세 수집 작업을 최대 config.ASYNC_PENDING_DETAILS개까지 대기시키고,
+      결과는 목록 순서대로 1건씩 저장합니다 (저장 순서가 스레드 엔진과 같음).
+    - 첨부파일은 청크 단위로 디스크에 바로 기록합니다 (이어받기, 크기 검증, blob 저장은 스레드 엔진과 같음).
+    - HTTP 응답 캐시와 오프라인 모드(--from-cache)는 지원하지 않습니다.
+    """
+
+    def __init__(self, scraper, concurrency=config.ASYNC_CONCURRENCY):
+        if aiohttp is None:
+            raise RuntimeError("비동기 엔진(--engine async)에는 aiohttp가 필요합니다: pip install aiohttp")
+        if scraper.offline:
+            raise ValueError("비동기 엔진은 오프라인 모드(--from-cache)를 지원하지 않습니다.")
+        self.scraper = scraper
+        self.metrics = scraper.metrics
+        self.concurrency = max(1, concurrency)
+        self.session = None
+        self._semaphore = None
+        self._pacer = None
+        self._parse_executor = None
+
+    # --- HTTP ---
+
+    async def _wait_slot(self):
+        """
+        공유 속도 제한기의 다음 슬롯까지 대기
+        (제한기의 대기는 time.sleep이므로 전용 스레드 하나에서 순서대로 처리, 슬롯은 어차피 하나씩 배정됨)
+        """
+        if self.scraper.rate_limiter.interval <= 0:
+            return
+        await asyncio.get_running_loop().run_in_executor(self._pacer, self.scraper.limiter.wait)
+
+    @asynccontextmanager
+    async def _request(self, url, stage="other", headers=None):
+        """세마포어로 동시 요청 수를 제한한 GET. 본문은 컨텍스트 안에서 읽어야 합니다."""
+        async with self._semaphore:
+            response = await self._get(url, stage, headers)
+            try:
+                yield response
+            finally:
+                response.release()
+
+    async def _get(self, url, stage, headers=None):
+        """
+        속도 제한과 재시도 정책(스크래퍼 세션과 같은 urllib3 Retry 설정)을 적용한 GET
+        재시도 대상 상태 코드(429/5xx)와 연결 오류는 Retry-After 또는 지수 백오프만큼 기다렸다 다시 요청하며,
+        재시도 횟수를 다 쓰면 예외를 발생시킵니다.
+        """
+        retry = self.scraper._retry_strategy()
+        limiter = self.scraper.limiter
+        await self._wait_slot()
+
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await self.session.get(url, headers=headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retry = retry.new(total=retry.total - 1,
+                                  history=retry.history + (RequestHistory("GET", url, e, None, None),))
+                if retry.is_exhausted():
+                    self.metrics.inc('http_errors_total', stage=stage)
+                    raise
+                self.metrics.inc('http_retries_total', stage=stage, status='error')
+                await asyncio.sleep(retry.get_backoff_time())
+                await self._wait_slot()
+                continue
+            elapsed = time.perf_counter() - start
+
+            retry_after_value = response.headers.get('Retry-After')
+            if retry.is_retry("GET", response.status, retry_after_value is not None):
+                next_retry = retry.new(
+                    total=retry.total - 1,
+                    history=retry.history + (RequestHistory("GET", url, None, response.status, None),)
+                )
+                if not next_retry.is_exhausted():
+                    # FeedbackRetry와 같이 재시도 원인을 제한기에 전달하고, 재시도 요청도 속도 제한을 거침
+                    limiter.on_response(response.status, retry_after=parse_retry_after(retry_after_value))
+                    self.metrics.inc('http_retries_total', stage=stage, status=response.status)
+                    response.release()
+                    delay = None
+                    if retry.respect_retry_after_header and retry_after_value:
+                        delay = next_retry.parse_retry_after(retry_after_value)
+                    await asyncio.sleep(delay if delay is not None else next_retry.get_backoff_time())
+                    await self._wait_slot()
+                    retry = next_retry
+                    continue
+                # 재시도 횟수 소진: requests 세션(raise_on_status)과 같이 예외 발생
+                self.metrics.inc('http_errors_total', stage=stage)
+                response.release()
+                response.raise_for_status()
+
+            limiter.on_response(
+                response.status,
+                latency=None if retry.history else elapsed,
+                retry_after=parse_retry_after(retry_after_value)
+            )
+            if self.metrics.enabled:
+                self.metrics.observe('http_request_seconds', elapsed, stage=stage)
+                self.metrics.inc('http_responses_total', stage=stage, status=response.status)
+                self.metrics.set_gauge('request_rate', limiter.rate)
+            return response
+
+    # --- 목록 / 상세 ---
+
+    async def get_list_page(self, page):
+        """목록 페이지 파싱 (PressReleaseScraper.get_list_page와 같은 결과, 실패 시 실패 목록에 기록하고 [])"""
+        url = self.scraper.board.list_url(page)
+        try:
+            async with self._request(url, "list") as response:
+                response.raise_for_status()
+                content = await response.read()
+                encoding = response_encoding(response.headers, content)
+            items = self.scraper._list_items(content.decode(encoding, errors='replace'))
+        except Exception as e:
+            logger.error(f"목록 페이지 {page} 로드 실패: {e}")
+            self.scraper._record_failure('list', page, e)
+            return []
+
+        self.scraper.store.resolve_failure('list', page)
+        return items
+
+    async def fetch_detail(self, ntt_id):
+        """상세 페이지 원본 수집 -> (url, 본문 bytes, 인코딩)"""
+        url = self.scraper._detail_url(ntt_id)
+        async with self._request(url, "detail") as response:
+            content = await response.read()
+            return url, content, response_encoding(response.headers, content)
+
+    async def get_detail_page(self, ntt_id, date_str):
+        """상세 페이지 파싱 및 첨부파일 수집 (실패 시 실패 목록에 기록하고 None)"""
+        try:
+            url, content, encoding = await self.fetch_detail(ntt_id)
+            # 파싱/요약은 CPU 작업이므로 이벤트 루프 밖(스레드 또는 파싱 프로세스)에서 수행
+            _, parsed = await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor, parsers.parse_detail_job,
+                (None, ntt_id, content, encoding, self.scraper.board.selectors)
+            )
+            return await self.build_record(ntt_id, date_str, url, parsed)
+        except Exception as e:
+            logger.error(f"상세 페이지 {ntt_id} 파싱 실패: {e}")
+            self.scraper._record_failure('detail', ntt_id, e, date_str=date_str)
+            return None
+
+    async def build_record(self, ntt_id, date_str, url, parsed):
+        """
+        첨부파일을 받고 레코드 구성 (PressReleaseScraper.build_record와 같은 결과)
+        한 게시글의 첨부파일은 같은 폴더에 쓰므로 차례로 받고, 동시성은 게시글 사이에서 얻습니다.
+        """
+        self.metrics.observe('parse_seconds', parsed['parse_seconds'], kind='detail')
+        attachments = []
+        file_paths = []
+        downloaded_set = set()
+        folder_name = self.scraper._attachment_folder(parsed['title'], date_str)
+
+        for atch_no, file_ord, _ in parsed['downloads']:
+            if (atch_no, file_ord) in downloaded_set:
+                continue
+            fname, fpath = await self._fetch_attachment(atch_no, file_ord, folder_name, ntt_id, date_str)
+            if fname:
+                attachments.append(fname)
+                file_paths.append(os.path.relpath(fpath, config.BASE_DIR))
+                downloaded_set.add((atch_no, file_ord))
+
+        return self.scraper._compose_record(ntt_id, date_str, url, parsed, attachments, file_paths)
+
+    # --- 첨부파일 ---
+
+    async def _fetch_attachment(self, atch_no, file_ord, folder_name, ntt_id="", date_str=""):
+        """매니페스트에 있으면 기존 파일 사용, 아니면 다운로드 후 기록 (실패 시 실패 목록에 기록)"""
+        existing = self.scraper._existing_attachment(atch_no, file_ord, folder_name)
+        if existing:
+            return existing
+
+        url = self.scraper._attachment_url(atch_no, file_ord)
+        try:
+            fname, fpath, sha256 = await self._download_attachment(
+                url, folder_name, self.scraper._manifest_size(atch_no, file_ord)
+            )
+        except Exception as e:
+            self.scraper._attachment_failed(atch_no, file_ord, url, e, ntt_id, date_str)
+            return None, None
+
+        # 이미 있던 파일이면 해시를 계산하므로(파일 크기에 비례) 이벤트 루프 밖에서
+        await asyncio.to_thread(self.scraper._attachment_done, atch_no, file_ord, fname, fpath, sha256)
+        return fname, fpath
+
+    async def download_attachment(self, url, folder_name):
+        """첨부파일 다운로드 (실패 시 로그를 남기고 (None, None) 반환)"""
+        try:
+            return (await self._download_attachment(url, folder_name))[:2]
+        except Exception as e:
+            logger.error(f"파일 다운로드 실패 ({url}): {e}")
+            return None, None
+
+    async def _download_attachment(self, url, folder_name, expected_size=None):
+        """첨부파일 다운로드 본체 (실패 시 예외 발생, 반환값은 PressReleaseScraper._download_attachment와 같음)"""
+        async with self._request(url, "attachment") as response:
+            response.raise_for_status()
+            filename, file_path = self.scraper._attachment_target(
+                response.headers, response.url if response.history else url, folder_name
+            )
+            if self.scraper._reusable_file(file_path, response.headers, expected_size):
+                return filename, file_path, None
+
+            part_path = file_path + ".part"
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if offset == 0:
+                await self._write_body(response, part_path, 0)
+
+        if offset > 0:
+            # 이전에 중단된 .part가 있으면 Range 요청으로 이어받기 (범위 오류면 처음부터)
+            async with self._request(url, "attachment", headers={"Range": f"bytes={offset}-"}) as response:
+                resumed = response.status != 416
+                if resumed:
+                    response.raise_for_status()
+                    await self._write_body(response, part_path, offset)
+            if not resumed:
+                os.remove(part_path)
+                async with self._request(url, "attachment") as response:
+                    response.raise_for_status()
+                    await self._write_body(response, part_path, 0)
+
+        sha256 = await asyncio.to_thread(blob_store.store_file, part_path, file_path)
+        return filename, file_path, sha256
+
+    async def _write_body(self, response, part_path, offset):
+        """
+        응답 본문을 청크 단위로 part_path에 기록 (PressReleaseScraper._stream_to_file과 같은 검증)
+        206 응답이면 offset부터 이어 쓰고, 200이면 처음부터 다시 씁니다.
+        """
+        mode = 'wb'
+        if response.status == 206:
+            match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get("Content-Range", ""))
+            if not match or int(match.group(1)) != offset:
+                os.remove(part_path)
+                raise IOError("이어받기 응답의 범위가 요청과 다릅니다")
+            mode = 'ab'
+            logger.info(f"이어받기: {os.path.basename(part_path[:-len('.part')])} ({offset} 바이트부터)")
+        else:
+            offset = 0
+
+        # 압축 전송 시 Content-Length는 압축된 크기이므로 검증하지 않음
+        expected = None
+        content_length = response.headers.get("Content-Length")
+        if content_length and response.headers.get("Content-Encoding", "identity") == "identity":
+            expected = offset + int(content_length)
+
+        received = 0
+        with self.metrics.timer('attachment_download_seconds'), open(part_path, mode) as f:
+            async for chunk in response.content.iter_chunked(config.DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                received += len(chunk)
+        self.metrics.inc('attachment_bytes_total', received)
+
+        actual = os.path.getsize(part_path)
+        if expected is not None and actual != expected:
+            raise IOError(f"다운로드 크기 불일치 (예상 {expected}, 실제 {actual}), 다음 실행 시 이어받습니다")
+
+    # --- 수집 ---
+
+    def crawl(self, page, test_mode, pbar, sync=False, end_page=None):
+        """PressReleaseScraper._crawl_pages와 같은 규칙으로 목록을 순회하며 수집 (이벤트 루프 실행)"""
+        asyncio.run(self._run(page, test_mode, pbar, sync, end_page))
+
+    async def _run(self, page, test_mode, pbar, sync, end_page):
+        parse_workers = self.scraper.parse_workers
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._pacer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pacer")
+        self._parse_executor = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(sock_connect=config.TIMEOUT, sock_read=config.TIMEOUT)
+        try:
+            async with aiohttp.ClientSession(headers=config.HEADERS, connector=connector, timeout=timeout) as session:
+                self.session = session
+                await self._crawl_pages(page, test_mode, pbar, sync, end_page)
+        finally:
+            self.session = None
+            self._pacer.shutdown(wait=True)
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(wait=True)
+
+    async def _crawl_pages(self, page, test_mode, pbar, sync, end_page):
+        scraper = self.scraper
+        stop_flag = False
+        total_collected = 0
+        known_streak = 0
+        high_water_id, _ = scraper.store.get_high_water()
+        # 목록 순서대로 대기 중인 상세 수집 작업: (페이지, 페이지 마지막 작업 여부, task)
+        pending = deque()
+        page_saved = {}
+
+        async def drain(limit):
+            """앞에서부터 완료를 기다려 목록 순서대로 저장 (대기 작업이 limit개 이하가 될 때까지)"""
+            nonlocal total_collected
+            while len(pending) > limit:
+                page_no, last_of_page, task = pending.popleft()
+                data = await task
+                self.metrics.inc('details_total', result='ok' if data else 'failed')
+                if data:
+                    scraper.save_record(data)
+                    page_saved[page_no] = page_saved.get(page_no, 0) + 1
+                    total_collected += 1
+                    tqdm.write(f"    Target: {data['제목'][:30]}...")
+                if last_of_page and page_saved.get(page_no):
+                    logger.info(f"데이터 저장 완료: {page_saved.pop(page_no)}건 ({scraper.store.path})")
+                    scraper.flush_parquet()
+
+        try:
+            while not stop_flag:
+                if end_page is not None and page > end_page:
+                    break
+
+                pbar.set_description(f"Page {page}")
+                items = scraper._list_cache.pop(page, None) or await self.get_list_page(page)
+                if not items:
+                    logger.info("더 이상 게시글이 없거나 파싱에 실패했습니다.")
+                    break
+
+                candidates = []
+                for idx, (ntt_id, date_str) in enumerate(items):
+                    dt = utils.parse_date(date_str)
+                    if dt and dt < scraper.date_from:
+                        logger.info(f"수집 시작일({scraper.date_from:%Y-%m-%d}) 이전 데이터 도달 ({date_str}). 종료합니다.")
+                        stop_flag = True
+                        break
+                    if dt and scraper.date_to and dt > scraper.date_to:
+                        continue
+
+                    seen = str(ntt_id) in scraper.seen_ids
+                    if sync:
+                        if seen or (high_water_id is not None and int(ntt_id) <= high_water_id):
+                            known_streak += 1
+                        else:
+                            known_streak = 0
+                        if known_streak >= config.SYNC_KNOWN_STREAK:
+                            logger.info(f"수집된 게시글이 연속 {known_streak}건 확인되어 동기화를 종료합니다.")
+                            stop_flag = True
+                            break
+                    if seen and not test_mode:
+                        continue
+                    candidates.append((idx, len(items), ntt_id, date_str))
+
+                if test_mode:
+                    candidates = candidates[:max(0, 5 - total_collected)]
+
+                for position, (idx, total, ntt_id, date_str) in enumerate(candidates):
+                    tqdm.write(f"  - [{idx+1}/{total}] 상세 수집 중: {ntt_id} ({date_str})")
+                    task = asyncio.create_task(self.get_detail_page(ntt_id, date_str))
+                    pending.append((page, position == len(candidates) - 1, task))
+
+                if not candidates and not stop_flag and not test_mode:
+                    logger.info(f"페이지 {page}의 모든 데이터가 이미 수집되었습니다. (중복)")
+                    if sync:
+                        logger.info("동기화 모드: 새 게시글이 없어 종료합니다.")
+                        stop_flag = True
+
+                # 테스트 모드는 목표 건수 확인을 위해 페이지마다 모두 저장
+                await drain(0 if test_mode else config.ASYNC_PENDING_DETAILS)
+                if test_mode and total_collected >= 5:
+                    logger.info("테스트 목표 달성 (5건). 종료합니다.")
+                    break
+
+                self.metrics.inc('list_pages_total')
+                page += 1
+                pbar.update(1)
+
+            await drain(0)
+        finally:
+            # 중단 시 진행 중인 작업 취소 (저장된 레코드는 이미 커밋됨)
+            for _, _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
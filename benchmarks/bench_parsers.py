@@ -0,0 +1,143 @@
+"""
+HTML 파서 벤치마크: BeautifulSoup(html.parser) vs lxml
+
+HTTP 캐시(cache/)에 저장된 목록/상세 페이지가 있으면 그것을, 없으면 합성 페이지를 사용합니다.
+두 구현의 파싱 결과가 같은지 확인하고 초당 처리 페이지 수를 출력합니다.
+
+사용법:
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --synthetic 200 --repeat 3
+    python benchmarks/bench_parsers.py --processes 4   # 파싱 프로세스 수에 따른 상세 페이지 처리량
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+import parsers
+from benchmarks import sample_pages
+
+BACKENDS = ('html.parser', 'lxml')
+
+
+def load_cached_pages(cache_dir):
+    """캐시에서 (종류, ntt_id, html) 목록 로드"""
+    pages = []
+    for meta_path in glob.glob(os.path.join(cache_dir, '*', '*.json')):
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if not meta.get('has_body'):
+                continue
+            with open(meta_path[:-len('.json')] + '.body', 'rb') as f:
+                html = f.read().decode('utf-8', errors='replace')
+        except (OSError, ValueError):
+            continue
+
+        url = meta.get('url', '')
+        if '/bbs/list.do' in url:
+            pages.append(('list', None, html))
+        elif '/bbs/view.do' in url:
+            ntt_id = url.rsplit('nttSeqNo=', 1)[-1]
+            pages.append(('detail', ntt_id, html))
+    return pages
+
+
+def synthetic_pages(count):
+    pages = []
+    for i in range(count):
+        pages.append(('list', None, sample_pages.list_page(i + 1)))
+        ntt_id = 3_200_000 + i
+        pages.append(('detail', str(ntt_id), sample_pages.detail_page(ntt_id)))
+    return pages
+
+
+def parse(kind, ntt_id, html, backend):
+    if kind == 'list':
+        return parsers.parse_list_page(html, backend=backend)
+    return parsers.parse_detail_page(html, ntt_id, backend=backend)
+
+
+def run(pages, repeat):
+    results = {}
+    for backend in BACKENDS:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs = [parse(kind, ntt_id, html, backend) for kind, ntt_id, html in pages]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[backend] = (best, outputs)
+    return results
+
+
+def run_processes(pages, max_processes):
+    """상세 페이지 파싱+요약(parse_detail_job)을 프로세스 수별로 측정"""
+    jobs = [(None, ntt_id, html.encode('utf-8'), 'utf-8') for kind, ntt_id, html in pages if kind == 'detail']
+    if not jobs:
+        return
+    baseline = None
+    for processes in range(1, max_processes + 1):
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            # 프로세스 기동 시간은 제외
+            list(pool.map(parsers.parse_detail_job, jobs[:processes]))
+            start = time.perf_counter()
+            list(pool.map(parsers.parse_detail_job, jobs, chunksize=max(1, len(jobs) // (processes * 8))))
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"  프로세스 {processes:2d}  {len(jobs) / elapsed:8.1f} pages/s  (x{baseline / elapsed:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 벤치마크")
+    parser.add_argument('--cache-dir', default=config.HTTP_CACHE_DIR, help="HTTP 캐시 경로")
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help="합성 목록/상세 페이지 쌍 개수 (캐시가 비어 있으면 기본 100)")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (최고 기록 사용)")
+    parser.add_argument('--processes', type=int, default=0,
+                        help="지정 시 1~N개 프로세스로 상세 페이지 파싱+요약 처리량 측정")
+    args = parser.parse_args()
+
+    pages = [] if args.synthetic else load_cached_pages(args.cache_dir)
+    source = f"캐시 {args.cache_dir}"
+    if not pages:
+        pages = synthetic_pages(args.synthetic or 100)
+        source = "합성 페이지"
+
+    n_list = sum(1 for kind, _, _ in pages if kind == 'list')
+    print(f"입력: {source} (목록 {n_list}, 상세 {len(pages) - n_list}, "
+          f"{sum(len(html) for _, _, html in pages) / 1024 / 1024:.1f} MB)")
+
+    results = run(pages, args.repeat)
+
+    baseline = results[BACKENDS[0]][0]
+    for backend in BACKENDS:
+        elapsed, _ = results[backend]
+        print(f"  {backend:12s} {len(pages) / elapsed:8.1f} pages/s  "
+              f"({elapsed:.3f}s, x{baseline / elapsed:.1f})")
+
+    expected = results[BACKENDS[0]][1]
+    mismatches = [
+        (kind, ntt_id)
+        for (kind, ntt_id, _), a, b in zip(pages, expected, results['lxml'][1])
+        if a != b
+    ]
+    if args.processes:
+        print(f"상세 페이지 파싱+요약 (CPU 코어 {os.cpu_count()}개):")
+        run_processes(pages, args.processes)
+
+    if mismatches:
+        print(f"결과 불일치 {len(mismatches)}건: {mismatches[:10]}")
+        return 1
+    print("결과 일치: 모든 페이지에서 두 파서의 출력이 동일합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
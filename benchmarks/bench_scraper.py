@@ -0,0 +1,276 @@
+"""
+스크래퍼 처리량 벤치마크 (로컬 대역 서버 사용, 실제 사이트에 요청하지 않음)
+
+측정 항목:
+    list     get_list_page   (목록 페이지 수집+파싱, 게시글 단위)
+    detail   get_detail_page (상세 페이지+첨부파일 수집, --workers/--parse-workers 적용)
+    save     save_data       (페이지 단위 10건씩 저장소 upsert)
+    migrate  migrate_folders (전체 점검: 엑셀 로드, 폴더명 교정, 엑셀 경로 갱신)
+
+각 항목은 별도 프로세스에서 임시 작업 폴더(config 경로 재지정)로 실행되며,
+초당 처리 건수와 최대 메모리 사용량(peak RSS, 준비 단계 포함)을 출력합니다.
+
+사용법:
+    python benchmarks/bench_scraper.py
+    python benchmarks/bench_scraper.py --cases detail --sizes 1000 --workers 8 --latency 0.05
+    python benchmarks/bench_scraper.py --json bench_result.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import contextlib
+from datetime import timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks import sample_pages
+
+CASES = ('list', 'detail', 'save', 'migrate')
+DEFAULT_SIZES = (1000, 10000, 50000)
+PER_PAGE = 10
+
+
+def configure(work_dir, base_url=None):
+    """
+    config 경로/URL을 벤치마크용으로 재지정합니다.
+    기본 인자로 config 값을 쓰는 모듈이 있으므로 scraper 등을 import하기 전에 호출해야 합니다.
+    """
+    import config
+
+    config.BASE_DIR = work_dir
+    config.DATA_DIR = os.path.join(work_dir, "data")
+    config.LOG_DIR = os.path.join(work_dir, "logs")
+    # 실행 보고서/미수집 목록 CSV도 작업 폴더에 (config.REPORT_DIR는 import 시 LOG_DIR로 정해짐)
+    config.REPORT_DIR = config.LOG_DIR
+    config.DOWNLOAD_DIR = os.path.join(work_dir, "downloads")
+    config.BLOB_DIR = os.path.join(config.DOWNLOAD_DIR, ".blobs")
+    config.HTTP_CACHE_DIR = os.path.join(work_dir, "cache")
+    config.STORE_PATH = os.path.join(config.DATA_DIR, "scraper.db")
+    config.EXCEL_PATH = os.path.join(config.DATA_DIR, config.EXCEL_FILENAME)
+    config.EXPORT_ALL_PATH = os.path.join(config.DATA_DIR, "press_releases_all.xlsx")
+    config.PARQUET_DIR = os.path.join(config.DATA_DIR, "parquet")
+    if base_url:
+        config.BASE_URL = base_url
+        config.LIST_URL = f"{base_url}/bbs/list.do?sCode=user&mPid=208&mId=307"
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    os.makedirs(config.DOWNLOAD_DIR, exist_ok=True)
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB), 측정 불가 시 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def _reg_date(position):
+    return (sample_pages.LATEST_DATE - timedelta(days=position // sample_pages.POSTS_PER_DAY)).strftime("%Y-%m-%d")
+
+
+def _synthetic_records(size):
+    body = " ".join(["과학기술정보통신부 보도자료 본문 문장입니다."] * 60)
+    return [
+        {
+            '번호': str(sample_pages.list_ntt_id(i)),
+            '제목': f"합성 보도자료 제목 {i}",
+            '등록일': _reg_date(i),
+            '부서': "정책과",
+            '상세URL': f"https://www.msit.go.kr/bbs/view.do?nttSeqNo={sample_pages.list_ntt_id(i)}",
+            '본문': body,
+            '핵심요약': body[:300],
+            '첨부파일목록': "첨부파일_1.hwpx",
+            '첨부파일경로': "",
+        }
+        for i in range(size)
+    ]
+
+
+# --- 측정 항목 (자식 프로세스에서 실행, 처리 건수 반환) ---
+
+def bench_list(size, args):
+    from scraper import PressReleaseScraper
+
+    scraper = PressReleaseScraper(rate=0, store_path=":memory:", use_cache=False)
+    pages = -(-size // PER_PAGE)
+
+    def run():
+        return sum(len(scraper.get_list_page(page)) for page in range(1, pages + 1))
+    return run
+
+
+def bench_detail(size, args):
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from scraper import PressReleaseScraper
+
+    scraper = PressReleaseScraper(rate=0, store_path=":memory:", use_cache=False,
+                                  workers=args.workers, parse_workers=args.parse_workers)
+    candidates = [(i, size, str(sample_pages.list_ntt_id(i)), _reg_date(i)) for i in range(size)]
+
+    def run():
+        use_threads = scraper.workers > 1 or scraper.parse_workers > 0
+        executor = ThreadPoolExecutor(max_workers=scraper.workers) if use_threads else None
+        parse_executor = ProcessPoolExecutor(max_workers=scraper.parse_workers) if scraper.parse_workers else None
+        try:
+            return sum(1 for data in scraper._fetch_details(candidates, executor, parse_executor) if data)
+        finally:
+            for pool in (executor, parse_executor):
+                if pool is not None:
+                    pool.shutdown(wait=True)
+    return run
+
+
+def bench_save(size, args):
+    import config
+    from scraper import PressReleaseScraper
+
+    scraper = PressReleaseScraper(rate=0, store_path=config.STORE_PATH, use_cache=False)
+    records = _synthetic_records(size)
+
+    def run():
+        for start in range(0, size, PER_PAGE):
+            scraper.collected_data = records[start:start + PER_PAGE]
+            scraper.save_data()
+        return size
+    return run
+
+
+def bench_migrate(size, args):
+    import config
+    import exporter
+    import migrate_folders
+
+    # 준비: 등록일이 맞는 엑셀과, 날짜 표기가 옛 형식(YYYY.MM.DD)인 첨부파일 폴더
+    records = _synthetic_records(size)
+    for record in records:
+        folder = f"{record['등록일'].replace('-', '.')}_{record['제목']}"
+        os.makedirs(os.path.join(config.DOWNLOAD_DIR, folder))
+        with open(os.path.join(config.DOWNLOAD_DIR, folder, "첨부파일_1.hwpx"), 'wb') as f:
+            f.write(b"x")
+        record['첨부파일경로'] = f'=HYPERLINK("../downloads/{folder}", "📂 폴더 열기 (첨부파일_1.hwpx)")'
+    exporter.export_records(records, os.path.join(config.DATA_DIR, "press_releases_20260101.xlsx"))
+
+    def run():
+        return len(migrate_folders.migrate_folders())
+    return run
+
+
+BENCHMARKS = {
+    'list': bench_list,
+    'detail': bench_detail,
+    'save': bench_save,
+    'migrate': bench_migrate,
+}
+
+
+def run_child(args):
+    """자식 프로세스: 한 항목을 측정하고 결과를 JSON 파일로 기록"""
+    configure(args.work_dir, args.base_url)
+    run = BENCHMARKS[args.child](args.size, args)
+
+    start = time.perf_counter()
+    # 진행 로그(tqdm.write, print)는 측정에서 제외
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        items = run()
+    elapsed = time.perf_counter() - start
+
+    result = {
+        'case': args.child,
+        'size': args.size,
+        'items': items,
+        'seconds': round(elapsed, 3),
+        'items_per_sec': round(items / elapsed, 1) if elapsed > 0 else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1) if peak_rss_mb() is not None else None,
+    }
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def run_case(case, size, args, base_url):
+    with tempfile.TemporaryDirectory(prefix=f"bench_{case}_") as work_dir:
+        result_path = os.path.join(work_dir, "result.json")
+        command = [
+            sys.executable, os.path.abspath(__file__), '--child', case, '--size', str(size),
+            '--work-dir', work_dir, '--result', result_path,
+            '--workers', str(args.workers), '--parse-workers', str(args.parse_workers),
+        ]
+        if base_url:
+            command += ['--base-url', base_url]
+        output = None if args.verbose else subprocess.DEVNULL
+        completed = subprocess.run(command, stdout=output, stderr=output)
+        if completed.returncode != 0 or not os.path.exists(result_path):
+            return {'case': case, 'size': size, 'error': f"exit {completed.returncode}"}
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 처리량 벤치마크 (로컬 대역 서버)")
+    parser.add_argument('--cases', default=",".join(CASES), help=f"측정 항목 ({', '.join(CASES)})")
+    parser.add_argument('--sizes', default=",".join(map(str, DEFAULT_SIZES)), help="레코드 수 목록")
+    parser.add_argument('--workers', type=int, default=1, help="detail: 수집 스레드 수")
+    parser.add_argument('--parse-workers', type=int, default=0, help="detail: 파싱 프로세스 수")
+    parser.add_argument('--latency', type=float, default=0.0, help="대역 서버 응답 지연 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="대역 서버 500 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="대역 서버 429 응답 비율")
+    parser.add_argument('--json', help="결과를 JSON 파일로 저장 (회귀 비교용)")
+    parser.add_argument('--verbose', action='store_true', help="자식 프로세스 출력 표시")
+    # 내부용 (자식 프로세스)
+    parser.add_argument('--child', choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return 0
+
+    from benchmarks.mock_server import MockMsitServer
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    server = None
+    if {'list', 'detail'} & set(cases):
+        server = MockMsitServer(
+            pages=max(sizes) // PER_PAGE + 1, per_page=PER_PAGE, latency=args.latency,
+            error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        ).start()
+        print(f"대역 서버: {server.base_url}")
+
+    results = []
+    print(f"{'항목':8s} {'건수':>7s} {'시간(s)':>9s} {'건/초':>10s} {'peak RSS(MB)':>13s}")
+    try:
+        for case in cases:
+            for size in sizes:
+                result = run_case(case, size, args, server.base_url if server else None)
+                results.append(result)
+                if 'error' in result:
+                    print(f"{case:8s} {size:>7d}  실패 ({result['error']})")
+                    continue
+                rss = f"{result['peak_rss_mb']:.1f}" if result['peak_rss_mb'] is not None else "-"
+                print(f"{case:8s} {size:>7d} {result['seconds']:>9.2f} "
+                      f"{result['items_per_sec']:>10.1f} {rss:>13s}")
+    finally:
+        if server is not None:
+            server.stop()
+            print(f"대역 서버 요청 통계: {dict(server.stats)}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+수집 엔진 비교 (로컬 대역 서버 사용, 실제 사이트에 요청하지 않음)
+
+같은 대역 서버(녹화본이 있으면 녹화본)에 대해 스레드 엔진과 비동기 엔진(--engine async)으로
+각각 전체 수집을 실행하고, 저장된 레코드(저장 순서 포함)와 첨부파일 내용이 같은지 확인합니다.
+소요 시간과 최대 메모리 사용량(peak RSS)도 함께 출력합니다.
+
+각 엔진은 별도 프로세스에서 임시 작업 폴더(config 경로 재지정)로 실행됩니다.
+
+사용법:
+    python benchmarks/compare_engines.py
+    python benchmarks/compare_engines.py --posts 2000 --latency 0.05 --workers 8 --concurrency 200
+    python benchmarks/compare_engines.py --error-rate 0.02 --throttle-rate 0.02
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.bench_scraper import configure, peak_rss_mb, PER_PAGE
+
+ENGINES = ('threads', 'async')
+
+
+def run_child(args):
+    """자식 프로세스: 한 엔진으로 전체 수집 후 레코드와 첨부파일 해시를 JSON 파일로 기록"""
+    configure(args.work_dir, args.base_url)
+    import config
+    import utils
+    from scraper import PressReleaseScraper
+
+    scraper = PressReleaseScraper(year=2000, rate=args.rps, adaptive_rate=False, use_cache=False,
+                                  workers=args.workers, metrics_enabled=False)
+    start = time.perf_counter()
+    # 진행 로그(tqdm.write, print)는 측정에서 제외
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        scraper.run(engine=args.child, concurrency=args.concurrency)
+    elapsed = time.perf_counter() - start
+
+    attachments = {}
+    for dirpath, dirnames, filenames in os.walk(config.DOWNLOAD_DIR):
+        dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            attachments[os.path.relpath(path, config.DOWNLOAD_DIR)] = utils.file_sha256(path)
+
+    result = {
+        'engine': args.child,
+        'seconds': round(elapsed, 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1) if peak_rss_mb() is not None else None,
+        'records': list(scraper.store.iter_records()),
+        'attachments': attachments,
+        'pending_failures': sum(scraper.store.count_failures().values()),
+    }
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+def run_engine(engine, args, base_url):
+    with tempfile.TemporaryDirectory(prefix=f"engine_{engine}_") as work_dir:
+        result_path = os.path.join(work_dir, "result.json")
+        command = [
+            sys.executable, os.path.abspath(__file__), '--child', engine,
+            '--work-dir', work_dir, '--result', result_path, '--base-url', base_url,
+            '--workers', str(args.workers), '--concurrency', str(args.concurrency), '--rps', str(args.rps),
+        ]
+        output = None if args.verbose else subprocess.DEVNULL
+        completed = subprocess.run(command, stdout=output, stderr=output)
+        if completed.returncode != 0 or not os.path.exists(result_path):
+            return {'engine': engine, 'error': f"exit {completed.returncode}"}
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def compare(expected, actual):
+    """두 엔진 결과의 차이 목록 (같으면 빈 목록)"""
+    problems = []
+    expected_ids = [record['번호'] for record in expected['records']]
+    actual_ids = [record['번호'] for record in actual['records']]
+    if expected_ids != actual_ids:
+        missing = set(expected_ids) - set(actual_ids)
+        extra = set(actual_ids) - set(expected_ids)
+        problems.append(f"레코드 번호/순서 불일치 (누락 {len(missing)}건, 추가 {len(extra)}건)")
+    for left, right in zip(expected['records'], actual['records']):
+        for column, value in left.items():
+            if right.get(column) != value:
+                problems.append(f"{left['번호']} {column} 불일치")
+    if expected['attachments'] != actual['attachments']:
+        problems.append(f"첨부파일 불일치 ({len(expected['attachments'])}개 / {len(actual['attachments'])}개)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 엔진 비교 (스레드 / 비동기, 로컬 대역 서버)")
+    parser.add_argument('--posts', type=int, default=300, help="게시글 수 (목록 페이지당 10건)")
+    parser.add_argument('--attachments', type=int, default=2, help="게시글당 첨부파일 수")
+    parser.add_argument('--attachment-size', type=int, default=64 * 1024, help="첨부파일 크기 (바이트)")
+    parser.add_argument('--workers', type=int, default=8, help="스레드 엔진 워커 수")
+    parser.add_argument('--concurrency', type=int, default=100, help="비동기 엔진 동시 요청 수")
+    parser.add_argument('--rps', type=float, default=0, help="초당 요청 수 (0이면 제한 없음)")
+    parser.add_argument('--latency', type=float, default=0.02, help="대역 서버 응답 지연 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="대역 서버 500 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="대역 서버 429 응답 비율")
+    parser.add_argument('--verbose', action='store_true', help="자식 프로세스 출력 표시")
+    # 내부용 (자식 프로세스)
+    parser.add_argument('--child', choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return 0
+
+    from benchmarks.mock_server import MockMsitServer
+
+    server = MockMsitServer(
+        pages=-(-args.posts // PER_PAGE), per_page=PER_PAGE, attachments=args.attachments,
+        attachment_size=args.attachment_size, latency=args.latency,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=0,
+    ).start()
+    print(f"대역 서버: {server.base_url}")
+
+    results = {}
+    print(f"{'엔진':8s} {'레코드':>7s} {'첨부파일':>8s} {'실패':>5s} {'시간(s)':>9s} {'peak RSS(MB)':>13s}")
+    try:
+        for engine in ENGINES:
+            result = run_engine(engine, args, server.base_url)
+            results[engine] = result
+            if 'error' in result:
+                print(f"{engine:8s}  실패 ({result['error']})")
+                continue
+            rss = f"{result['peak_rss_mb']:.1f}" if result['peak_rss_mb'] is not None else "-"
+            print(f"{engine:8s} {len(result['records']):>7d} {len(result['attachments']):>8d} "
+                  f"{result['pending_failures']:>5d} {result['seconds']:>9.2f} {rss:>13s}")
+    finally:
+        server.stop()
+        print(f"대역 서버 요청 통계: {dict(server.stats)}")
+
+    if any('error' in result for result in results.values()):
+        return 1
+    problems = compare(results['threads'], results['async'])
+    if problems:
+        print(f"결과 불일치 {len(problems)}건:")
+        for problem in problems[:20]:
+            print(f"  - {problem}")
+        return 1
+    print("두 엔진의 레코드와 첨부파일이 같습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+과기정통부 사이트 대역 로컬 HTTP 서버 (벤치마크/부하 테스트용)
+
+/bbs/list.do, /bbs/view.do, /ssm/file/fileDown.do를 제공합니다.
+benchmarks/fixtures/에 녹화된 응답(record_fixtures.py)이 있으면 그것을, 없으면 합성 페이지를 응답합니다.
+지연 시간, 오류(500) 비율, 429(Retry-After) 비율을 설정할 수 있습니다.
+
+사용법:
+    python benchmarks/mock_server.py --port 8800 --latency 0.05 --error-rate 0.01 --throttle-rate 0.02
+    (스크래퍼는 config.BASE_URL / config.LIST_URL을 http://127.0.0.1:8800 으로 바꿔 실행)
+"""
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from urllib.parse import urlparse, parse_qs, quote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import sample_pages
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+LIST_PATH = "/bbs/list.do"
+LIST_QUERY = "sCode=user&mPid=208&mId=307"
+DEFAULT_MID = 307
+
+
+class MockMsitServer:
+    """
+    스레드에서 실행되는 대역 서버.
+
+    - pages: 합성 목록 페이지 수 (이후 페이지는 게시글 없음)
+    - attachments / attachment_size: 합성 상세 페이지의 첨부파일 수와 크기(바이트)
+    - latency / jitter: 응답 전 대기 시간 (latency + 0~jitter초)
+    - error_rate: 500 응답 비율, throttle_rate: 429 응답 비율 (Retry-After: retry_after초)
+    - 게시판(mId)마다 다른 합성 페이지를 응답 (녹화본은 보도자료 게시판(mId=307)에만 사용)
+    - allow_head: False면 HEAD 요청에 405 응답 (HEAD를 거부하는 서버 흉내)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, fixtures_dir=FIXTURES_DIR, pages=100, per_page=10,
+                 attachments=1, attachment_size=16 * 1024, latency=0.0, jitter=0.0,
+                 error_rate=0.0, throttle_rate=0.0, retry_after=1, seed=0, allow_head=True):
+        self.fixtures_dir = fixtures_dir
+        self.pages = pages
+        self.per_page = per_page
+        self.attachments = attachments
+        self.attachment_size = attachment_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.allow_head = allow_head
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더/본문을 나눠 쓸 때 Nagle + delayed ACK로 요청마다 ~40ms 지연되는 것 방지
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self)
+
+            def do_HEAD(self):
+                server._count('HEAD')
+                if not server.allow_head:
+                    return server._send(self, 405, b"Method Not Allowed")
+                server._handle(self)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def list_url(self):
+        return f"{self.base_url}{LIST_PATH}?{LIST_QUERY}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- 응답 생성 ---
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _roll(self):
+        with self._rng_lock:
+            return self._rng.random(), self._rng.random()
+
+    def _fixture(self, *parts):
+        path = os.path.join(self.fixtures_dir, *parts)
+        if self.fixtures_dir and os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+        return None
+
+    def _handle(self, handler):
+        url = urlparse(handler.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        delay_roll, fault_roll = self._roll()
+        delay = self.latency + self.jitter * delay_roll
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault_roll < self.throttle_rate:
+            self._count(429)
+            return self._send(handler, 429, b"Too Many Requests", {"Retry-After": str(self.retry_after)})
+        if fault_roll < self.throttle_rate + self.error_rate:
+            self._count(500)
+            return self._send(handler, 500, b"Internal Server Error")
+
+        try:
+            board_seed = int(query.get('mId', DEFAULT_MID)) - DEFAULT_MID
+            if url.path == LIST_PATH:
+                body = self._list_body(int(query.get('pageIndex', 1)), board_seed)
+                self._count('list')
+                return self._send_html(handler, body)
+            if url.path == "/bbs/view.do":
+                body = self._detail_body(int(query['nttSeqNo']), board_seed)
+                self._count('view')
+                return self._send_html(handler, body)
+            if url.path == "/ssm/file/fileDown.do":
+                self._count('file')
+                return self._send_file(handler, query['atchFileNo'], query['fileOrd'])
+        except (KeyError, ValueError):
+            self._count(400)
+            return self._send(handler, 400, b"Bad Request")
+
+        self._count(404)
+        return self._send(handler, 404, b"Not Found")
+
+    def _list_body(self, page, board_seed=0):
+        body = self._fixture("list", f"{page}.html") if board_seed == 0 else None
+        if body is not None:
+            return body
+        per_page = self.per_page if page <= self.pages else 0
+        return sample_pages.list_page(page, seed=board_seed, per_page=per_page).encode('utf-8')
+
+    def _detail_body(self, ntt_id, board_seed=0):
+        body = self._fixture("view", f"{ntt_id}.html") if board_seed == 0 else None
+        if body is not None:
+            return body
+        return sample_pages.detail_page(ntt_id, seed=board_seed, attachments=self.attachments).encode('utf-8')
+
+    def _attachment(self, atch_no, file_ord):
+        """(Content-Disposition, 본문) - 녹화본이 없으면 번호로 결정되는 합성 데이터"""
+        body = self._fixture("file", f"{atch_no}_{file_ord}.bin")
+        if body is not None:
+            meta = self._fixture("file", f"{atch_no}_{file_ord}.json")
+            disposition = json.loads(meta).get('Content-Disposition') if meta else None
+            return disposition or f"attachment; filename=\"{atch_no}_{file_ord}.bin\"", body
+
+        seed = hashlib.sha256(f"{atch_no}:{file_ord}".encode()).digest()
+        body = (seed * (self.attachment_size // len(seed) + 1))[:self.attachment_size]
+        return f"attachment; filename*=UTF-8''{quote(f'첨부파일_{file_ord}.hwpx')}", body
+
+    def _send_html(self, handler, body):
+        self._send(handler, 200, body, {"Content-Type": "text/html;charset=UTF-8"})
+
+    def _send_file(self, handler, atch_no, file_ord):
+        disposition, body = self._attachment(atch_no, file_ord)
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Disposition": disposition,
+            "Accept-Ranges": "bytes",
+            "ETag": f'"{hashlib.sha256(body).hexdigest()[:16]}"',
+        }
+
+        # 이어받기(Range: bytes=N-), 일부 구간(Range: bytes=N-M) 지원
+        range_header = handler.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            first, _, last = range_header[len("bytes="):].partition("-")
+            start = int(first)
+            end = min(int(last), len(body) - 1) if last else len(body) - 1
+            if start >= len(body):
+                headers["Content-Range"] = f"bytes */{len(body)}"
+                return self._send(handler, 416, b"", headers)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            return self._send(handler, 206, body[start:end + 1], headers)
+
+        self._send(handler, 200, body, headers)
+
+    @staticmethod
+    def _send(handler, status, body, headers=None):
+        handler.send_response(status)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과기정통부 보도자료 사이트 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="녹화된 응답 경로")
+    parser.add_argument("--pages", type=int, default=100, help="합성 목록 페이지 수")
+    parser.add_argument("--attachments", type=int, default=1, help="합성 상세 페이지당 첨부파일 수")
+    parser.add_argument("--attachment-size", type=int, default=16 * 1024, help="합성 첨부파일 크기 (바이트)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 상한 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    args = parser.parse_args()
+
+    server = MockMsitServer(
+        host=args.host, port=args.port, fixtures_dir=args.fixtures, pages=args.pages,
+        attachments=args.attachments, attachment_size=args.attachment_size,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+    )
+    print(f"대역 서버 실행 중: {server.base_url} (목록: {server.list_url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 통계: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
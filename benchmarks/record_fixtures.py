@@ -0,0 +1,112 @@
+"""
+벤치마크용 응답 녹화
+
+실제 사이트(또는 HTTP 캐시)의 목록/상세/첨부파일 응답을 benchmarks/fixtures/에 저장합니다.
+mock_server.py는 녹화본이 있으면 합성 페이지 대신 녹화본을 응답합니다.
+
+    fixtures/list/<pageIndex>.html
+    fixtures/view/<nttSeqNo>.html
+    fixtures/file/<atchFileNo>_<fileOrd>.bin (+ .json: 응답 헤더)
+
+사용법:
+    python benchmarks/record_fixtures.py --pages 3              # 사이트에서 녹화 (속도 제한 적용)
+    python benchmarks/record_fixtures.py --from-cache           # cache/의 목록/상세 페이지를 복사
+"""
+import os
+import sys
+import glob
+import json
+import argparse
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+import parsers
+from benchmarks.mock_server import FIXTURES_DIR
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def record_from_cache(cache_dir, fixtures_dir):
+    """HTTP 캐시의 목록/상세 본문을 녹화본으로 복사 (첨부파일은 캐시에 본문이 없어 제외)"""
+    count = 0
+    for meta_path in glob.glob(os.path.join(cache_dir, '*', '*.json')):
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if not meta.get('has_body'):
+                continue
+            with open(meta_path[:-len('.json')] + '.body', 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            continue
+
+        url = urlparse(meta.get('url', ''))
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == '/bbs/list.do':
+            _write(os.path.join(fixtures_dir, 'list', f"{query.get('pageIndex', 1)}.html"), body)
+        elif url.path == '/bbs/view.do' and 'nttSeqNo' in query:
+            _write(os.path.join(fixtures_dir, 'view', f"{query['nttSeqNo']}.html"), body)
+        else:
+            continue
+        count += 1
+    return count
+
+
+def record_from_site(pages, fixtures_dir, max_attachment_bytes, rate):
+    """사이트에서 목록 pages개와 그 상세 페이지, 첨부파일을 녹화"""
+    from scraper import PressReleaseScraper
+
+    scraper = PressReleaseScraper(rate=rate, store_path=":memory:", use_cache=False, adaptive_rate=False)
+    count = 0
+    for page in range(1, pages + 1):
+        response = scraper._get(scraper.board.list_url(page))
+        response.raise_for_status()
+        _write(os.path.join(fixtures_dir, 'list', f"{page}.html"), response.content)
+        count += 1
+
+        for ntt_id, _ in parsers.parse_list_page(response.text):
+            url, content, encoding = scraper.fetch_detail(ntt_id)
+            _write(os.path.join(fixtures_dir, 'view', f"{ntt_id}.html"), content)
+            count += 1
+
+            parsed = parsers.parse_detail_page(parsers.decode_html(content, encoding), ntt_id)
+            for atch_no, file_ord, _ in dict.fromkeys(parsed['downloads']):
+                file_response = scraper._get(scraper._attachment_url(atch_no, file_ord), stream=True)
+                size = int(file_response.headers.get('Content-Length') or 0)
+                if size > max_attachment_bytes:
+                    file_response.close()
+                    continue
+                headers = {'Content-Disposition': file_response.headers.get('Content-Disposition', '')}
+                base = os.path.join(fixtures_dir, 'file', f"{atch_no}_{file_ord}")
+                _write(base + '.bin', file_response.content)
+                _write(base + '.json', json.dumps(headers, ensure_ascii=False).encode('utf-8'))
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 응답 녹화")
+    parser.add_argument('--out', default=FIXTURES_DIR, help="녹화본 저장 경로")
+    parser.add_argument('--from-cache', action='store_true', help="네트워크 대신 HTTP 캐시에서 복사")
+    parser.add_argument('--cache-dir', default=config.HTTP_CACHE_DIR)
+    parser.add_argument('--pages', type=int, default=3, help="녹화할 목록 페이지 수")
+    parser.add_argument('--max-attachment-bytes', type=int, default=2 * 1024 * 1024,
+                        help="이보다 큰 첨부파일은 녹화하지 않음")
+    parser.add_argument('--rps', type=float, default=1.0, help="녹화 시 초당 요청 수")
+    args = parser.parse_args()
+
+    if args.from_cache:
+        count = record_from_cache(args.cache_dir, args.out)
+    else:
+        count = record_from_site(args.pages, args.out, args.max_attachment_bytes, args.rps)
+    print(f"녹화 완료: {count}개 응답 -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+벤치마크용 합성 페이지 생성기
+
+과기정통부 보도자료 목록/상세 페이지와 같은 구조(공통 헤더/메뉴, .board_list,
+날짜 할당 스크립트, .view_head, .tit_con, .board_notcon, fn_download 링크)의 HTML을 만듭니다.
+"""
+import random
+from datetime import datetime, timedelta
+
+# 합성 목록의 가장 최근 등록일 (하루 3건씩 과거로 내려감, 목록은 최신순)
+LATEST_DATE = datetime(2026, 10, 1)
+POSTS_PER_DAY = 3
+FIRST_NTT_ID = 3_200_000
+
+_MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+_WORDS = [
+    "과학기술정보통신부", "인공지능", "디지털", "혁신", "연구개발", "지원", "사업", "추진",
+    "반도체", "양자", "네트워크", "보안", "데이터", "플랫폼", "산업", "생태계", "글로벌", "협력",
+]
+
+
+def _sentence(rng, words=12):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)) + "."
+
+
+def _page_frame(title, body):
+    """공통 레이아웃 (헤더, 메뉴, 푸터, 스크립트)"""
+    menu = "".join(
+        f'<li class="depth1"><a href="/menu/{i}.do" title="메뉴 {i}">메뉴 {i}</a>'
+        f'<ul>{"".join(f"<li><a href=/menu/{i}/{j}.do>하위 메뉴 {j}</a></li>" for j in range(8))}</ul></li>'
+        for i in range(12)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>{title} | 과학기술정보통신부</title>
+<link rel="stylesheet" href="/css/common.css">
+<script src="/js/jquery.min.js"></script>
+<script>
+    function fn_detail(nttSeqNo) {{ document.frm.nttSeqNo.value = nttSeqNo; document.frm.submit(); }}
+    function fn_download(atchFileNo, fileOrd, ext) {{ location.href = '/ssm/file/fileDown.do?atchFileNo=' + atchFileNo; }}
+</script>
+<style>.board_list .toggle {{ display: block; }}</style>
+</head>
+<body>
+<!-- 상단 메뉴 -->
+<div id="header"><ul class="gnb">{menu}</ul></div>
+<div id="container"><div class="contents">
+{body}
+</div></div>
+<div id="footer"><p>(30121) 세종특별자치시 가름로 194 정부세종청사 과학기술정보통신부</p></div>
+</body>
+</html>"""
+
+
+def list_page(page, seed=0, per_page=10, with_script=True):
+    """목록 페이지 HTML (per_page=0이면 게시글이 없는 마지막 페이지)"""
+    rng = random.Random(seed * 100003 + page)
+
+    items = []
+    script_lines = []
+    for idx in range(per_page):
+        position = (page - 1) * per_page + idx
+        ntt_id = list_ntt_id(position)
+        reg_date = LATEST_DATE - timedelta(days=position // POSTS_PER_DAY)
+        year, month, day = reg_date.year, reg_date.month, reg_date.day
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9)))
+        # 스크립트 날짜가 없는 항목은 HTML의 .date로 대체되는지 확인용
+        html_date = f"{year}-{month:02d}-{day:02d}"
+        items.append(f"""
+        <div class="toggle">
+            <a href="#" onclick="fn_detail({ntt_id}); return false;" title="{title}">
+                <p class="title">{title}</p>
+            </a>
+            <div class="info">
+                <div class="date"><span class="blind">등록일</span> {html_date}</div>
+                <div class="dept">담당부서 {rng.choice(_WORDS)}과</div>
+                <div class="hit">조회 {rng.randint(10, 9999)}</div>
+            </div>
+        </div>""")
+        if with_script and idx % 7 != 6:
+            script_lines.append(
+                f"$('#td_'+'REG_DT'+'_{idx}').html('{_MONTH_NAMES[month - 1]} {day}, {year}');"
+            )
+
+    body = f"""
+<div class="board_list">
+    {"".join(items)}
+</div>
+<div class="paging"><a href="#" onclick="fn_link_page({page + 1})">다음</a></div>
+<script type="text/javascript">
+$(document).ready(function() {{
+    {chr(10).join(script_lines)}
+}});
+</script>"""
+    return _page_frame("보도자료", body)
+
+
+def list_ntt_id(position):
+    """목록 전체에서 position번째(0부터) 게시글 번호"""
+    return FIRST_NTT_ID - position
+
+
+def detail_page(ntt_id, seed=0, paragraphs=20, attachments=3):
+    """상세 페이지 HTML"""
+    rng = random.Random(seed * 100003 + ntt_id)
+    title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 12)))
+
+    content = "".join(
+        f"<p>&nbsp;○ {_sentence(rng, rng.randint(8, 30))} <span style='color:#333'>{_sentence(rng)}</span><br>"
+        f"{_sentence(rng)}</p>\n"
+        for _ in range(paragraphs)
+    )
+    content += "<!-- 편집기 주석 --><table><tr><td>구분</td><td>내용 &amp; 비고</td></tr></table>"
+
+    files = "".join(
+        f"""<li><a href="#" onclick="fn_download('{ntt_id}0', '{i + 1}', 'hwpx'); return false;">
+            첨부파일_{i + 1}.hwpx</a>
+            <a href="#" onclick="fn_viewer('{ntt_id}0', '{i + 1}')">바로보기</a></li>"""
+        for i in range(attachments)
+    )
+
+    body = f"""
+<div class="board_view">
+    <div class="view_head">
+        <h2>
+            {title}
+        </h2>
+        <dl class="tit_con">
+            <dt>작성자</dt><dd>대변인실</dd>
+            <dt>담당부서</dt><dd> {rng.choice(_WORDS)}정책과 </dd>
+            <dt>등록일</dt><dd>2026-01-{rng.randint(1, 28):02d}</dd>
+        </dl>
+    </div>
+    <div class="view_file"><ul>{files}</ul></div>
+    <div class="board_notcon">
+        {content}
+        <script>var pageTracker = 'view';</script>
+    </div>
+</div>"""
+    return _page_frame(title, body)
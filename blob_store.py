@@ -0,0 +1,96 @@
+import os
+import shutil
+import logging
+
+import config
+import utils
+
+logger = logging.getLogger(__name__)
+
+
+def blob_path(sha256, blob_dir=config.BLOB_DIR):
+    """해시에 해당하는 blob 경로 (downloads/.blobs/ab/abcdef...)"""
+    return os.path.join(blob_dir, sha256[:2], sha256)
+
+
+def link_or_copy(src, dst):
+    """
+    src를 dst에 하드링크합니다. 파일 시스템이 지원하지 않으면 복사합니다.
+    dst가 이미 있으면 임시 이름으로 만든 뒤 교체하므로 중간 상태가 남지 않습니다.
+    """
+    tmp_path = dst + ".link"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def store_file(src_path, dest_path, blob_dir=config.BLOB_DIR):
+    """
+    src_path(다운로드가 끝난 임시 파일)를 내용 해시 기준 blob으로 저장하고,
+    dest_path에는 blob의 하드링크를 만듭니다. 같은 내용의 blob이 이미 있으면 src는 삭제됩니다.
+
+    Returns:
+        str: 파일의 SHA-256
+    """
+    sha256 = utils.file_sha256(src_path)
+    target = blob_path(sha256, blob_dir)
+
+    if os.path.exists(target):
+        os.remove(src_path)
+    else:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(src_path, target)
+
+    link_or_copy(target, dest_path)
+    return sha256
+
+
+def restore_file(sha256, dest_path, blob_dir=config.BLOB_DIR):
+    """blob이 있으면 dest_path에 다시 연결하고 True 반환 (네트워크 없이 복구)"""
+    target = blob_path(sha256, blob_dir)
+    if not sha256 or not os.path.exists(target):
+        return False
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    link_or_copy(target, dest_path)
+    return True
+
+
+def dedupe_downloads(download_dir=config.DOWNLOAD_DIR, blob_dir=config.BLOB_DIR):
+    """
+    기존 다운로드 폴더의 파일을 blob 저장소로 옮기고 하드링크로 교체합니다.
+    같은 내용의 파일은 하나의 blob을 공유하게 되며, 경로는 그대로이므로 엑셀 하이퍼링크는 유지됩니다.
+
+    Returns:
+        int: 중복 제거로 절약된 바이트 수
+    """
+    saved = 0
+    for root, dirs, files in os.walk(download_dir):
+        # blob 저장소와 숨김 폴더는 제외
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for filename in files:
+            if filename.endswith(('.part', '.link')):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                sha256 = utils.file_sha256(path)
+                target = blob_path(sha256, blob_dir)
+                if not os.path.exists(target):
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    link_or_copy(path, target)
+                elif not os.path.samefile(path, target):
+                    saved += os.path.getsize(path)
+                    link_or_copy(target, path)
+            except OSError as e:
+                logger.error(f"중복 제거 실패 ({path}): {e}")
+
+    logger.info(f"첨부파일 중복 제거 완료: {saved / (1024 * 1024):.1f} MB 절약")
+    return saved
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    dedupe_downloads()
@@ -0,0 +1,76 @@
+import os
+from urllib.parse import urlencode
+
+import config
+
+
+class Board:
+    """
+    수집 대상 게시판 정의 (config.BOARDS 항목)
+
+    URL과 저장 경로는 호출 시점의 config 값으로 만들므로 config를 나중에 바꿔도(벤치마크 등) 반영됩니다.
+    기본 게시판(config.DEFAULT_BOARD)은 기존 저장소/엑셀 경로를 그대로 사용하고,
+    그 외 게시판은 data/scraper_<키>.db 저장소와 <file_prefix>_YYYYMMDD.xlsx 엑셀
+    (Parquet 출력 시 data/parquet_<키>/)을 따로 사용합니다.
+    """
+
+    def __init__(self, key, name, list_params, detail_params, selectors=None, file_prefix=None):
+        self.key = key
+        self.name = name
+        self.list_params = dict(list_params)
+        self.detail_params = dict(detail_params)
+        self.selectors = dict(selectors or {})
+        self.file_prefix = file_prefix or key
+
+    @property
+    def is_default(self):
+        return self.key == config.DEFAULT_BOARD
+
+    def list_url(self, page):
+        return f"{config.BASE_URL}/bbs/list.do?{urlencode(self.list_params)}&pageIndex={page}"
+
+    def detail_url(self, ntt_id):
+        return f"{config.BASE_URL}/bbs/view.do?{urlencode(self.detail_params)}&nttSeqNo={ntt_id}"
+
+    def store_path(self):
+        if self.is_default:
+            return config.STORE_PATH
+        return os.path.join(config.DATA_DIR, f"scraper_{self.key}.db")
+
+    def excel_path(self):
+        if self.is_default:
+            return config.EXCEL_PATH
+        return os.path.join(config.DATA_DIR, f"{self.file_prefix}_{config.TODAY_STR}.xlsx")
+
+    def parquet_dir(self):
+        if self.is_default:
+            return config.PARQUET_DIR
+        return os.path.join(config.DATA_DIR, f"parquet_{self.key}")
+
+    def owns_file(self, name):
+        """
+        data 폴더의 엑셀 파일이 이 게시판 것인지 (저장소 인덱스 반영 대상 판단)
+        기본 게시판은 다른 게시판 접두사가 붙지 않은 파일 전체(이전 버전 파일, 직접 넣은 파일 포함)를 가집니다.
+        """
+        if not self.is_default:
+            return name.startswith(f"{self.file_prefix}_")
+        return not any(
+            name.startswith(f"{board.file_prefix}_")
+            for board in load_boards() if not board.is_default
+        )
+
+    def __repr__(self):
+        return f"Board({self.key!r}, {self.name!r})"
+
+
+def get_board(key=None):
+    """config.BOARDS의 게시판 정의 (key가 없으면 기본 게시판)"""
+    key = key or config.DEFAULT_BOARD
+    if key not in config.BOARDS:
+        raise KeyError(f"알 수 없는 게시판: {key} (config.BOARDS: {', '.join(config.BOARDS)})")
+    return Board(key, **config.BOARDS[key])
+
+
+def load_boards(keys=None):
+    """게시판 정의 목록 (keys가 없으면 config.BOARDS 전체)"""
+    return [get_board(key) for key in (keys or list(config.BOARDS))]
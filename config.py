@@ -6,11 +6,35 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 DOWNLOAD_DIR = os.path.join(BASE_DIR, "downloads")
+# 첨부파일 원본 저장소 (내용 해시 기준, 게시글 폴더에는 하드링크로 연결)
+BLOB_DIR = os.path.join(DOWNLOAD_DIR, ".blobs")
 
 # URL 설정
 BASE_URL = "https://www.msit.go.kr"
 LIST_URL = f"{BASE_URL}/bbs/list.do?sCode=user&mPid=208&mId=307"
 
+# 수집 대상 게시판 (--boards로 선택, 여러 개면 함께 수집)
+#   list_params / detail_params: 목록(list.do) / 상세(view.do) URL 쿼리 (pageIndex, nttSeqNo는 자동 추가)
+#   selectors: 구조가 다른 게시판용 XPath 선택자 (list_links, title, content / 없으면 기본 구조)
+#   file_prefix: 엑셀 파일명 접두사, 기본 게시판 외에는 저장소도 data/scraper_<키>.db로 분리
+# 다른 게시판은 사이트 메뉴의 목록/상세 URL에서 mPid, mId, bbsSeqNo를 확인해 추가합니다. 예:
+#   'notice': {
+#       'name': '공지사항',
+#       'list_params': {'sCode': 'user', 'mPid': '...', 'mId': '...'},
+#       'detail_params': {'sCode': 'user', 'mPid': '...', 'mId': '...', 'bbsSeqNo': '...'},
+#       'file_prefix': 'notices',
+#   },
+BOARDS = {
+    'press': {
+        'name': '보도자료',
+        'list_params': {'sCode': 'user', 'mPid': '208', 'mId': '307'},
+        'detail_params': {'sCode': 'user', 'mPid': '208', 'mId': '307', 'bbsSeqNo': '94'},
+        'selectors': {},
+        'file_prefix': 'press_releases',
+    },
+}
+DEFAULT_BOARD = 'press'
+
 # 크롤링 설정
 TARGET_YEAR = 2024
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -23,8 +47,78 @@ HEADERS = {
 MAX_RETRIES = 5
 BACKOFF_FACTOR = 1
 TIMEOUT = 60
+# 기간 지정 시 목록 페이지 탐색(--from/--to)에서 페이지를 받지 못하면 다시 시도하는 횟수
+# (그래도 실패하면 구간을 잘못 잡지 않도록 수집을 중단)
+LOCATE_ATTEMPTS = 3
+
+# 첨부파일 다운로드 청크 크기 (바이트)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# 동시 수집 / 부하 조절 설정
+MAX_WORKERS = 1             # 상세 페이지 동시 수집 워커 수 (1이면 순차 수집)
+REQUESTS_PER_SECOND = 2.0   # 전체 요청(목록/상세/첨부파일) 속도, 초당 요청 수 (적응형 제어 시 시작 속도)
+PARSE_WORKERS = 0           # 상세 페이지 파싱/요약 프로세스 수 (0이면 수집 스레드에서 파싱)
+PARSE_QUEUE_SIZE = 32       # 파이프라인에서 동시에 진행 중인 상세 페이지 수 상한 (backpressure)
+
+# 수집 엔진: "threads" (requests + 스레드 풀) 또는 "async" (asyncio + aiohttp, pip install aiohttp 필요)
+CRAWL_ENGINE = "threads"
+ASYNC_CONCURRENCY = 100     # 비동기 엔진에서 동시에 진행 중인 HTTP 요청 수 상한 (세마포어)
+ASYNC_PENDING_DETAILS = 500 # 목록을 앞서 읽어 대기시킬 상세 수집 작업 수 상한 (메모리 제한)
+
+# 적응형 속도 제어 (AIMD): REQUESTS_PER_SECOND에서 시작해 서버가 정상이면 천천히 올리고,
+# 429/503/5xx, 응답 지연, Retry-After가 오면 모든 워커가 함께 속도를 낮춤
+ADAPTIVE_RATE = True
+MIN_REQUESTS_PER_SECOND = 0.2
+MAX_REQUESTS_PER_SECOND = 5.0
+RATE_INCREASE = 0.2         # 정상 응답 시 초당 증가량 (초당 요청 수 / 초)
+RATE_DECREASE = 0.5         # 과부하 신호 시 속도 배율
+LATENCY_TARGET = 2.0        # 응답 시간이 이보다 길면 과부하로 간주 (초)
+MAX_RETRY_AFTER = 120       # Retry-After 최대 반영 시간 (초)
 
 # 파일 저장 설정
 TODAY_STR = datetime.now().strftime("%Y%m%d")
 EXCEL_FILENAME = f"press_releases_{TODAY_STR}.xlsx"
 EXCEL_PATH = os.path.join(DATA_DIR, EXCEL_FILENAME)
+
+# HTML 파서 ('lxml' 또는 기존 BeautifulSoup 구현 'html.parser')
+HTML_PARSER = "lxml"
+
+# HTTP 응답 캐시 (목록/상세 HTML 본문, 첨부파일 응답 헤더, --cache로 사용)
+# 용량 제한/만료가 없어 전체 백필이면 페이지마다 파일이 쌓이므로 기본값은 사용 안 함
+# (필요 없어지면 HTTP_CACHE_DIR 폴더를 통째로 삭제)
+HTTP_CACHE_DIR = os.path.join(BASE_DIR, "cache")
+HTTP_CACHE_ENABLED = False
+
+# 수집 상태 저장소 (중복 제거 인덱스 등)
+STORE_PATH = os.path.join(DATA_DIR, "scraper.db")
+EXPORT_ALL_PATH = os.path.join(DATA_DIR, "press_releases_all.xlsx")
+
+# Parquet 출력(--parquet, pyarrow 필요): 엑셀과 함께 등록일 연/월 파티션으로 기록
+# (PARQUET_DIR/year=YYYY/month=M/*.parquet, 다른 게시판은 data/parquet_<키>/)
+PARQUET_ENABLED = False
+PARQUET_DIR = os.path.join(DATA_DIR, "parquet")
+# 저장소/작업 큐 SQLite 저널 모드: 여러 호스트가 네트워크 파일시스템의 파일을 공유하면 "DELETE"
+# (WAL은 같은 호스트의 프로세스끼리만 공유 가능)
+STORE_JOURNAL_MODE = "WAL"
+STORE_BUSY_TIMEOUT = 30         # 다른 프로세스가 쓰는 중일 때 대기할 최대 시간 (초)
+
+# 증분 동기화(--sync) 설정: 이미 수집된 게시글이 연속으로 이만큼 나오면 종료
+SYNC_KNOWN_STREAK = 10
+
+# 실패 항목 재시도(--retry-failed): 시도 횟수가 이 값에 도달한 항목은 더 이상 재시도하지 않음
+FAILURE_MAX_ATTEMPTS = 5
+
+# 분산 수집(--coordinator/--worker) 작업 큐
+SHARD_PAGES = 5                 # 목록 페이지 작업 하나에 포함할 페이지 수
+LEASE_SECONDS = 120             # 작업 임대 시간 (하트비트로 연장, 만료되면 다른 워커가 가져감)
+HEARTBEAT_INTERVAL = 15         # 워커 하트비트 간격 (초), 이 주기로 전역 요청 속도 몫도 다시 계산
+SHARD_MAX_ATTEMPTS = 3          # 작업당 최대 시도 횟수
+WORKER_POLL_SECONDS = 1.0       # 처리할 작업이 없을 때 다시 확인하는 간격 (초)
+
+# 실행 계측: 단계별 카운터/지연 시간을 모아 실행 종료 시 JSON 보고서로 기록
+METRICS_ENABLED = True
+REPORT_DIR = LOG_DIR            # 보고서 경로: REPORT_DIR/run_report_YYYYMMDD_HHMMSS_PID.json
+PROMETHEUS_TEXTFILE = None      # 지정 시 node_exporter textfile collector용 .prom 파일도 기록
+
+# 엑셀 경로 업데이트(migrate_folders) 시 보관할 백업 개수
+EXCEL_BACKUP_KEEP = 3
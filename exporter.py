@@ -0,0 +1,181 @@
+import os
+import re
+import logging
+from datetime import datetime
+from openpyxl import Workbook, load_workbook
+
+import store
+
+logger = logging.getLogger(__name__)
+
+# 분할 단위별 등록일 접두어 길이 (YYYY / YYYY-MM)
+SPLIT_PERIODS = {
+    'year': 4,
+    'month': 7,
+}
+
+# 원본 파일이 열려 있을 때 대신 기록된 엑셀 (예: press_releases_20260207_backup_153000.xlsx)
+# _partial_/_new_는 이전 버전의 save_data가 남긴 파일
+STRAY_EXPORT_PATTERN = re.compile(r'^(?P<base>.+)_(backup|partial|new)_\d{6}\.xlsx$')
+# 파일명으로 내보내기 범위 추정: 수집일(YYYYMMDD), 분할 기간(YYYY, YYYY-MM, unknown)
+COLLECTED_ON_PATTERN = re.compile(r'_(\d{8})$')
+SPLIT_SUFFIX_PATTERN = re.compile(r'_(\d{4}(?:-\d{2})?|unknown)$')
+
+
+def export_records(records, output_file, columns=store.EXCEL_COLUMNS):
+    """
+    레코드를 openpyxl 쓰기 전용(스트리밍) 모드로 엑셀에 기록합니다.
+    행 단위로 바로 기록하므로 레코드 수와 관계없이 메모리 사용량이 일정합니다.
+    '첨부파일경로'의 =HYPERLINK(...) 문자열은 수식으로 기록됩니다.
+
+    Returns:
+        int: 기록한 행 수
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(columns)
+
+    count = 0
+    for record in records:
+        ws.append([record.get(col) or None for col in columns])
+        count += 1
+
+    wb.save(output_file)
+    return count
+
+
+def _save_with_fallback(data_store, output_file, **filters):
+    """파일이 열려 있어 저장할 수 없으면 백업 파일명으로 다시 내보냄"""
+    try:
+        return output_file, export_records(data_store.iter_records(**filters), output_file)
+    except PermissionError:
+        new_filename = output_file.replace(".xlsx", f"_backup_{datetime.now().strftime('%H%M%S')}.xlsx")
+        logger.warning(f"파일이 열려있어 저장할 수 없습니다. 백업 파일로 저장합니다: {new_filename}")
+        return new_filename, export_records(data_store.iter_records(**filters), new_filename)
+
+
+def export_store(data_store, output_file, file_name=None, split=None):
+    """
+    저장소의 레코드를 엑셀로 내보냅니다.
+    file_name을 지정하면 해당 파일의 포함 목록에 있는 레코드만, None이면 전체를 내보냅니다.
+    split이 'year' 또는 'month'이면 등록일 기준으로 파일을 나눕니다.
+    (예: press_releases_all_2024.xlsx, press_releases_all_2024-05.xlsx)
+
+    Returns:
+        list: 실제로 기록된 파일 경로 목록
+    """
+    if data_store.count_records(file_name) == 0:
+        logger.info("내보낼 데이터가 없습니다.")
+        return []
+
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+
+    period_length = SPLIT_PERIODS[split] if split else None
+    if split:
+        targets = [
+            (output_file.replace(".xlsx", f"_{period or 'unknown'}.xlsx"), period)
+            for period in data_store.list_reg_periods(period_length, file_name)
+        ]
+    else:
+        targets = [(output_file, None)]
+
+    written = []
+    for path, period in targets:
+        saved_path, count = _save_with_fallback(
+            data_store, path, file_name=file_name,
+            reg_period=period, period_length=period_length
+        )
+        written.append(saved_path)
+        logger.info(f"엑셀 내보내기 완료: {saved_path} ({count}건)")
+
+    return written
+
+
+def _export_filters(base_name):
+    """원본 파일명에서 내보내기 필터 추정 (수집일 파일, 분할 파일, 전체 파일)"""
+    stem = base_name[:-len('.xlsx')]
+    match = COLLECTED_ON_PATTERN.search(stem)
+    if match:
+        return {'file_name': base_name}
+    match = SPLIT_SUFFIX_PATTERN.search(stem)
+    if match:
+        period = "" if match.group(1) == 'unknown' else match.group(1)
+        return {'reg_period': period, 'period_length': len(period) or 7}
+    return {}
+
+
+def workbook_ids(path):
+    """엑셀 파일의 게시글 번호 목록 (행 순서, '번호' 컬럼이 없으면 빈 목록)"""
+    wb = load_workbook(path, read_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        if '번호' not in header:
+            return []
+        column = header.index('번호')
+        ids = (store._cell_to_str(row[column]) if column < len(row) else "" for row in rows)
+        return [ntt_id for ntt_id in ids if ntt_id]
+    finally:
+        wb.close()
+
+
+def merge_stray_exports(data_store, data_dir):
+    """
+    대체 파일(_backup_/_partial_/_new_)로 흩어진 내보내기를 원본 파일로 합칩니다.
+    대체 파일의 레코드가 저장소에 반영된 경우에만(sync_excel_files 이후), 원본과 대체 파일에 실제로 있는
+    게시글 번호 전체(합집합)를 원본 파일의 포함 목록으로 삼아 저장소에서 다시 내보냅니다.
+    대체 파일은 모든 행이 다시 쓴 원본에 들어간 것을 확인한 뒤에만 삭제합니다.
+    원본이 여전히 열려 있거나 저장소에 없는 번호가 있으면 파일을 그대로 둡니다.
+
+    Returns:
+        list: 다시 기록한 원본 파일 경로 목록
+    """
+    if not os.path.isdir(data_dir):
+        return []
+
+    strays = {}
+    for name in sorted(os.listdir(data_dir)):
+        match = STRAY_EXPORT_PATTERN.match(name)
+        if match:
+            strays.setdefault(f"{match.group('base')}.xlsx", []).append(os.path.join(data_dir, name))
+
+    written = []
+    for base_name, paths in strays.items():
+        indexed = [path for path in paths if data_store.is_file_indexed(path)]
+        if not indexed:
+            continue
+
+        base_path = os.path.join(data_dir, base_name)
+        try:
+            stray_ids = {path: workbook_ids(path) for path in indexed}
+            expected = set(workbook_ids(base_path)) if os.path.exists(base_path) else set()
+        except Exception as e:
+            logger.warning(f"{base_name} 대체 파일을 읽지 못해 합치지 않았습니다: {e}")
+            continue
+        for ids in stray_ids.values():
+            expected.update(ids)
+
+        filters = _export_filters(base_name)
+        data_store.add_file_records(base_name, expected)
+        missing = expected - {record['번호'] for record in data_store.iter_records(**filters)}
+        if missing:
+            logger.warning(f"{base_name}: 저장소에 없는 번호 {len(missing)}건이 있어 대체 파일을 합치지 않았습니다.")
+            continue
+
+        try:
+            count = export_records(data_store.iter_records(**filters), base_path)
+        except PermissionError:
+            logger.warning(f"{base_name} 파일이 열려 있어 대체 파일 {len(indexed)}개를 합치지 못했습니다.")
+            continue
+
+        rewritten = set(workbook_ids(base_path))
+        merged = 0
+        for path, ids in stray_ids.items():
+            if rewritten.issuperset(ids):
+                os.remove(path)
+                merged += 1
+            else:
+                logger.warning(f"{os.path.basename(path)}의 일부 행이 {base_name}에 없어 대체 파일을 남겨 둡니다.")
+        written.append(base_path)
+        logger.info(f"대체 파일 {merged}개를 {base_name}에 합쳤습니다 ({count}건)")
+    return written
@@ -0,0 +1,135 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    GET 응답을 디스크에 저장하는 HTTPAdapter.
+
+    - 일반 요청(목록/상세 HTML): 본문과 ETag/Last-Modified를 저장하고,
+      다음 요청 시 If-None-Match/If-Modified-Since로 재검증합니다 (304면 저장본 사용).
+    - 스트리밍 요청(첨부파일): 본문은 저장하지 않고 헤더(Content-Disposition 등)만 저장합니다.
+    - offline=True: 네트워크 없이 저장된 응답만 재생하며, 없으면 ConnectionError를 발생시킵니다.
+    """
+
+    def __init__(self, cache_dir, offline=False, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_dir = cache_dir
+        self.offline = offline
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            body = None
+            if meta.get('has_body'):
+                with open(body_path, 'rb') as f:
+                    body = f.read()
+            return meta, body
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _atomic_write(path, data):
+        """임시 파일에 쓴 뒤 교체 (동시 수집 중 깨진 캐시 파일 방지)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _store(self, url, headers, body=None):
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'headers': dict(headers),
+            'has_body': body is not None,
+        }
+        if body is not None:
+            self._atomic_write(body_path, body)
+        self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def _cached_response(self, request, meta, body):
+        """저장된 응답으로 Response 객체 구성"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body if body is not None else b""
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        # 헤더만 저장된 응답(첨부파일)은 본문이 없음을 표시
+        response.body_cached = body is not None
+        return response
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, stream=stream, **kwargs)
+
+        entry = self._load(request.url)
+
+        if self.offline:
+            if entry is None:
+                raise requests.exceptions.ConnectionError(f"오프라인 캐시에 없는 요청입니다: {request.url}")
+            return self._cached_response(request, *entry)
+
+        if stream:
+            # 첨부파일: 본문은 저장하지 않고 헤더만 기록
+            response = super().send(request, stream=stream, **kwargs)
+            if response.status_code == 200:
+                self._store(request.url, response.headers)
+            return response
+
+        # 저장본이 있으면 조건부 요청으로 재검증
+        meta, body = entry if entry else (None, None)
+        if body is not None:
+            cached_headers = CaseInsensitiveDict(meta['headers'])
+            if 'ETag' in cached_headers:
+                request.headers['If-None-Match'] = cached_headers['ETag']
+            if 'Last-Modified' in cached_headers:
+                request.headers['If-Modified-Since'] = cached_headers['Last-Modified']
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and body is not None:
+            # 변경 없음: 새 검증 헤더만 반영하고 저장된 본문 사용
+            headers = CaseInsensitiveDict(meta['headers'])
+            for name in ('ETag', 'Last-Modified', 'Date', 'Cache-Control', 'Expires'):
+                if name in response.headers:
+                    headers[name] = response.headers[name]
+            self._store(request.url, headers, body)
+            response.close()
+            return self._cached_response(request, {'headers': dict(headers)}, body)
+
+        if response.status_code == 200:
+            try:
+                self._store(request.url, response.headers, response.content)
+            except OSError as e:
+                logger.warning(f"응답 캐시 저장 실패 ({request.url}): {e}")
+
+        return response
@@ -0,0 +1,218 @@
+import os
+import json
+import time
+import tempfile
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_PREFIX = "msit_scraper_"
+
+
+def _label_key(labels):
+    """레이블 dict -> 정렬된 튜플 (집계 키, 값은 문자열로 통일)"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items())) if labels else ()
+
+
+def _format_labels(key):
+    return ",".join(f'{name}="{value}"' for name, value in key)
+
+
+class Histogram:
+    """누적 구간 카운트와 합계/최소/최대를 기록하는 히스토그램"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def cumulative(self):
+        """Prometheus 형식의 (le, 누적 건수) 목록"""
+        total = 0
+        result = []
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'buckets': {str(bound): count for bound, count in self.cumulative()},
+        }
+
+
+class Metrics:
+    """
+    실행 단위 계측 (카운터, 게이지, 지연 시간 히스토그램).
+    여러 스레드에서 동시에 호출할 수 있으며, 실행 종료 시 JSON 보고서와
+    Prometheus textfile(node_exporter textfile collector용)로 기록합니다.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.started_at = time.time()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록의 실행 시간(초)을 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name, **labels):
+        return self.counters.get((name, _label_key(labels)), 0)
+
+    def total(self, name):
+        """레이블과 관계없이 카운터 합계"""
+        return sum(value for (metric, _), value in self.counters.items() if metric == name)
+
+    def histogram_sum(self, name):
+        """레이블과 관계없이 히스토그램 관측값 합계"""
+        return sum(histogram.sum for (metric, _), histogram in self.histograms.items() if metric == name)
+
+    def snapshot(self):
+        """{종류: {이름: {레이블 문자열: 값}}} 형태의 집계 결과"""
+        def group(items, convert):
+            result = {}
+            for (name, key), value in sorted(items, key=lambda item: (item[0][0], item[0][1])):
+                result.setdefault(name, {})[_format_labels(key)] = convert(value)
+            return result
+
+        with self._lock:
+            return {
+                'counters': group(self.counters.items(), lambda value: value),
+                'gauges': group(self.gauges.items(), lambda value: value),
+                'histograms': group(self.histograms.items(), Histogram.to_dict),
+            }
+
+    def write_json(self, path, extra=None):
+        """실행 보고서(JSON) 기록. extra는 최상위 항목으로 합쳐집니다."""
+        report = {
+            'started_at': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            'finished_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'duration_seconds': round(time.time() - self.started_at, 3),
+        }
+        report.update(extra or {})
+        report.update(self.snapshot())
+        _atomic_write(path, json.dumps(report, ensure_ascii=False, indent=2))
+        return path
+
+    def write_prometheus(self, path):
+        """Prometheus text exposition 형식으로 기록 (textfile collector가 읽다 만 파일을 보지 않도록 원자적 교체)"""
+        lines = []
+
+        def header(name, kind):
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}{name} {kind}")
+
+        def sample(name, key, value, extra_labels=()):
+            labels = _format_labels(tuple(key) + tuple(extra_labels))
+            lines.append(f"{PROMETHEUS_PREFIX}{name}{{{labels}}} {value}" if labels
+                         else f"{PROMETHEUS_PREFIX}{name} {value}")
+
+        with self._lock:
+            for kind, items in (('counter', self.counters), ('gauge', self.gauges)):
+                seen = set()
+                for (name, key), value in sorted(items.items()):
+                    if name not in seen:
+                        header(name, kind)
+                        seen.add(name)
+                    sample(name, key, value)
+
+            seen = set()
+            for (name, key), histogram in sorted(self.histograms.items()):
+                if name not in seen:
+                    header(name, 'histogram')
+                    seen.add(name)
+                for bound, count in histogram.cumulative():
+                    sample(f"{name}_bucket", key, count, [('le', bound)])
+                sample(f"{name}_sum", key, round(histogram.sum, 6))
+                sample(f"{name}_count", key, histogram.count)
+
+        header('last_run_timestamp_seconds', 'gauge')
+        sample('last_run_timestamp_seconds', (), int(time.time()))
+        _atomic_write(path, "\n".join(lines) + "\n")
+        return path
+
+
+class NullMetrics:
+    """계측 비활성화 시 사용하는 빈 구현 (호출 비용 최소화)"""
+
+    enabled = False
+    _null_timer = nullcontext()
+
+    def inc(self, name, value=1, **labels):
+        pass
+
+    def set_gauge(self, name, value, **labels):
+        pass
+
+    def observe(self, name, value, **labels):
+        pass
+
+    def timer(self, name, **labels):
+        return self._null_timer
+
+    def counter_value(self, name, **labels):
+        return 0
+
+    def total(self, name):
+        return 0
+
+    def histogram_sum(self, name):
+        return 0.0
+
+
+def _atomic_write(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -5,19 +5,95 @@ from datetime import datetime
 import logging
 import config
 import utils
+import parquet_sink
 import re
+from bisect import bisect_left
 
 logger = logging.getLogger(__name__)
 
-def migrate_folders():
-    download_dir = config.DOWNLOAD_DIR
-    if not os.path.exists(download_dir):
-        logger.info(f"다운로드 폴더가 없습니다: {download_dir}")
-        return
 
-    # 모든 엑셀 파일 로드 (날짜 매핑용)
-    data_dir = config.DATA_DIR
+class TitleIndex:
+    """
+    폴더명의 제목 부분으로 등록일을 찾는 인덱스.
+
+    기존의 전체 순회 비교(30자 절단 제목 일치, 전체 제목이 폴더 제목으로 시작,
+    폴더 제목이 전체 제목으로 시작)와 같은 결과, 즉 title_to_date 삽입 순서상
+    첫 번째로 일치하는 제목의 날짜를 반환합니다.
+    (30자 절단 제목이 일치하면 전체 제목도 폴더 제목으로 시작하므로 두 번째 조건에 포함됨)
+
+    - 전체 제목이 폴더 제목으로 시작: 정렬된 제목 목록에서 이진 탐색한 구간의
+      최소 삽입 순서를 sparse table로 조회 -> O(log n)
+    - 폴더 제목이 전체 제목으로 시작: 폴더 제목의 모든 접두어를 딕셔너리로 조회 -> O(제목 길이)
+    """
+
+    def __init__(self, title_to_date):
+        self.title_to_date = title_to_date
+        self.titles = list(title_to_date)
+        self.position = {title: i for i, title in enumerate(self.titles)}
+
+        order = sorted(range(len(self.titles)), key=self.titles.__getitem__)
+        self.sorted_titles = [self.titles[i] for i in order]
+
+        # sparse table: table[k][i] = 정렬 순서 [i, i + 2^k) 구간의 최소 삽입 순서
+        self._table = [order]
+        span = 1
+        while span * 2 <= len(order):
+            prev = self._table[-1]
+            self._table.append([min(prev[i], prev[i + span]) for i in range(len(prev) - span)])
+            span *= 2
+
+    def _range_min(self, lo, hi):
+        """정렬 순서 [lo, hi) 구간의 최소 삽입 순서"""
+        level = (hi - lo).bit_length() - 1
+        row = self._table[level]
+        return min(row[lo], row[hi - (1 << level)])
+
+    def lookup(self, title_part):
+        """일치하는 제목의 등록일, 없으면 None"""
+        best = None
+
+        # 전체 제목이 title_part로 시작하는 제목들 (정렬 목록에서 연속 구간)
+        lo = bisect_left(self.sorted_titles, title_part)
+        hi = bisect_left(self.sorted_titles, title_part + '\U0010ffff')
+        if lo < hi:
+            best = self._range_min(lo, hi)
+
+        # title_part가 전체 제목으로 시작하는 경우 (전체 제목이 title_part의 접두어)
+        for length in range(len(title_part) + 1):
+            pos = self.position.get(title_part[:length])
+            if pos is not None and (best is None or pos < best):
+                best = pos
+
+        if best is None:
+            return None
+        return self.title_to_date[self.titles[best]]
+
+def load_title_to_date_parquet(dataset_dirs):
+    """Parquet 데이터셋에서 제목/등록일 두 컬럼만 읽어 매핑 생성 (엑셀 전체를 읽지 않음)"""
+    title_to_date = {}
+    for dataset_dir in dataset_dirs:
+        table = parquet_sink.ParquetSink(dataset_dir).read(columns=['제목', '등록일'])
+        for title, reg_date in zip(table.column('제목').to_pylist(), table.column('등록일').to_pylist()):
+            if reg_date is not None:
+                add_title_date(title_to_date, title, reg_date.strftime("%Y-%m-%d"))
+        logger.info(f"Parquet 로드: {dataset_dir} ({table.num_rows}건)")
+    logger.info(f"총 {len(title_to_date)}건 매핑 완료")
+    return title_to_date
+
+def load_title_to_date(data_dir=config.DATA_DIR):
+    """
+    data 폴더의 모든 엑셀 파일에서 정제된 제목 -> 등록일(YYYY-MM-DD) 매핑 생성
+    Parquet 출력(config.PARQUET_ENABLED)을 사용 중이면 Parquet 데이터셋의 두 컬럼만 읽습니다.
+    """
     title_to_date = {}
+
+    if config.PARQUET_ENABLED and parquet_sink.available():
+        dataset_dirs = parquet_sink.dataset_dirs(data_dir)
+        if dataset_dirs:
+            try:
+                return load_title_to_date_parquet(dataset_dirs)
+            except Exception as e:
+                logger.error(f"Parquet 로드 실패, 엑셀에서 다시 읽습니다: {e}")
     
     if os.path.exists(data_dir):
         excel_files = [f for f in os.listdir(data_dir) if f.endswith('.xlsx') and not f.endswith('_test.xlsx')]
@@ -27,18 +103,7 @@ def migrate_folders():
                 df = pd.read_excel(excel_path)
                 # 제목과 등록일 매핑
                 for _, row in df.iterrows():
-                    title = str(row['제목']).strip()
-                    date_val = row['등록일']
-                    
-                    # utils.normalize_date 사용
-                    if isinstance(date_val, datetime):
-                        date_str = date_val.strftime("%Y-%m-%d")
-                    else:
-                        date_str = utils.normalize_date(str(date_val))
-                    
-                    if date_str:
-                        clean_title = re.sub(r'[\\/*?:"<>|]', "", title).strip()
-                        title_to_date[clean_title] = date_str
+                    add_title_date(title_to_date, row['제목'], row['등록일'])
 
                 logger.info(f"엑셀 로드: {excel_file} ({len(df)}건)")
             except Exception as e:
@@ -47,94 +112,210 @@ def migrate_folders():
     else:
         logger.warning("데이터 폴더가 없습니다.")
 
+    return title_to_date
+
+def add_title_date(title_to_date, title, date_val):
+    """제목/등록일을 폴더명 규칙에 맞게 정제하여 매핑에 추가"""
+    title = str(title).strip()
+    
+    # utils.normalize_date 사용
+    if isinstance(date_val, datetime):
+        date_str = date_val.strftime("%Y-%m-%d")
+    else:
+        date_str = utils.normalize_date(str(date_val))
+    
+    if date_str:
+        clean_title = re.sub(r'[\\/*?:"<>|]', "", title).strip()
+        title_to_date[clean_title] = date_str
+
+def migrate_folders(folder_names=None, title_to_date=None):
+    """
+    다운로드 폴더명의 날짜 부분을 엑셀(등록일) 기준으로 교정합니다.
+
+    인자를 생략하면 data 폴더의 모든 엑셀과 downloads의 모든 폴더를 점검하고
+    모든 엑셀의 첨부파일 경로를 갱신합니다 (전체 점검).
+    folder_names와 title_to_date를 주면 해당 폴더만 처리하며, 엑셀 갱신은 호출한 쪽에서 합니다
+    (이번 실행에서 변경된 부분만 처리하는 용도).
+
+    Returns:
+        dict: {기존 폴더명: 새 폴더명}
+    """
+    download_dir = config.DOWNLOAD_DIR
+    if not os.path.exists(download_dir):
+        logger.info(f"다운로드 폴더가 없습니다: {download_dir}")
+        return {}
+
+    full_sweep = folder_names is None
+    if title_to_date is None:
+        # 모든 엑셀 파일 로드 (날짜 매핑용)
+        title_to_date = load_title_to_date(config.DATA_DIR)
+    if full_sweep:
+        folder_names = os.listdir(download_dir)
+
     print(f"폴더 마이그레이션 시작: {download_dir}")
-    count = 0
+    renamed = {}
+    title_index = TitleIndex(title_to_date)
     
-    for folder_name in os.listdir(download_dir):
-        folder_path = os.path.join(download_dir, folder_name)
-        if not os.path.isdir(folder_path):
-            continue
-            
-        # 기존 패턴: DATE_TITLE
-        # 날짜 부분 추출 시도
-        try:
-            parts = folder_name.split('_', 1)
-            if len(parts) != 2:
-                continue
-                
-            current_date_part = parts[0]
-            title_part = parts[1].strip()
+    for folder_name in folder_names:
+        new_folder_name = _migrate_folder(download_dir, folder_name, title_index)
+        if new_folder_name:
+            renamed[folder_name] = new_folder_name
             
-            # 정확한 날짜 찾기
-            new_date_part = current_date_part
-            
-            # 1. 엑셀 매핑 확인 (제목 30자 제한 고려)
-            # 폴더명에 쓰인 제목은 30자로 잘려있을 수 있음.
-            # title_to_date 키들 중 title_part로 시작하는 것을 찾거나
-            # 반대로 title_to_date 키가 title_part를 포함하는지 확인
-            
-            matched_date = None
-            for full_title, date in title_to_date.items():
-                # 폴더명 생성 규칙과 동일하게 변환 후 비교
-                clean_full_title = re.sub(r'[\\/*?:"<>|]', "", full_title).strip()
-                
-                # 다양한 매칭 방법 시도
-                # 1. 정확히 30자 잘린 경우
-                trunc_title = clean_full_title[:30].strip()
-                
-                # 2. 폴더 제목이 전체 제목으로 시작하는지
-                # 3. 전체 제목이 폴더 제목으로 시작하는지
-                if (trunc_title == title_part or 
-                    clean_full_title.startswith(title_part) or
-                    title_part.startswith(clean_full_title[:len(title_part)])):
-                    matched_date = date
-                    break
-            
-            if matched_date:
-                new_date_part = matched_date
-            else:
-               # 매핑 실패 시 포맷만이라도 통일
-               new_date_part = current_date_part.replace('.', '-')
+    print(f"마이그레이션 완료. {len(renamed)}개 폴더 변경됨.")
+    
+    # 엑셀 파일 경로 업데이트 (절대 경로 -> 상대 경로, 폴더명 변경 반영)
+    if full_sweep:
+        update_excel_paths()
 
-            new_folder_name = f"{new_date_part}_{title_part}"
+    return renamed
+
+def _migrate_folder(download_dir, folder_name, title_index):
+    """폴더 하나의 날짜 부분 교정 (이름 변경 또는 병합). 변경되었으면 새 폴더명, 아니면 None 반환"""
+    folder_path = os.path.join(download_dir, folder_name)
+    # blob 저장소(.blobs) 등 숨김 폴더 제외
+    if not os.path.isdir(folder_path) or folder_name.startswith('.'):
+        return None
+        
+    # 기존 패턴: DATE_TITLE
+    # 날짜 부분 추출 시도
+    try:
+        parts = folder_name.split('_', 1)
+        if len(parts) != 2:
+            return None
             
-            if new_folder_name != folder_name:
-                new_folder_path = os.path.join(download_dir, new_folder_name)
-                
-                if os.path.exists(new_folder_path):
-                    print(f"[MERGING] {folder_name} -> {new_folder_name}")
-                    # 내용물 이동
-                    for item in os.listdir(folder_path):
-                        src = os.path.join(folder_path, item)
-                        dst = os.path.join(new_folder_path, item)
-                        try:
-                            if os.path.exists(dst):
-                                os.remove(dst) # 덮어쓰기를 위해 기존 파일 삭제
-                            shutil.move(src, dst)
-                        except Exception as e:
-                            print(f"  - 파일 이동 실패 ({item}): {e}")
-                    
-                    # 빈 폴더 삭제
-                    try:
-                        os.rmdir(folder_path)
-                        print(f"[MERGE COMPLETE] {folder_name}")
-                        count += 1
-                    except OSError:
-                        print(f"  - 폴더 삭제 실패 (비어있지 않음): {folder_name}")
-                else:
-                    try:
-                        os.rename(folder_path, new_folder_path)
-                        print(f"[RENAME] {folder_name} -> {new_folder_name}")
-                        count += 1
-                    except Exception as e:
-                        print(f"[ERROR] Rename failed: {e}")
-        except Exception as e:
-            print(f"[ERROR] {folder_name} 처리 중 오류: {e}")
+        current_date_part = parts[0]
+        title_part = parts[1].strip()
+        
+        # 정확한 날짜 찾기
+        new_date_part = current_date_part
+        
+        # 1. 엑셀 매핑 확인 (제목 30자 제한 고려)
+        # 폴더명에 쓰인 제목은 30자로 잘려있을 수 있음.
+        # title_to_date 키들 중 title_part로 시작하는 것을 찾거나
+        # 반대로 title_part가 title_to_date 키로 시작하는지 확인 (TitleIndex 참고)
+        matched_date = title_index.lookup(title_part)
+        
+        if matched_date:
+            new_date_part = matched_date
+        else:
+           # 매핑 실패 시 포맷만이라도 통일
+           new_date_part = current_date_part.replace('.', '-')
+
+        new_folder_name = f"{new_date_part}_{title_part}"
+        
+        if new_folder_name == folder_name:
+            return None
+
+        new_folder_path = os.path.join(download_dir, new_folder_name)
+        
+        if os.path.exists(new_folder_path):
+            print(f"[MERGING] {folder_name} -> {new_folder_name}")
+            # 내용물 이동
+            for item in os.listdir(folder_path):
+                src = os.path.join(folder_path, item)
+                dst = os.path.join(new_folder_path, item)
+                try:
+                    if os.path.exists(dst):
+                        if os.path.samefile(src, dst):
+                            # 같은 blob을 가리키는 하드링크: 이동/복사 없이 원본 링크만 제거
+                            os.remove(src)
+                            continue
+                        os.remove(dst) # 덮어쓰기를 위해 기존 파일 삭제
+                    shutil.move(src, dst)
+                except Exception as e:
+                    print(f"  - 파일 이동 실패 ({item}): {e}")
             
-    print(f"마이그레이션 완료. {count}개 폴더 변경됨.")
-    
-    # 엑셀 파일 경로 업데이트 (절대 경로 -> 상대 경로, 폴더명 변경 반영)
-    update_excel_paths()
+            # 빈 폴더 삭제
+            try:
+                os.rmdir(folder_path)
+                print(f"[MERGE COMPLETE] {folder_name}")
+                return new_folder_name
+            except OSError:
+                print(f"  - 폴더 삭제 실패 (비어있지 않음): {folder_name}")
+        else:
+            try:
+                os.rename(folder_path, new_folder_path)
+                print(f"[RENAME] {folder_name} -> {new_folder_name}")
+                return new_folder_name
+            except Exception as e:
+                print(f"[ERROR] Rename failed: {e}")
+    except Exception as e:
+        print(f"[ERROR] {folder_name} 처리 중 오류: {e}")
+
+    return None
+
+# 경로 업데이트 백업 파일 (예: press_releases_20260207.backup_153000.xlsx)
+BACKUP_PATTERN = re.compile(r'\.backup(_\d+)?\.xlsx$')
+
+def _build_hyperlinks(df):
+    """
+    첨부파일경로가 있는 행들의 새 =HYPERLINK 수식을 컬럼 단위 연산으로 계산합니다.
+    (행별 계산과 동일한 규칙: downloads/YYYY-MM-DD_제목30자/파일명)
+
+    Returns:
+        Series: 행 인덱스 -> 새 수식 (새 경로가 없는 행은 제외)
+    """
+    paths = df['첨부파일경로'].map(str)
+    paths = paths[(paths != '') & (paths != 'nan')]
+    if paths.empty:
+        return paths
+
+    rows = df.loc[paths.index]
+    date_str = utils.normalize_date_series(rows['등록일'])
+    title_clean = (
+        rows['제목'].map(str).astype(object).str.strip()
+        .str.replace(r'[\\/*?:"<>|]', "", regex=True)
+        .str[:30].str.strip()
+    )
+    download_dir_name = os.path.basename(config.DOWNLOAD_DIR)
+    # ..\downloads\YYYY-MM-DD_Title
+    folder_rel_excel = os.path.join("..", download_dir_name, "") + date_str + "_" + title_clean
+
+    # 기존 경로(쉼표 구분)를 정규식으로 일괄 처리: 각 항목 공백 제거 -> 빈 항목 제거 -> 파일명만 남김
+    pieces = (
+        paths.astype(object)
+        .str.replace(r'\s*,\s*', ',', regex=True).str.strip()
+        .str.replace(r',{2,}', ',', regex=True).str.strip(',')
+    )
+    pieces = pieces[pieces != '']
+    counts = pieces.str.count(',') + 1
+    # os.path.basename과 같은 구분자 기준으로 각 항목의 마지막 구분자까지 제거
+    separators = re.escape(os.sep + (os.altsep or ""))
+    names = pieces.str.replace(f'[^,]*[{separators}]', '', regex=True).str.replace(',', ', ', regex=False)
+
+    display_text = "📂 폴더 열기 (" + names + ")"
+    # 엑셀 셀 글자수 제한 고려 (32767자, 수식은 더 짧을 수 있음)
+    too_long = display_text.str.len() > 200
+    display_text = display_text.where(~too_long, "📂 폴더 열기 (" + counts.astype(str) + "개 파일)")
+
+    formulas = '=HYPERLINK("' + folder_rel_excel.loc[pieces.index] + '", "' + display_text + '")'
+
+    # 날짜가 비어 있는 행은 기존 경로를 그대로 사용 (드문 경우이므로 행별 처리)
+    no_date = date_str.loc[paths.index] == ""
+    for idx in no_date[no_date].index:
+        old_paths = [p.strip() for p in paths[idx].split(',')]
+        folder_path_rel_excel = os.path.join("..", os.path.dirname(old_paths[0]))
+        display = f"📂 폴더 열기 ({', '.join([os.path.basename(p) for p in old_paths])})"
+        if len(display) > 200:
+            display = f"📂 폴더 열기 ({len(old_paths)}개 파일)"
+        formulas[idx] = f'=HYPERLINK("{folder_path_rel_excel}", "{display}")'
+
+    return formulas
+
+def _rotate_backups(file_path, keep=config.EXCEL_BACKUP_KEEP):
+    """경로 업데이트 백업을 최근 keep개만 남기고 삭제"""
+    folder = os.path.dirname(file_path)
+    stem = os.path.basename(file_path)[:-len('.xlsx')]
+    backups = sorted(
+        (os.path.join(folder, f) for f in os.listdir(folder)
+         if f.startswith(f"{stem}.backup") and BACKUP_PATTERN.search(f)),
+        key=os.path.getmtime
+    )
+    for old_backup in backups[:max(0, len(backups) - keep)]:
+        try:
+            os.remove(old_backup)
+        except OSError as e:
+            logger.warning(f"백업 삭제 실패 ({old_backup}): {e}")
 
 def update_excel_paths():
     print("엑셀 파일 내 첨부파일 경로 업데이트 시작...")
@@ -142,96 +323,32 @@ def update_excel_paths():
     if not os.path.exists(data_dir):
         return
 
-    excel_files = [f for f in os.listdir(data_dir) if f.endswith('.xlsx') and not f.endswith('.backup.xlsx')]
+    excel_files = [f for f in os.listdir(data_dir) if f.endswith('.xlsx') and not BACKUP_PATTERN.search(f)]
     
     for excel_file in excel_files:
         file_path = os.path.join(data_dir, excel_file)
         try:
             df = pd.read_excel(file_path)
-            start_modified = False
             
             if '첨부파일경로' not in df.columns:
                 continue
 
-            for idx, row in df.iterrows():
-                paths_str = str(row.get('첨부파일경로', ''))
-                if not paths_str or paths_str == 'nan':
-                    continue
-                
-                # 기존 경로들
-                old_paths = [p.strip() for p in paths_str.split(',')]
-                new_paths = []
-                
-                # 폴더명 재구성 (scraper.py 로직과 동일)
-                title = str(row['제목']).strip()
-                date_val = row['등록일']
-                if isinstance(date_val, datetime):
-                    date_str = date_val.strftime("%Y-%m-%d")
-                else:
-                    date_str = utils.normalize_date(str(date_val))
-                
-                if not date_str:
-                    new_paths = old_paths # 날짜 없으면 스킵
-                else:
-                    title_clean = re.sub(r'[\\/*?:"<>|]', "", title)
-                    expected_folder_name = f"{date_str}_{title_clean[:30].strip()}"
-                    
-                    # 각 파일별로 새 경로 생성
-                    for old_path in old_paths:
-                        if not old_path: continue
-                        
-                        # 파일명 추출 (기존 경로가 절대경로든 상대경로든)
-                        filename = os.path.basename(old_path)
-                        
-                        # 새 상대 경로: downloads/YYYY-MM-DD_Title/filename
-                        # config.DOWNLOAD_DIR이 data 폴더 상위에 있으므로
-                        # data 폴더 기준이 아닌, 프로젝트 루트(scraper.py 위치) 기준 상대 경로
-                        
-                        # downloads 폴더 이름이 config.DOWNLOAD_DIR의 마지막 부분이라 가정
-                        download_dir_name = os.path.basename(config.DOWNLOAD_DIR)
-                        new_rel_path = os.path.join(download_dir_name, expected_folder_name, filename)
-                        
-                        new_paths.append(new_rel_path)
-                
-                # 변경 확인
-                # 하이퍼링크 수식 생성: =HYPERLINK("상대경로", "표시텍스트")
-                # 표시 텍스트는 폴더명으로 설정
-                # 상대 경로: ..\downloads\YYYY-MM-DD_Title
-                
-                if new_paths:
-                    # 첫 번째 파일의 폴더 경로를 기준으로 함 (모두 같은 폴더에 있음)
-                    first_path = new_paths[0]
-                    # new_paths는 downloads\folder\file 형태 (data 폴더 상위 기준)
-                    # 엑셀 파일(data 폴더 내) 기준 상대 경로는 ..\downloads\folder\file
-                    
-                    # 폴더 경로 추출
-                    folder_path_rel_project = os.path.dirname(first_path) # downloads\folder
-                    folder_path_rel_excel = os.path.join("..", folder_path_rel_project) # ..\downloads\folder
-                    
-                    # 엑셀 수식 작성
-                    # 표시 텍스트: "📂 폴더 열기 (파일명1, 파일명2...)"
-                    display_text = f"📂 폴더 열기 ({', '.join([os.path.basename(p) for p in new_paths])})"
-                    # 엑셀 셀 글자수 제한 고려 (32767자, 수식은 더 짧을 수 있음)
-                    if len(display_text) > 200:
-                        display_text = f"📂 폴더 열기 ({len(new_paths)}개 파일)"
-                        
-                    hyperlink_formula = f'=HYPERLINK("{folder_path_rel_excel}", "{display_text}")'
-                    
-                    # 비교를 위해 단순 문자열로 변환하려 했으나 수식 자체가 값이므로
-                    # 기존 값이 수식이 아니거나, 수식이 다르다면 업데이트
-                    if paths_str != hyperlink_formula:
-                        df.at[idx, '첨부파일경로'] = hyperlink_formula
-                        start_modified = True
-                else:
-                     continue
-
-            if start_modified:
-                # 백업 생성
+            # 새 수식을 계산하고 기존 값과 다른 행만 반영
+            formulas = _build_hyperlinks(df)
+            current = df.loc[formulas.index, '첨부파일경로'].map(str)
+            changed = formulas[formulas != current]
+
+            if not changed.empty:
+                df['첨부파일경로'] = df['첨부파일경로'].astype(object)
+                df.loc[changed.index, '첨부파일경로'] = changed
+
+                # 백업 생성 (최근 config.EXCEL_BACKUP_KEEP개만 유지)
                 backup_path = file_path.replace('.xlsx', f'.backup_{datetime.now().strftime("%H%M%S")}.xlsx')
                 shutil.copy2(file_path, backup_path)
+                _rotate_backups(file_path)
                 
                 df.to_excel(file_path, index=False, engine='openpyxl')
-                print(f"  - 업데이트 완료: {excel_file}")
+                print(f"  - 업데이트 완료: {excel_file} ({len(changed)}행)")
             else:
                 print(f"  - 변경 없음: {excel_file}")
                 
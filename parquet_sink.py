@@ -0,0 +1,211 @@
+import os
+import re
+import time
+import shutil
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성: Parquet 출력(--parquet)에서만 필요
+    pa = ds = pq = None
+
+import config
+import utils
+from store import EXCEL_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# 등록일 기준 hive 파티션 폴더: <root>/year=2024/month=5/part-<시각ns>-<pid>.parquet
+PARQUET_DIR_PATTERN = re.compile(r'^parquet(_\w+)?$')
+
+
+def available():
+    return pa is not None
+
+
+if pa is not None:
+    # 명시적 스키마: 번호는 저장소와 같이 문자열, 등록일은 날짜, 수집일은 YYYYMMDD 문자열
+    SCHEMA = pa.schema(
+        [pa.field('번호', pa.string(), nullable=False),
+         pa.field('제목', pa.string()),
+         pa.field('등록일', pa.date32())]
+        + [pa.field(column, pa.string()) for column in EXCEL_COLUMNS if column not in ('번호', '제목', '등록일')]
+        + [pa.field('수집일', pa.string())]
+    )
+    PARTITION_SCHEMA = pa.schema([('year', pa.int16()), ('month', pa.int8())])
+    PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor='hive')
+    DATASET_SCHEMA = pa.unify_schemas([SCHEMA, PARTITION_SCHEMA])
+else:
+    SCHEMA = PARTITION_SCHEMA = PARTITIONING = DATASET_SCHEMA = None
+
+
+def _partition_key(reg_date):
+    """등록일 -> (연, 월), 날짜를 알 수 없으면 (0, 0)"""
+    dt = utils.parse_date(reg_date) if reg_date else None
+    return (dt.year, dt.month) if dt else (0, 0)
+
+
+def _to_row(record, collected_on):
+    row = {column: ("" if record.get(column) is None else str(record.get(column))) for column in EXCEL_COLUMNS}
+    dt = utils.parse_date(row['등록일']) if row['등록일'] else None
+    row['등록일'] = dt.date() if dt else None
+    row['수집일'] = collected_on
+    return row
+
+
+class ParquetSink:
+    """
+    수집 레코드의 Parquet 사본 (분석용, 엑셀과 함께 기록). pyarrow가 필요합니다.
+
+    - 등록일 연/월로 파티션(year=YYYY/month=M)을 나눠, 한 달 치나 일부 컬럼(번호 등)만 읽을 수 있습니다.
+    - append()는 페이지마다 작은 파일을 추가하고, compact()가 파티션별로 한 파일로 합칩니다
+      (같은 번호가 여러 번 기록되면 마지막 기록만 남김). 읽을 때도 번호 기준으로 중복을 제거합니다.
+    - 원본은 저장소(SQLite)이며, rebuild()로 저장소 전체에서 다시 만들 수 있습니다.
+    """
+
+    def __init__(self, root):
+        if pa is None:
+            raise RuntimeError("Parquet 출력(--parquet)에는 pyarrow가 필요합니다: pip install pyarrow")
+        self.root = root
+
+    def _partition_dir(self, year, month, root=None):
+        return os.path.join(root or self.root, f"year={year}", f"month={month}")
+
+    @staticmethod
+    def _write_file(table, directory):
+        """임시 파일(점으로 시작해 읽기에서 제외)에 쓴 뒤 교체. 이름은 기록 순서대로 정렬됨"""
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{time.time_ns():020d}-{os.getpid()}.parquet"
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, os.path.join(directory, name))
+
+    def append(self, records, collected_on=config.TODAY_STR):
+        """
+        레코드를 등록일 연/월 파티션별 새 파일로 추가
+        Returns:
+            set: 기록한 파티션 (연, 월)
+        """
+        groups = {}
+        for record in records:
+            groups.setdefault(_partition_key(record.get('등록일')), []).append(_to_row(record, collected_on))
+        for (year, month), rows in groups.items():
+            self._write_file(pa.Table.from_pylist(rows, schema=SCHEMA), self._partition_dir(year, month))
+        return set(groups)
+
+    def partitions(self):
+        """기록된 파티션 (연, 월) 목록"""
+        result = []
+        if not os.path.isdir(self.root):
+            return result
+        for year_dir in sorted(os.listdir(self.root)):
+            if not year_dir.startswith('year='):
+                continue
+            for month_dir in sorted(os.listdir(os.path.join(self.root, year_dir))):
+                if month_dir.startswith('month='):
+                    result.append((int(year_dir[5:]), int(month_dir[6:])))
+        return sorted(result)
+
+    def _files(self, directory):
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.endswith('.parquet') and not name.startswith(('.', '_'))
+        )
+
+    @staticmethod
+    def _dedupe(table):
+        """번호 기준 마지막 기록만 남김 (파일/행 순서 = 기록 순서)"""
+        if '번호' not in table.column_names or table.num_rows == 0:
+            return table
+        ids = table.column('번호').to_pylist()
+        last = {ntt_id: i for i, ntt_id in enumerate(ids)}
+        if len(last) == len(ids):
+            return table
+        return table.take(sorted(last.values()))
+
+    def compact(self, partitions=None):
+        """
+        파티션의 파일들을 한 파일로 합침 (partitions: (연, 월) 목록, 기본 전체)
+        새 파일을 먼저 쓴 뒤 기존 파일을 지우므로, 중간에 중단되어도 중복만 남고 유실은 없습니다.
+        """
+        merged = 0
+        for year, month in (partitions if partitions is not None else self.partitions()):
+            directory = self._partition_dir(year, month)
+            files = self._files(directory)
+            if len(files) < 2:
+                continue
+            table = self._dedupe(pa.concat_tables([pq.read_table(path, schema=SCHEMA) for path in files]))
+            self._write_file(table, directory)
+            for path in files:
+                os.remove(path)
+            merged += 1
+        return merged
+
+    def rebuild(self, records):
+        """
+        저장소 전체 레코드로 데이터셋을 다시 만듭니다 (임시 폴더에 쓴 뒤 교체).
+        records: 엑셀 컬럼명 딕셔너리 ('수집일' 값이 있으면 함께 기록)
+        Returns:
+            int: 기록한 레코드 수
+        """
+        tmp_root = self.root + ".rebuild"
+        shutil.rmtree(tmp_root, ignore_errors=True)
+        groups = {}
+        count = 0
+        for record in records:
+            row = _to_row(record, record.get('수집일') or "")
+            groups.setdefault(_partition_key(record.get('등록일')), []).append(row)
+            count += 1
+        for (year, month), rows in groups.items():
+            table = self._dedupe(pa.Table.from_pylist(rows, schema=SCHEMA))
+            self._write_file(table, self._partition_dir(year, month, tmp_root))
+
+        old_root = self.root + ".old"
+        shutil.rmtree(old_root, ignore_errors=True)
+        if os.path.isdir(self.root):
+            os.replace(self.root, old_root)
+        os.makedirs(tmp_root, exist_ok=True)
+        os.replace(tmp_root, self.root)
+        shutil.rmtree(old_root, ignore_errors=True)
+        return count
+
+    # --- 읽기 ---
+
+    def _dataset(self):
+        return ds.dataset(self.root, format='parquet', schema=DATASET_SCHEMA, partitioning=PARTITIONING)
+
+    def read(self, columns=None, year=None, month=None):
+        """
+        pyarrow Table로 읽기 (columns: 읽을 컬럼만, year/month: 해당 파티션 폴더만 읽음)
+        번호를 포함해 읽으면 번호 기준으로 중복을 제거합니다.
+        """
+        if not os.path.isdir(self.root):
+            return SCHEMA.empty_table().select(columns) if columns else SCHEMA.empty_table()
+        condition = None
+        if year is not None:
+            condition = ds.field('year') == year
+        if month is not None:
+            month_condition = ds.field('month') == month
+            condition = month_condition if condition is None else condition & month_condition
+        table = self._dataset().to_table(columns=columns or SCHEMA.names, filter=condition)
+        return self._dedupe(table)
+
+    def load_ids(self):
+        """기록된 게시글 번호 전체 (번호 컬럼만 읽음)"""
+        if not os.path.isdir(self.root):
+            return set()
+        return set(self._dataset().to_table(columns=['번호']).column('번호').to_pylist())
+
+
+def dataset_dirs(data_dir=config.DATA_DIR):
+    """data 폴더의 Parquet 데이터셋 폴더 (기본 게시판 parquet/, 그 외 parquet_<키>/)"""
+    if not os.path.isdir(data_dir):
+        return []
+    return [
+        os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir))
+        if PARQUET_DIR_PATTERN.match(name) and os.path.isdir(os.path.join(data_dir, name))
+    ]
@@ -0,0 +1,293 @@
+import re
+import time
+import threading
+from functools import lru_cache
+from bs4 import BeautifulSoup
+from lxml import etree
+
+import config
+import utils
+
+# 스크립트 날짜 패턴: $('#td_'+'REG_DT'+'_0').html('Feb 6, 2026');
+DATE_SCRIPT_PATTERN = re.compile(r"\$\('#td_'\s*\+\s*'REG_DT'\s*\+\s*'_(\d+)'\)\.html\('([^']+)'\)")
+# JS 다운로드 패턴: fn_download('atch_no', 'file_ord', 'ext')
+DOWNLOAD_PATTERN = re.compile(r"fn_download\('(\d+)',\s*'(\d+)',\s*'([^']+)'\)")
+DETAIL_ID_PATTERN = re.compile(r"fn_detail\((\d+)\)")
+
+# BeautifulSoup.get_text()와 같이 텍스트로 취급하지 않는 태그
+_NON_TEXT_TAGS = {'script', 'style', 'template'}
+
+# lxml 파서 객체는 여러 스레드에서 동시에 쓰면 안 되므로 스레드마다 하나씩 사용
+_parser_local = threading.local()
+
+
+def _html_parser():
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = etree.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _has_class(name):
+    """CSS 클래스 선택자(.name)에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# CSS 선택자와 같은 의미의 XPath (BeautifulSoup 구현과 결과가 같아야 함)
+_XPATH_LIST_LINKS = etree.XPath(
+    f"//*[{_has_class('board_list')}]//*[{_has_class('toggle')}]/a[starts-with(@onclick, 'fn_detail')]"
+)
+_XPATH_TOGGLE_PARENT = etree.XPath(f"ancestor::div[{_has_class('toggle')}][1]")
+_XPATH_DATE_DIV = etree.XPath(f"(.//div[{_has_class('date')}])[1]")
+_XPATH_TITLE = etree.XPath(f"(//*[{_has_class('view_head')}]//h2)[1]")
+_XPATH_DEPT_DT = etree.XPath(f"//*[{_has_class('tit_con')}]//dt")
+_XPATH_NEXT_DD = etree.XPath("following-sibling::dd[1]")
+_XPATH_NOTCON = etree.XPath(f"(//*[{_has_class('board_notcon')}])[1]")
+_XPATH_PC = etree.XPath(f"(//*[{_has_class('board_pc')}])[1]")
+_XPATH_SCRIPTS = etree.XPath("//script")
+
+
+@lru_cache(maxsize=None)
+def _compile_xpath(expression):
+    return etree.XPath(expression)
+
+
+def _selector(selectors, name, default):
+    """
+    게시판별 선택자(config.BOARDS의 selectors, XPath 문자열)가 있으면 컴파일해 사용하고, 없으면 기본값
+    name: list_links(상세 링크 a 요소), title(제목 요소), content(본문 요소)
+    """
+    if selectors and selectors.get(name):
+        return _compile_xpath(selectors[name])
+    return default
+
+
+def _parse_html(html):
+    """HTML 문자열을 lxml 트리로 파싱 (빈 문서면 None)"""
+    if not html or not html.strip():
+        return None
+    # 인코딩 선언이 있는 문서도 처리할 수 있도록 UTF-8 바이트로 전달
+    return etree.fromstring(html.encode('utf-8'), _html_parser())
+
+
+def _collect_text(node, parts, strip):
+    if node.text:
+        parts.append(node.text.strip() if strip else node.text)
+    for child in node:
+        # 주석/처리 지시문(tag가 문자열이 아님)과 script/style/template 내용은 제외, 뒤따르는 텍스트는 포함
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            _collect_text(child, parts, strip)
+        if child.tail:
+            parts.append(child.tail.strip() if strip else child.tail)
+
+
+def get_text(element, strip=False):
+    """BeautifulSoup Tag.get_text()와 같은 규칙으로 요소의 텍스트 추출"""
+    parts = []
+    _collect_text(element, parts, strip)
+    return "".join(parts)
+
+
+def _dates_from_script_text(script_text):
+    """날짜 스크립트에서 {index: YYYY-MM-DD} 추출"""
+    return {
+        int(idx): utils.normalize_date(date_str)
+        for idx, date_str in DATE_SCRIPT_PATTERN.findall(script_text)
+    }
+
+
+def _is_date_script(text):
+    return bool(text) and "$('#td_'" in text and "REG_DT" in text
+
+
+def extract_dates_from_script(doc):
+    """
+    페이지 내 스크립트에서 동적으로 할당되는 날짜 정보를 추출합니다.
+    형식: $('#td_'+'REG_DT'+'_0').html('Feb 6, 2026');
+    반환값: {index: date_str} 딕셔너리
+    """
+    if doc is None:
+        return {}
+    for script in _XPATH_SCRIPTS(doc):
+        if _is_date_script(script.text):
+            return _dates_from_script_text(script.text)
+    return {}
+
+
+def parse_list_page(html, backend=None, selectors=None):
+    """
+    목록 페이지에서 (게시글 번호, 등록일) 목록 추출
+    등록일을 찾지 못한 항목은 빈 문자열로 반환합니다.
+    backend: 'lxml' 또는 'html.parser' (기본값 config.HTML_PARSER, html.parser는 selectors 미지원)
+    selectors: 게시판별 XPath 선택자 (기본 구조와 다를 때만)
+    """
+    if (backend or config.HTML_PARSER) == 'html.parser':
+        return parse_list_page_bs4(html)
+
+    doc = _parse_html(html)
+    if doc is None:
+        return []
+
+    # 스크립트에서 날짜 추출
+    script_dates = extract_dates_from_script(doc)
+
+    # 스크립트의 인덱스(_0, _1...)는 .board_list 내의 순서와 일치함
+    items = []
+    seen_page_ids = set()
+    for idx, link in enumerate(_selector(selectors, 'list_links', _XPATH_LIST_LINKS)(doc)):
+        match = DETAIL_ID_PATTERN.search(link.get('onclick'))
+        if not match:
+            continue
+        ntt_id = match.group(1)
+
+        if ntt_id in seen_page_ids:
+            continue
+        seen_page_ids.add(ntt_id)
+
+        # 날짜 가져오기: 스크립트 매핑 우선, 없으면 HTML 백업
+        date_str = script_dates.get(idx, "")
+        if not date_str:
+            toggle = _XPATH_TOGGLE_PARENT(link)
+            if toggle:
+                date_div = _XPATH_DATE_DIV(toggle[0])
+                if date_div:
+                    date_str = get_text(date_div[0], strip=True).replace('등록일', '').strip()
+
+        items.append((ntt_id, date_str))
+
+    return items
+
+
+def parse_detail_page(html, ntt_id, backend=None, selectors=None):
+    """
+    상세 페이지에서 제목, 부서, 본문, 첨부파일 다운로드 목록 추출
+    selectors: 게시판별 XPath 선택자 (title, content, 기본 구조와 다를 때만)
+    Returns:
+        dict: title, dept, content, downloads [(atch_no, file_ord, ext), ...]
+    """
+    if (backend or config.HTML_PARSER) == 'html.parser':
+        return parse_detail_page_bs4(html, ntt_id)
+
+    doc = _parse_html(html)
+
+    title = f"제목없음_{ntt_id}"
+    dept = ""
+    content = ""
+    if doc is not None:
+        # 제목
+        title_elem = _selector(selectors, 'title', _XPATH_TITLE)(doc)
+        if title_elem:
+            title = utils.clean_text(get_text(title_elem[0]))
+
+        # 부서
+        for dt in _XPATH_DEPT_DT(doc):
+            if "부서" in get_text(dt):
+                dd = _XPATH_NEXT_DD(dt)
+                if dd:
+                    dept = utils.clean_text(get_text(dd[0]))
+                break
+
+        # 본문
+        if selectors and selectors.get('content'):
+            content_div = _selector(selectors, 'content', None)(doc)
+        else:
+            content_div = _XPATH_NOTCON(doc) or _XPATH_PC(doc)
+        if content_div:
+            content = utils.clean_text(get_text(content_div[0]))
+
+    return {
+        'title': title,
+        'dept': dept,
+        'content': content,
+        'downloads': DOWNLOAD_PATTERN.findall(html or ""),
+    }
+
+
+def decode_html(content, encoding):
+    """
+    응답 본문(bytes)을 문자열로 변환 (requests Response.text와 같은 방식)
+    응답 헤더의 문자셋을 알 수 없으면 utf-8로 디코딩합니다.
+    """
+    try:
+        return str(content, encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return str(content, 'utf-8', errors='replace')
+
+
+def parse_detail_job(job):
+    """
+    상세 페이지 파싱 + 본문 요약 (프로세스 풀에서 실행되는 CPU 작업 단위)
+    job: (context, ntt_id, content, encoding[, selectors]) -> (context, parsed)
+    context는 그대로 돌려주며, parsed에는 parse_detail_page 결과에 summary와
+    parse_seconds(파싱+요약 소요 시간, 계측용)가 추가됩니다.
+    """
+    context, ntt_id, content, encoding = job[:4]
+    selectors = job[4] if len(job) > 4 else None
+    start = time.perf_counter()
+    parsed = parse_detail_page(decode_html(content, encoding), ntt_id, selectors=selectors)
+    parsed['summary'] = utils.summarize_text(parsed['content'])
+    parsed['parse_seconds'] = time.perf_counter() - start
+    return context, parsed
+
+
+# --- BeautifulSoup(html.parser) 구현: 기존 동작 기준, 결과 비교 및 벤치마크용 ---
+
+def parse_list_page_bs4(html):
+    soup = BeautifulSoup(html, 'html.parser')
+
+    script_dates = {}
+    for script in soup.find_all('script'):
+        if _is_date_script(script.string):
+            script_dates = _dates_from_script_text(script.string)
+            break
+
+    links = soup.select('.board_list .toggle > a[onclick^="fn_detail"]')
+
+    items = []
+    seen_page_ids = set()
+    for idx, link in enumerate(links):
+        match = DETAIL_ID_PATTERN.search(link['onclick'])
+        if not match:
+            continue
+        ntt_id = match.group(1)
+
+        if ntt_id in seen_page_ids:
+            continue
+        seen_page_ids.add(ntt_id)
+
+        date_str = script_dates.get(idx, "")
+        if not date_str:
+            li = link.find_parent('div', class_='toggle')
+            if li:
+                date_div = li.find('div', class_='date')
+                if date_div:
+                    date_str = date_div.get_text(strip=True).replace('등록일', '').strip()
+
+        items.append((ntt_id, date_str))
+
+    return items
+
+
+def parse_detail_page_bs4(html, ntt_id):
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title_elem = soup.select_one('.view_head h2')
+    title = utils.clean_text(title_elem.get_text()) if title_elem else f"제목없음_{ntt_id}"
+
+    dept = ""
+    for dt in soup.select('.tit_con dt'):
+        if "부서" in dt.get_text():
+            dd = dt.find_next_sibling('dd')
+            if dd:
+                dept = utils.clean_text(dd.get_text())
+            break
+
+    content_div = soup.select_one('.board_notcon') or soup.select_one('.board_pc')
+    content = utils.clean_text(content_div.get_text()) if content_div else ""
+
+    return {
+        'title': title,
+        'dept': dept,
+        'content': content,
+        'downloads': DOWNLOAD_PATTERN.findall(html or ""),
+    }
@@ -0,0 +1,50 @@
+from collections import deque
+from concurrent.futures import Future
+
+
+def _run_stages(value, stages):
+    """
+    value를 stages [(executor, func), ...]에 차례로 통과시키고 최종 결과 Future를 반환합니다.
+    각 단계는 이전 단계가 끝나면 해당 executor에 제출되며, 결과가 None이면 이후 단계는 건너뜁니다.
+    """
+    result = Future()
+
+    def submit(index, value):
+        executor, func = stages[index]
+        try:
+            future = executor.submit(func, value)
+        except Exception as e:
+            result.set_exception(e)
+            return
+        future.add_done_callback(lambda f: advance(index, f))
+
+    def advance(index, future):
+        try:
+            value = future.result()
+        except Exception as e:
+            result.set_exception(e)
+            return
+        if value is None or index + 1 == len(stages):
+            result.set_result(value)
+        else:
+            submit(index + 1, value)
+
+    submit(0, value)
+    return result
+
+
+def ordered_pipeline(items, stages, max_pending):
+    """
+    items를 단계별 executor(스레드 풀: 네트워크, 프로세스 풀: 파싱 등)로 처리합니다.
+
+    - 결과는 입력 순서대로 (item, Future)로 반환합니다.
+    - 동시에 진행 중인 항목은 max_pending개로 제한되어, 소비자가 처리하지 못한 결과가
+      쌓이면 앞 단계(수집)도 멈춥니다 (단계 사이의 제한된 큐 역할).
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft()
+        pending.append((item, _run_stages(item, stages)))
+    while pending:
+        yield pending.popleft()
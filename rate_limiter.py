@@ -0,0 +1,251 @@
+import time
+import logging
+import threading
+from collections import Counter, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    여러 스레드가 공유하는 초당 요청 수 제한기.
+    요청 사이의 최소 간격(1 / rate 초)을 보장합니다.
+    rate가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """다음 요청 슬롯까지 대기"""
+        if self.interval <= 0:
+            return
+
+        # 슬롯 예약은 잠금 안에서, 실제 대기는 잠금 밖에서 수행
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time)
+            self._next_time = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_response(self, status, latency=None, retry_after=None):
+        """응답 결과 전달 (고정 속도 제한기는 무시)"""
+
+    def set_ceiling(self, rate):
+        """
+        이 프로세스의 속도 상한 지정 (여러 워커 프로세스가 전역 속도를 나눠 쓸 때)
+        고정 속도 제한기는 속도 자체를 rate로 바꿉니다.
+        """
+        with self._lock:
+            self.rate = rate
+            self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+
+
+def parse_retry_after(value, max_seconds=None):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환. 없거나 잘못된 값이면 None"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    seconds = max(0.0, seconds)
+    return min(seconds, max_seconds) if max_seconds is not None else seconds
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    AIMD(가산 증가, 배수 감소) 방식의 적응형 속도 제한기. 모든 스레드가 공유합니다.
+
+    - 정상 응답(지연 시간 latency_target 이하): 초당 약 increase만큼 속도를 올림 (max_rate까지)
+    - 429/503, 그 밖의 5xx, 지연 시간 초과: 속도를 decrease배로 낮춤 (min_rate까지)
+      동시에 진행 중이던 요청들이 같은 신호를 여러 번 보내도 cooldown초 안에는 한 번만 낮춤
+    - Retry-After: 모든 스레드의 다음 요청을 해당 시간 이후로 미룸
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, rate, min_rate, max_rate, increase=0.2, decrease=0.5,
+                 latency_target=2.0, cooldown=1.0, max_retry_after=120):
+        super().__init__(min(max(rate, min_rate), max_rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._base_min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.max_retry_after = max_retry_after
+        self.events = Counter()
+        self.lowest_rate = self.rate
+        self.highest_rate = self.rate
+        self._last_decrease = float('-inf')
+
+    def set_ceiling(self, rate):
+        """상한(max_rate)을 rate로 바꾸고 현재 속도를 그 안으로 맞춤 (하한도 상한을 넘지 않게 조정)"""
+        with self._lock:
+            self.max_rate = rate
+            self.min_rate = min(self._base_min_rate, rate)
+            self._set_rate(self.rate)
+
+    def _set_rate(self, rate):
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+        self.interval = 1.0 / self.rate
+        self.lowest_rate = min(self.lowest_rate, self.rate)
+        self.highest_rate = max(self.highest_rate, self.rate)
+
+    def _back_off(self, now, reason):
+        self.events[reason] += 1
+        # 직전 감소 이후 cooldown(또는 현재 요청 간격) 안의 신호는 같은 과부하로 봄
+        if now - self._last_decrease < max(self.cooldown, self.interval):
+            return
+        self._last_decrease = now
+        old_rate = self.rate
+        self._set_rate(self.rate * self.decrease)
+        logger.warning(f"요청 속도 감소 ({reason}): 초당 {old_rate:.2f} -> {self.rate:.2f}건")
+
+    def on_response(self, status, latency=None, retry_after=None):
+        """
+        응답 결과로 속도를 조정합니다.
+        latency: 응답 시간(초, 재시도가 섞인 응답은 None), retry_after: Retry-After(초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if retry_after is not None:
+                retry_after = min(retry_after, self.max_retry_after)
+                self.events['retry_after'] += 1
+                self._next_time = max(self._next_time, now + retry_after)
+
+            if status in self.THROTTLE_STATUSES:
+                self._back_off(now, f"HTTP {status}")
+            elif status >= 500:
+                self._back_off(now, "server_error")
+            elif latency is not None and latency > self.latency_target:
+                self._back_off(now, "slow")
+            elif status < 400:
+                # 초당 rate건의 정상 응답마다 increase/rate씩 올려, 시간 기준으로 초당 increase만큼 증가
+                self._set_rate(self.rate + self.increase / self.rate)
+
+
+class FairScheduler:
+    """
+    여러 게시판(키)이 하나의 속도 제한기를 나눠 쓸 때 요청 슬롯을 공정하게 배분합니다.
+    대기 중인 키끼리 돌아가며 한 슬롯씩 받으므로, 워커가 많거나 목록이 긴 게시판이
+    전체 속도를 독차지하지 못합니다. 대기 중인 키가 하나뿐이면 그 키가 전체 속도를 씁니다.
+    """
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.keys = []
+        self._cond = threading.Condition()
+        self._turns = deque()
+        self._waiting = Counter()
+        self._busy = False
+        # 스레드별 마지막으로 슬롯을 요청한 키 (urllib3 재시도처럼 키를 모르는 곳에서 사용)
+        self._local = threading.local()
+
+    def for_key(self, key):
+        """key 전용 제한기 (wait()만 스케줄러를 거치고 나머지는 공유 제한기와 같음)"""
+        with self._cond:
+            if key not in self.keys:
+                self.keys.append(key)
+                self._turns.append(key)
+        return KeyedLimiter(self, key)
+
+    def _next_key(self):
+        for key in self._turns:
+            if self._waiting[key]:
+                return key
+        return None
+
+    def wait(self, key):
+        """key 차례가 올 때까지 기다린 뒤 공유 제한기의 다음 슬롯까지 대기"""
+        self._local.key = key
+        if self.limiter.interval <= 0:
+            return
+
+        with self._cond:
+            self._waiting[key] += 1
+            while self._busy or self._next_key() != key:
+                self._cond.wait()
+            self._waiting[key] -= 1
+            self._busy = True
+            # 슬롯을 받은 키는 맨 뒤로 (라운드 로빈)
+            self._turns.remove(key)
+            self._turns.append(key)
+
+        try:
+            self.limiter.wait()
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def wait_current(self):
+        """
+        현재 스레드가 마지막으로 요청한 키의 차례로 대기 (세션을 함께 쓰는 게시판들의 재시도용)
+        이 스레드에서 요청한 적이 없으면 공유 제한기만 거칩니다.
+        """
+        key = getattr(self._local, 'key', None)
+        if key is None:
+            self.limiter.wait()
+        else:
+            self.wait(key)
+
+
+class KeyedLimiter:
+    """FairScheduler.for_key()가 돌려주는 키별 제한기 (속도/피드백 등 나머지 속성은 공유 제한기로 위임)"""
+
+    def __init__(self, scheduler, key):
+        self.scheduler = scheduler
+        self.key = key
+
+    def wait(self):
+        self.scheduler.wait(self.key)
+
+    def __getattr__(self, name):
+        return getattr(self.scheduler.limiter, name)
+
+
+class FeedbackRetry(Retry):
+    """
+    urllib3 Retry 확장: 재시도를 유발한 응답(429/5xx, Retry-After)을 속도 제한기에 알리고,
+    재시도 요청도 전역 속도 제한을 거치게 합니다 (재시도가 부하를 몰래 늘리지 않도록).
+    scheduler를 주면 재시도 대기도 FairScheduler를 거쳐, 재시도한 게시판의 차례로 슬롯을 받습니다.
+    """
+
+    def __init__(self, *args, limiter=None, scheduler=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+        self.scheduler = scheduler
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.limiter = self.limiter
+        retry.scheduler = self.scheduler
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if self.limiter is not None and response is not None:
+            self.limiter.on_response(response.status,
+                                     retry_after=parse_retry_after(response.headers.get('Retry-After')))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        if self.scheduler is not None:
+            self.scheduler.wait_current()
+        elif self.limiter is not None:
+            self.limiter.wait()
@@ -1,21 +1,36 @@
 import os
 import sys
-import time
+import csv
+import json
+import socket
 import logging
+import threading
 import argparse
 import requests
-import pandas as pd
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, unquote
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from tqdm import tqdm
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
+from contextlib import contextmanager
 
 import config
 import utils
+import parsers
+import pipeline
+import metrics
 import migrate_folders
+import blob_store
+from rate_limiter import RateLimiter, AdaptiveRateLimiter, FairScheduler, FeedbackRetry, parse_retry_after
+from http_cache import CachingAdapter
+import store
+import exporter
+import work_queue
+import boards
+import async_engine
+import parquet_sink
 
 # 로깅 설정
 def setup_logging():
@@ -36,346 +51,1375 @@ def setup_logging():
 logger = setup_logging()
 
 class PressReleaseScraper:
-    def __init__(self, year=config.TARGET_YEAR, output_file=config.EXCEL_PATH):
+    def __init__(self, year=config.TARGET_YEAR, output_file=None,
+                 workers=config.MAX_WORKERS, rate=config.REQUESTS_PER_SECOND,
+                 store_path=None, use_cache=config.HTTP_CACHE_ENABLED, offline=False,
+                 parse_workers=config.PARSE_WORKERS, metrics_enabled=config.METRICS_ENABLED,
+                 adaptive_rate=config.ADAPTIVE_RATE, max_rate=config.MAX_REQUESTS_PER_SECOND,
+                 board=None, shared=None, pool_size=None, parquet=None):
+        """
+        board: 수집할 게시판 (boards.Board 또는 config.BOARDS 키, 기본 config.DEFAULT_BOARD)
+            output_file / store_path를 지정하지 않으면 게시판별 엑셀/저장소 경로를 사용
+        shared: 함께 수집하는 다른 게시판의 스크래퍼. 세션(커넥션 풀)과 속도 제한을 공유하고
+            요청 슬롯은 FairScheduler가 게시판끼리 번갈아 배분 (rate/adaptive_rate/max_rate/pool_size는 무시)
+        pool_size: 커넥션 풀 크기 (기본: max(10, workers))
+        parquet: 엑셀과 함께 Parquet(게시판별 폴더, 등록일 연/월 파티션)으로도 기록 (기본 config.PARQUET_ENABLED)
+        """
+        self.board = board if isinstance(board, boards.Board) else boards.get_board(board)
         self.target_year = year
-        self.output_file = output_file
-        self.session = self._setup_session()
+        self.output_file = output_file or self.board.excel_path()
+        self.workers = max(1, workers)
+        # 파싱/요약 전용 프로세스 수 (0이면 수집 스레드에서 바로 파싱)
+        self.parse_workers = max(0, parse_workers)
+        # 단계별 계측 (비활성화 시 빈 구현이라 비용 없음)
+        self.metrics = metrics.Metrics() if metrics_enabled else metrics.NullMetrics()
+        self.use_cache = use_cache or offline
+        # 오프라인 모드: 캐시된 응답만 재생 (네트워크 요청 없음)
+        self.offline = offline
+        # 모든 요청(스레드/게시판 공통)이 하나의 속도 제한을 공유
+        # 적응형: rate에서 시작해 서버 상태(429/5xx, 지연 시간, Retry-After)에 따라 조절
+        if shared is not None:
+            self.rate_limiter = shared.rate_limiter
+            self.scheduler = shared.scheduler
+        else:
+            if adaptive_rate and rate and rate > 0:
+                self.rate_limiter = AdaptiveRateLimiter(
+                    rate, min_rate=config.MIN_REQUESTS_PER_SECOND, max_rate=max(max_rate, rate),
+                    increase=config.RATE_INCREASE, decrease=config.RATE_DECREASE,
+                    latency_target=config.LATENCY_TARGET, max_retry_after=config.MAX_RETRY_AFTER
+                )
+            else:
+                self.rate_limiter = RateLimiter(rate)
+            self.scheduler = FairScheduler(self.rate_limiter)
+        # 이 게시판의 요청은 스케줄러를 거쳐 공유 제한기의 슬롯을 받음
+        self.limiter = self.scheduler.for_key(self.board.key)
+        self.session = shared.session if shared is not None else self._setup_session(pool_size)
         self.collected_data = []
-        self.seen_ids = set()
+        self.test_mode = False
+        # 수집 기간 (기본: 기준 연도 1월 1일 이후 전체)
+        self.date_from = datetime(year, 1, 1)
+        self.date_to = None
+        # 페이지 위치 탐색 중 받아 둔 목록 페이지 (수집 시 재사용)
+        self._list_cache = {}
+        # 이번 실행의 변경분: 번호 -> (첨부파일 폴더명, 제목, 등록일) (폴더 마이그레이션 대상)
+        self.changed_folders = {}
+        # Parquet 출력: 저장한 레코드를 모아 두었다가 페이지(작업) 단위로 파일 추가
+        use_parquet = config.PARQUET_ENABLED if parquet is None else parquet
+        self.parquet = parquet_sink.ParquetSink(self.board.parquet_dir()) if use_parquet else None
+        self._parquet_buffer = []
+        self._parquet_partitions = set()
         
-        # 이어받기: 기존 파일이 있으면 ID 로드
-        if os.path.exists(self.output_file):
-            try:
-                df = pd.read_excel(self.output_file)
-                if '번호' in df.columns:
-                    self.seen_ids = set(df['번호'].astype(str).tolist())
-                    logger.info(f"기존 데이터 {len(self.seen_ids)}건 로드 완료. 중복 수집을 건너뜁니다.")
-            except Exception as e:
-                logger.warning(f"기존 파일 로드 실패: {e}")
+        # 이어받기: 모든 실행/파일에 걸친 수집 인덱스에서 ID 로드
+        # (새로 생기거나 변경된 엑셀 파일만 인덱스에 반영)
+        # (게시판마다 저장소를 따로 두고, 해당 게시판의 엑셀만 반영)
+        self.store = store.ScraperStore(store_path or self.board.store_path())
+        self.store.sync_excel_files(config.DATA_DIR, accept=self.board.owns_file)
+        self.seen_ids = self.store.load_seen_ids()
+        if self.seen_ids:
+            logger.info(f"기존 데이터 {len(self.seen_ids)}건 로드 완료. 중복 수집을 건너뜁니다.")
 
-    def _setup_session(self):
+    def _setup_session(self, pool_size=None):
         """안정적인 네트워크 요청을 위한 세션 설정"""
         session = requests.Session()
         session.headers.update(config.HEADERS)
+        retry_strategy = self._retry_strategy()
         
-        retry_strategy = Retry(
-            total=config.MAX_RETRIES,
-            backoff_factor=config.BACKOFF_FACTOR,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        # 워커 수만큼 동시 연결을 유지할 수 있도록 커넥션 풀 크기 설정
+        pool_size = pool_size or max(10, self.workers)
+        adapter_kwargs = dict(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        if self.use_cache:
+            adapter = CachingAdapter(config.HTTP_CACHE_DIR, offline=self.offline, **adapter_kwargs)
+        else:
+            adapter = HTTPAdapter(**adapter_kwargs)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
 
-    def download_attachment(self, url, folder_name):
-        """첨부파일 다운로드"""
+    def _retry_strategy(self):
+        """
+        재시도 정책 (세션과 비동기 엔진(async_engine) 공용)
+        재시도를 유발한 응답도 속도 제한기에 전달하고, 재시도 요청도 전역 속도 제한을 거침
+        (여러 게시판이 세션을 공유하므로 재시도 대기도 게시판 간 스케줄러를 거침)
+        """
+        return FeedbackRetry(
+            total=config.MAX_RETRIES,
+            backoff_factor=config.BACKOFF_FACTOR,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            limiter=None if self.offline else self.rate_limiter,
+            scheduler=None if self.offline else self.scheduler
+        )
+
+    def _get(self, url, stage="other", **kwargs):
+        """
+        속도 제한을 적용한 GET 요청 (오프라인 모드는 네트워크를 쓰지 않으므로 제한 없음)
+        stage: 계측용 구분 (list, detail, attachment)
+        """
+        return self._request("GET", url, stage, **kwargs)
+
+    def _request(self, method, url, stage="other", **kwargs):
+        """속도 제한과 계측을 적용한 요청 (_get, 첨부파일 크기 확인용 HEAD 공용)"""
+        if not self.offline:
+            self.limiter.wait()
+
+        start = time.perf_counter()
         try:
-            response = self.session.get(url, stream=True, timeout=config.TIMEOUT)
-            response.raise_for_status()
-            
-            filename = ""
-            # Content-Disposition 헤더 확인
-            if "Content-Disposition" in response.headers:
-                cd = response.headers["Content-Disposition"]
-                # RFC 5987: filename*=UTF-8''EncodedString
-                matches = re.findall(r"filename\*=UTF-8''(.+)", cd)
-                if matches:
-                    filename = unquote(matches[0])
-                else:
-                    # filename="Name"
-                    matches = re.findall(r'filename="([^"]+)"', cd)
-                    if matches:
-                        filename = unquote(matches[0])
-            
-            # 헤더에서 실패했거나 없는 경우 URL에서 추출
-            if not filename:
-                # 리다이렉트된 최종 URL 기준
-                if response.history:
-                    url = response.url
-                filename = unquote(os.path.basename(url))
-            
-            # 파일명 정제 (특수문자 제거)
-            filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-            
-            # 파일명 길이 제한 (Windows MAX_PATH 고려, 100자로 제한)
-            name, ext = os.path.splitext(filename)
-            if len(name) > 80:
-                name = name[:80]
-            filename = f"{name}{ext}"
-            
-            save_dir = os.path.join(config.DOWNLOAD_DIR, folder_name)
-            os.makedirs(save_dir, exist_ok=True)
-            
-            file_path = os.path.join(save_dir, filename)
-            
-            # 이미 있으면 스킵
-            if os.path.exists(file_path):
-                return filename, file_path
+            response = self.session.request(method, url, timeout=config.TIMEOUT, **kwargs)
+        except Exception:
+            self.metrics.inc('http_errors_total', stage=stage)
+            raise
+        elapsed = time.perf_counter() - start
 
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
-            return filename, file_path
-            
+        retries = getattr(response.raw, 'retries', None)
+        retried = bool(retries and retries.history)
+        if not self.offline:
+            # 재시도 대기 시간이 섞인 응답은 지연 시간 판단에서 제외 (재시도 원인은 FeedbackRetry가 이미 전달)
+            self.limiter.on_response(
+                response.status_code,
+                latency=None if retried else elapsed,
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
+            )
+        if self.metrics.enabled:
+            self._record_response(stage, response, elapsed, retries)
+        return response
+
+    def _record_response(self, stage, response, elapsed, retries):
+        """응답 상태 코드, 지연 시간, 캐시 적중, 재시도, 현재 요청 속도 기록"""
+        self.metrics.observe('http_request_seconds', elapsed, stage=stage)
+        self.metrics.inc('http_responses_total', stage=stage, status=response.status_code)
+        if getattr(response, 'from_cache', False):
+            self.metrics.inc('http_cache_hits_total', stage=stage)
+        # urllib3 Retry가 내부에서 재시도한 기록 (429/5xx, 연결 오류)
+        for attempt in (retries.history if retries else ()):
+            self.metrics.inc('http_retries_total', stage=stage, status=attempt.status or 'error')
+        self.metrics.set_gauge('request_rate', self.limiter.rate)
+
+    def download_attachment(self, url, folder_name):
+        """
+        첨부파일 다운로드 (실패 시 로그를 남기고 (None, None) 반환)
+        임시 파일(.part)에 받은 뒤 크기 검증이 끝나면 blob 저장소로 옮기고 최종 경로에 하드링크하므로,
+        중단된 다운로드가 완료된 파일로 취급되지 않고 같은 내용의 파일은 한 번만 저장됩니다.
+        """
+        try:
+            return self._download_attachment(url, folder_name)[:2]
         except Exception as e:
             logger.error(f"파일 다운로드 실패 ({url}): {e}")
             return None, None
 
-    def _extract_dates_from_script(self, soup):
+    def _download_attachment(self, url, folder_name, expected_size=None):
         """
-        페이지 내 스크립트에서 동적으로 할당되는 날짜 정보를 추출합니다.
-        형식: $('#td_'+'REG_DT'+'_0').html('Feb 6, 2026');
-        반환값: {index: date_str} 딕셔너리
+        첨부파일 다운로드 본체 (실패 시 예외 발생)
+        expected_size: 매니페스트에 기록된 크기 (최종 경로에 이미 있는 파일 검증용)
+        Returns:
+            tuple: (파일명, 경로, SHA-256). 이미 있던 파일을 그대로 쓰면 SHA-256은 None
         """
-        date_map = {}
-        scripts = soup.find_all('script')
-        target_script = None
+        response = self._get(url, stage="attachment", stream=True)
+        response.raise_for_status()
 
-        for script in scripts:
-            if script.string and "$('#td_'" in script.string and "REG_DT" in script.string:
-                target_script = script.string
-                break
+        # 리다이렉트된 경우 최종 URL 기준으로 파일명 추출
+        filename, file_path = self._attachment_target(
+            response.headers, response.url if response.history else url, folder_name
+        )
         
-        if target_script:
-            # 정규식으로 인덱스와 날짜 추출
-            # 예: $('#td_'+'REG_DT'+'_0').html('Feb 6, 2026');
-            pattern = re.compile(r"\$\('#td_'\s*\+\s*'REG_DT'\s*\+\s*'_(\d+)'\)\.html\('([^']+)'\)")
-            matches = pattern.findall(target_script)
-            
-            for idx, date_str in matches:
-                # utils.normalize_date로 날짜 표준화
-                date_map[int(idx)] = utils.normalize_date(date_str) 
+        # 이미 있으면 스킵 (크기가 맞을 때만)
+        if self._reusable_file(file_path, response.headers, expected_size):
+            response.close()
+            return filename, file_path, None
 
-        return date_map
+        # 오프라인 모드에서 헤더만 캐시된 첨부파일은 받을 수 없음
+        if not getattr(response, 'body_cached', True):
+            raise IOError("오프라인 캐시에 첨부파일 본문이 없습니다")
 
-    def get_list_page(self, page):
-        """목록 페이지 파싱"""
-        url = f"{config.LIST_URL}&pageIndex={page}"
-        try:
-            response = self.session.get(url, timeout=config.TIMEOUT)
+        sha256 = self._stream_to_file(response, url, file_path)
+        return filename, file_path, sha256
+
+    def _attachment_target(self, headers, url, folder_name):
+        """
+        응답 헤더(Content-Disposition)나 URL에서 파일명을 정하고 저장 경로를 만듭니다.
+        Returns:
+            tuple: (파일명, 저장 경로)
+        """
+        filename = ""
+        # Content-Disposition 헤더 확인
+        if "Content-Disposition" in headers:
+            cd = headers["Content-Disposition"]
+            # RFC 5987: filename*=UTF-8''EncodedString
+            matches = re.findall(r"filename\*=UTF-8''(.+)", cd)
+            if matches:
+                filename = unquote(matches[0])
+            else:
+                # filename="Name"
+                matches = re.findall(r'filename="([^"]+)"', cd)
+                if matches:
+                    filename = unquote(matches[0])
+        
+        # 헤더에서 실패했거나 없는 경우 URL에서 추출
+        if not filename:
+            filename = unquote(os.path.basename(str(url)))
+        
+        # 파일명 정제 (특수문자 제거)
+        filename = re.sub(r'[\\/*?:"<>|]', "", filename)
+        
+        # 파일명 길이 제한 (Windows MAX_PATH 고려, 100자로 제한)
+        name, ext = os.path.splitext(filename)
+        if len(name) > 80:
+            name = name[:80]
+        filename = f"{name}{ext}"
+        
+        save_dir = os.path.join(config.DOWNLOAD_DIR, folder_name)
+        os.makedirs(save_dir, exist_ok=True)
+        return filename, os.path.join(save_dir, filename)
+
+    @staticmethod
+    def _reusable_file(file_path, headers, expected_size=None):
+        """
+        최종 경로에 이미 있는 파일을 다시 받지 않고 써도 되는지 확인합니다.
+        매니페스트 크기(expected_size)나 응답 Content-Length(압축 전송이 아닐 때)와 크기가 달라야 다시 받으므로,
+        .part 처리 이전 버전이 남긴 잘린 파일도 교체됩니다.
+        """
+        if not os.path.isfile(file_path):
+            return False
+        size = os.path.getsize(file_path)
+        expected = [] if expected_size is None else [expected_size]
+        content_length = headers.get("Content-Length")
+        if content_length and headers.get("Content-Encoding", "identity") == "identity":
+            expected.append(int(content_length))
+        if any(size != value for value in expected):
+            logger.warning(f"기존 파일 크기 불일치, 다시 받습니다: {file_path} ({size} 바이트)")
+            return False
+        return True
+
+    def _stream_to_file(self, response, url, file_path):
+        """
+        응답 본문을 file_path + '.part'에 기록한 뒤 blob 저장소를 거쳐 file_path에 연결합니다.
+        이전에 중단된 .part 파일이 있으면 Range 요청으로 이어받고,
+        서버가 Range를 지원하지 않으면(200 응답) 처음부터 다시 받습니다.
+        Content-Length와 실제 크기가 다르면 .part를 남겨 두고 예외를 발생시킵니다.
+        Returns:
+            str: 파일의 SHA-256 (blob 저장 시 계산한 값)
+        """
+        part_path = file_path + ".part"
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        if offset > 0:
+            response.close()
+            response = self._get(url, stage="attachment", stream=True, headers={"Range": f"bytes={offset}-"})
+            if response.status_code == 416:
+                # 요청 범위가 파일 크기를 넘음: 임시 파일이 손상된 것으로 보고 처음부터 다시 받음
+                response.close()
+                os.remove(part_path)
+                offset = 0
+                response = self._get(url, stage="attachment", stream=True)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 스크립트에서 날짜 추출
-            script_dates = self._extract_dates_from_script(soup)
-            
-            # 링크 찾기 및 인덱스 매핑
-            # 스크립트의 인덱스(_0, _1...)는 .board_list 내의 순서와 일치함
-            links = soup.select('.board_list .toggle > a[onclick^="fn_detail"]')
 
-            items = []
-            seen_page_ids = set()
+        mode = 'wb'
+        if response.status_code == 206:
+            # Content-Range: bytes START-END/TOTAL
+            match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get("Content-Range", ""))
+            if not match or int(match.group(1)) != offset:
+                response.close()
+                os.remove(part_path)
+                raise IOError("이어받기 응답의 범위가 요청과 다릅니다")
+            mode = 'ab'
+            logger.info(f"이어받기: {os.path.basename(file_path)} ({offset} 바이트부터)")
+        else:
+            offset = 0
 
-            for idx, link in enumerate(links):
-                onclick = link['onclick']
-                match = re.search(r"fn_detail\((\d+)\)", onclick)
-                if not match:
-                    continue
-                ntt_id = match.group(1)
+        # 압축 전송 시 Content-Length는 압축된 크기이므로 검증하지 않음
+        expected = None
+        content_length = response.headers.get("Content-Length")
+        if content_length and response.headers.get("Content-Encoding", "identity") == "identity":
+            expected = offset + int(content_length)
 
-                if ntt_id in seen_page_ids:
-                    continue
-                seen_page_ids.add(ntt_id)
+        received = 0
+        with self.metrics.timer('attachment_download_seconds'), response, open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=config.DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                received += len(chunk)
+        self.metrics.inc('attachment_bytes_total', received)
 
-                # 날짜 가져오기: 스크립트 매핑 우선
-                date_str = script_dates.get(idx, "")
-                
-                # HTML 백업 (혹시 모를 상황 대비)
-                if not date_str:
-                    li = link.find_parent('div', class_='toggle')
-                    if li:
-                        date_div = li.find('div', class_='date')
-                        if date_div:
-                            date_str = date_div.get_text(strip=True).replace('등록일', '').strip()
+        actual = os.path.getsize(part_path)
+        if expected is not None and actual != expected:
+            raise IOError(f"다운로드 크기 불일치 (예상 {expected}, 실제 {actual}), 다음 실행 시 이어받습니다")
 
-                if not date_str:
-                    date_str = datetime.now().strftime("%Y-%m-%d")
+        return blob_store.store_file(part_path, file_path)
 
-                items.append((ntt_id, date_str))
+    def _attachment_url(self, atch_no, file_ord):
+        return f"{config.BASE_URL}/ssm/file/fileDown.do?atchFileNo={atch_no}&fileOrd={file_ord}&fileBtn=A"
 
-            return items
-            
+    def _fetch_attachment(self, atch_no, file_ord, folder_name, ntt_id="", date_str=""):
+        """
+        첨부파일 확보: 매니페스트에 완료 기록이 있고 파일 크기가 일치하면
+        네트워크 요청 없이 기존 파일을 사용하고, 아니면 다운로드 후 매니페스트에 기록합니다.
+        다운로드에 실패하면 게시글 번호(ntt_id)/등록일과 함께 실패 목록에 기록합니다.
+        """
+        existing = self._existing_attachment(atch_no, file_ord, folder_name)
+        if existing:
+            return existing
+
+        url = self._attachment_url(atch_no, file_ord)
+        try:
+            fname, fpath, sha256 = self._download_attachment(url, folder_name, self._manifest_size(atch_no, file_ord))
+        except Exception as e:
+            self._attachment_failed(atch_no, file_ord, url, e, ntt_id, date_str)
+            return None, None
+
+        self._attachment_done(atch_no, file_ord, fname, fpath, sha256)
+        return fname, fpath
+
+    def _manifest_size(self, atch_no, file_ord):
+        """매니페스트에 기록된 첨부파일 크기 (기록이 없으면 None)"""
+        entry = self.store.get_attachment(atch_no, file_ord)
+        return entry['size'] if entry else None
+
+    def _existing_attachment(self, atch_no, file_ord, folder_name):
+        """매니페스트에 완료 기록이 있고 파일(또는 blob)이 남아 있으면 (파일명, 경로), 아니면 None"""
+        entry = self.store.get_attachment(atch_no, file_ord)
+        if entry:
+            # 현재 폴더 규칙의 경로를 우선 확인하고, 없으면 기록된 경로 확인 (폴더명 변경 대비)
+            candidates = [
+                os.path.join(config.DOWNLOAD_DIR, folder_name, entry['filename']),
+                os.path.join(config.BASE_DIR, entry['file_path'])
+            ]
+            for path in candidates:
+                if os.path.isfile(path) and os.path.getsize(path) == entry['size']:
+                    self.metrics.inc('attachments_total', result='existing')
+                    return entry['filename'], path
+
+            # 게시글 폴더에서 지워졌더라도 blob이 남아 있으면 다시 연결
+            expected_path = candidates[0]
+            if blob_store.restore_file(entry['sha256'], expected_path):
+                self.metrics.inc('attachments_total', result='restored')
+                return entry['filename'], expected_path
+        return None
+
+    def _attachment_done(self, atch_no, file_ord, fname, fpath, sha256=None):
+        """다운로드 완료를 매니페스트에 기록 (sha256: blob 저장 시 계산한 값, 없으면 파일을 읽어 계산)"""
+        self.metrics.inc('attachments_total', result='downloaded')
+        self.store.record_attachment(
+            atch_no, file_ord, fname,
+            os.path.relpath(fpath, config.BASE_DIR),
+            os.path.getsize(fpath),
+            sha256 or utils.file_sha256(fpath)
+        )
+
+    def _attachment_failed(self, atch_no, file_ord, url, error, ntt_id="", date_str=""):
+        """다운로드 실패를 로그와 실패 목록에 기록"""
+        logger.error(f"파일 다운로드 실패 ({url}): {error}")
+        self.metrics.inc('attachments_total', result='failed')
+        self._record_failure('attachment', store.attachment_key(atch_no, file_ord), error, ntt_id, date_str)
+
+    def _record_failure(self, kind, item_key, error, ntt_id="", date_str=""):
+        """
+        실패 항목을 저장소의 실패 목록에 기록 (--retry-failed 재시도 대상)
+        오프라인 모드의 실패는 캐시에 없는 응답일 뿐이므로 기록하지 않습니다.
+        """
+        if self.offline:
+            return
+        self.store.record_failure(kind, item_key, f"{type(error).__name__}: {error}", ntt_id=ntt_id, reg_date=date_str)
+        self.metrics.inc('failures_recorded_total', kind=kind)
+
+    def _remote_size(self, atch_no, file_ord):
+        """
+        서버의 첨부파일 크기 (알 수 없으면 None). 본문을 받지 않도록 HEAD로 확인하고,
+        서버가 HEAD를 거부하면(405/501) 첫 1바이트만 요청해 Content-Range의 전체 크기를 읽습니다.
+        """
+        url = self._attachment_url(atch_no, file_ord)
+        response = self._request("HEAD", url, stage="attachment", allow_redirects=True)
+        if response.status_code not in (405, 501):
+            response.raise_for_status()
+            length = response.headers.get('Content-Length')
+            return int(length) if length is not None else None
+
+        with self._get(url, stage="attachment", stream=True, headers={'Range': 'bytes=0-0'}) as response:
+            response.raise_for_status()
+            if response.status_code == 206:
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                return int(total) if total.isdigit() else None
+            # Range를 무시하고 전체를 보내는 서버: 본문은 읽지 않고 닫음
+            length = response.headers.get('Content-Length')
+            return int(length) if length is not None else None
+
+    def verify_attachments(self):
+        """
+        매니페스트의 파일 크기를 서버의 첨부파일 크기와 일괄 비교합니다.
+        로컬 파일이 없거나 크기가 다른 항목은 매니페스트에서 제거하여 다음 수집 때 다시 받도록 합니다.
+        (HEAD로 크기만 확인하고 본문은 받지 않음)
+        """
+        def check(entry):
+            atch_no, file_ord, filename, file_path, size = entry
+            local_path = os.path.join(config.BASE_DIR, file_path)
+            if not os.path.isfile(local_path) or os.path.getsize(local_path) != size:
+                return entry, "로컬 파일 없음 또는 크기 불일치"
+            try:
+                length = self._remote_size(atch_no, file_ord)
+            except Exception as e:
+                logger.warning(f"첨부파일 확인 실패 ({filename}): {e}")
+                return entry, None
+            if length is not None and length != size:
+                return entry, f"크기 불일치 (로컬 {size}, 서버 {length})"
+            return entry, None
+
+        entries = self.store.iter_attachments()
+        logger.info(f"첨부파일 검증 시작: {len(entries)}건")
+        mismatched = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for entry, problem in tqdm(executor.map(check, entries), total=len(entries), desc="첨부파일 검증"):
+                if problem:
+                    mismatched += 1
+                    logger.warning(f"첨부파일 재다운로드 필요: {entry[3]} - {problem}")
+                    self.store.remove_attachment(entry[0], entry[1])
+
+        logger.info(f"첨부파일 검증 완료: {len(entries)}건 중 {mismatched}건 불일치")
+        return mismatched
+
+    def get_list_page(self, page):
+        """목록 페이지 파싱 (실패하면 실패 목록에 기록하고 빈 목록 반환)"""
+        try:
+            return self._fetch_list_page(page)
         except Exception as e:
             logger.error(f"목록 페이지 {page} 로드 실패: {e}")
+            self._record_failure('list', page, e)
             return []
 
+    def _fetch_list_page(self, page):
+        """목록 페이지 수집/파싱 (실패 시 예외 발생)"""
+        response = self._get(self.board.list_url(page), stage="list")
+        response.raise_for_status()
+        items = self._list_items(response.text)
+        if not self.offline:
+            self.store.resolve_failure('list', page)
+        return items
+
+    def _locate_list_page(self, page):
+        """
+        페이지 탐색용 목록 수집. 받지 못한 페이지를 빈 페이지(목록 끝)로 보면 수집 구간이 잘리므로
+        config.LOCATE_ATTEMPTS번까지 다시 시도하고, 그래도 실패하면 예외를 발생시킵니다.
+        """
+        for attempt in range(1, config.LOCATE_ATTEMPTS + 1):
+            try:
+                return self._fetch_list_page(page)
+            except Exception as e:
+                if attempt >= config.LOCATE_ATTEMPTS:
+                    self._record_failure('list', page, e)
+                    raise RuntimeError(f"목록 페이지 {page}를 받지 못해 수집 구간을 찾을 수 없습니다: {e}") from e
+                logger.warning(f"목록 페이지 {page} 로드 실패 ({attempt}/{config.LOCATE_ATTEMPTS}), 다시 시도합니다: {e}")
+                time.sleep(config.BACKOFF_FACTOR * attempt)
+
+    def _list_items(self, html):
+        """목록 페이지 HTML -> [(번호, 등록일)] (등록일이 없으면 오늘 날짜)"""
+        with self.metrics.timer('parse_seconds', kind='list'):
+            parsed_items = parsers.parse_list_page(html, selectors=self.board.selectors)
+
+        items = []
+        for ntt_id, date_str in parsed_items:
+            if not date_str:
+                date_str = datetime.now().strftime("%Y-%m-%d")
+            items.append((ntt_id, date_str))
+        return items
+
+    def _page_date_range(self, page):
+        """
+        목록 페이지의 (가장 최근, 가장 오래된) 등록일을 반환합니다.
+        게시글이 없는 페이지면 None (정상적으로 받은 빈 페이지만 해당, 받지 못하면 예외).
+        받은 목록은 수집 시 재사용하도록 보관합니다.
+        """
+        if page not in self._list_cache:
+            self._list_cache[page] = self._locate_list_page(page)
+
+        dates = [utils.parse_date(date_str) for _, date_str in self._list_cache[page]]
+        dates = [dt for dt in dates if dt]
+        if not dates:
+            return None
+        return max(dates), min(dates)
+
+    def _first_page_where(self, predicate):
+        """
+        predicate(날짜 범위)가 처음으로 참이 되는 목록 페이지 번호를 찾습니다.
+        목록은 최신순이므로 predicate는 페이지 번호에 대해 단조(거짓 -> 참)여야 하며,
+        빈 페이지(목록 끝)는 참으로 취급합니다.
+        지수 탐색으로 상한을 찾은 뒤 이진 탐색하므로 O(log 페이지 수)번만 요청합니다.
+        """
+        def holds(page):
+            date_range = self._page_date_range(page)
+            return date_range is None or predicate(date_range)
+
+        if holds(1):
+            return 1
+
+        # 지수 탐색: holds(lo)는 거짓, holds(hi)는 참인 구간 찾기
+        lo, hi = 1, 2
+        while not holds(hi):
+            lo, hi = hi, hi * 2
+
+        # 이진 탐색
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if holds(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def locate_pages(self, date_from, date_to=None):
+        """
+        등록일 범위 [date_from, date_to]에 해당하는 첫/마지막 목록 페이지를 찾습니다.
+        Returns:
+            tuple: (시작 페이지, 마지막 페이지)
+        """
+        if date_to is None:
+            start_page = 1
+        else:
+            # 가장 오래된 글이 date_to 이하인 첫 페이지
+            start_page = self._first_page_where(lambda r: r[1] <= date_to)
+
+        # 가장 최근 글도 date_from 이전인 첫 페이지의 직전 페이지
+        end_page = max(start_page, self._first_page_where(lambda r: r[0] < date_from) - 1)
+
+        logger.info(f"기간 {date_from:%Y-%m-%d} ~ {date_to or datetime.now():%Y-%m-%d}: "
+                    f"목록 페이지 {start_page} ~ {end_page} (탐색 요청 {len(self._list_cache)}회)")
+        return start_page, end_page
+
+    def _detail_url(self, ntt_id):
+        return self.board.detail_url(ntt_id)
+
+    def fetch_detail(self, ntt_id):
+        """
+        상세 페이지 원본 수집 (네트워크 I/O만 수행)
+        Returns:
+            tuple: (url, 본문 bytes, 인코딩)
+        """
+        url = self._detail_url(ntt_id)
+        response = self._get(url, stage="detail")
+        # Response.text와 같은 디코딩 규칙 (헤더에 charset이 없으면 내용으로 추정)
+        return url, response.content, response.encoding or response.apparent_encoding
+
     def get_detail_page(self, ntt_id, date_str):
         """상세 페이지 파싱"""
-        url = f"{config.BASE_URL}/bbs/view.do?sCode=user&mPid=208&mId=307&bbsSeqNo=94&nttSeqNo={ntt_id}"
-        
         try:
-            response = self.session.get(url, timeout=config.TIMEOUT)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 제목
-            title_elem = soup.select_one('.view_head h2')
-            title = utils.clean_text(title_elem.get_text()) if title_elem else f"제목없음_{ntt_id}"
-            
-            # 부서
-            dept = ""
-            for dt in soup.select('.tit_con dt'):
-                if "부서" in dt.get_text():
-                    dd = dt.find_next_sibling('dd')
-                    if dd:
-                        dept = utils.clean_text(dd.get_text())
-                    break
-            
-            # 본문
-            content_div = soup.select_one('.board_notcon') or soup.select_one('.board_pc')
-            content = utils.clean_text(content_div.get_text()) if content_div else ""
-            
-            # 요약
-            summary = utils.summarize_text(content)
-            
-            # 첨부파일 처리
-            attachments = []
-            file_paths = []
-            
-            # JS 다운로드 패턴: fn_download('atch_no', 'file_ord', 'ext')
-            download_scripts = re.findall(r"fn_download\('(\d+)',\s*'(\d+)',\s*'([^']+)'\)", response.text)
-            downloaded_set = set()
-            
-            title_clean = re.sub(r'[\\\\/*?:\"<>|]', '', title)
-            folder_name = f"{date_str}_{title_clean[:30].strip()}"
-            
-            for atch_no, file_ord, _ in download_scripts:
-                down_url = f"{config.BASE_URL}/ssm/file/fileDown.do?atchFileNo={atch_no}&fileOrd={file_ord}&fileBtn=A"
-                if down_url in downloaded_set:
-                    continue
-                    
-                fname, fpath = self.download_attachment(down_url, folder_name)
-                if fname:
-                    attachments.append(fname)
-                    # 절대 경로를 상대 경로로 변환 (프로젝트 루트 기준)
-                    rel_path = os.path.relpath(fpath, config.BASE_DIR)
-                    file_paths.append(rel_path)
-                    downloaded_set.add(down_url)
-            
-            # 첨부파일 경로를 하이퍼링크 수식으로 변환
-            # 엑셀 파일(data 폴더) 기준 상대 경로로 변환 필요
-            # rel_path는 현재 프로젝트 루트 기준임 (downloads/...)
-            # data 폴더 내부에서 downloads로 가려면 ../downloads/...
-            
-            if file_paths:
-                # 첫 번째 파일 기준 폴더 경로
-                # file_paths[0] = downloads\folder\file
-                folder_path_rel_project = os.path.dirname(file_paths[0]) # downloads\folder
-                folder_path_rel_excel = os.path.join("..", folder_path_rel_project)
-                
-                display_text = f"📂 폴더 열기 ({', '.join(attachments)})"
-                if len(display_text) > 200:
-                    display_text = f"📂 폴더 열기 ({len(attachments)}개 파일)"
-                    
-                hyperlink = f'=HYPERLINK("{folder_path_rel_excel}", "{display_text}")'
-                
-                # file_paths 리스트 대신 수식 문자열 저장
-                # 주의: 리스트가 아니라 문자열로 저장됨
-                final_paths = hyperlink
-            else:
-                final_paths = ""
-
-            return {
-                '번호': ntt_id,
-                '제목': title,
-                '등록일': date_str,
-                '부서': dept,
-                '상세URL': url,
-                '본문': content,
-                '핵심요약': summary,
-                '첨부파일목록': ", ".join(attachments),
-                '첨부파일경로': final_paths
-            }
-            
+            url, content, encoding = self.fetch_detail(ntt_id)
+            _, parsed = parsers.parse_detail_job((None, ntt_id, content, encoding, self.board.selectors))
+            return self.build_record(ntt_id, date_str, url, parsed)
         except Exception as e:
             logger.error(f"상세 페이지 {ntt_id} 파싱 실패: {e}")
+            self._record_failure('detail', ntt_id, e, date_str=date_str)
             return None
 
+    def build_record(self, ntt_id, date_str, url, parsed):
+        """
+        파싱 결과로 첨부파일을 받고 레코드를 구성합니다.
+        parsed: parsers.parse_detail_job 결과 (title, dept, content, summary, downloads)
+        """
+        self.metrics.observe('parse_seconds', parsed['parse_seconds'], kind='detail')
+
+        # 첨부파일 처리
+        attachments = []
+        file_paths = []
+        
+        download_scripts = parsed['downloads']
+        downloaded_set = set()
+        folder_name = self._attachment_folder(parsed['title'], date_str)
+        
+        for atch_no, file_ord, _ in download_scripts:
+            down_url = self._attachment_url(atch_no, file_ord)
+            if down_url in downloaded_set:
+                continue
+                
+            fname, fpath = self._fetch_attachment(atch_no, file_ord, folder_name, ntt_id, date_str)
+            if fname:
+                attachments.append(fname)
+                # 절대 경로를 상대 경로로 변환 (프로젝트 루트 기준)
+                rel_path = os.path.relpath(fpath, config.BASE_DIR)
+                file_paths.append(rel_path)
+                downloaded_set.add(down_url)
+
+        return self._compose_record(ntt_id, date_str, url, parsed, attachments, file_paths)
+
+    @staticmethod
+    def _attachment_folder(title, date_str):
+        """게시글 첨부파일 폴더명 (등록일_제목 앞 30자)"""
+        title_clean = re.sub(r'[\\\\/*?:\"<>|]', '', title)
+        return f"{date_str}_{title_clean[:30].strip()}"
+
+    def _compose_record(self, ntt_id, date_str, url, parsed, attachments, file_paths):
+        """
+        파싱 결과와 받은 첨부파일(파일명, 프로젝트 루트 기준 경로)로 레코드 구성
+        첨부파일이 있으면 폴더 하이퍼링크를 만들고 마이그레이션 대상에 추가합니다.
+        """
+        title = parsed['title']
+        
+        # 첨부파일 경로를 하이퍼링크 수식으로 변환
+        # 엑셀 파일(data 폴더) 기준 상대 경로로 변환 필요
+        # rel_path는 현재 프로젝트 루트 기준임 (downloads/...)
+        # data 폴더 내부에서 downloads로 가려면 ../downloads/...
+        
+        if file_paths:
+            # 첫 번째 파일 기준 폴더 경로
+            # file_paths[0] = downloads\folder\file
+            folder_path_rel_project = os.path.dirname(file_paths[0]) # downloads\folder
+            folder_path_rel_excel = os.path.join("..", folder_path_rel_project)
+            
+            display_text = f"📂 폴더 열기 ({', '.join(attachments)})"
+            if len(display_text) > 200:
+                display_text = f"📂 폴더 열기 ({len(attachments)}개 파일)"
+                
+            hyperlink = f'=HYPERLINK("{folder_path_rel_excel}", "{display_text}")'
+            self.changed_folders[ntt_id] = (os.path.basename(folder_path_rel_project), title, date_str)
+            
+            # file_paths 리스트 대신 수식 문자열 저장
+            # 주의: 리스트가 아니라 문자열로 저장됨
+            final_paths = hyperlink
+        else:
+            final_paths = ""
+
+        return {
+            '번호': ntt_id,
+            '제목': title,
+            '등록일': date_str,
+            '부서': parsed['dept'],
+            '상세URL': url,
+            '본문': parsed['content'],
+            '핵심요약': parsed['summary'],
+            '첨부파일목록': ", ".join(attachments),
+            '첨부파일경로': final_paths
+        }
+
+    def save_record(self, data):
+        """
+        완료된 레코드 1건을 바로 저장소에 커밋합니다.
+        페이지가 끝나기 전에 중단(Ctrl-C, 오류, 강제 종료)되어도 이미 받은 게시글은 다시 수집하지 않습니다.
+        """
+        with self.metrics.timer('save_seconds'):
+            self.store.upsert_records([data], source=os.path.basename(self.output_file))
+        self.metrics.inc('records_saved_total')
+        self.seen_ids.add(str(data['번호']))
+        if self.parquet is not None:
+            self._parquet_buffer.append(data)
+
     def save_data(self):
-        """데이터 저장"""
+        """데이터 저장 (저장소에 번호 기준 upsert, 새 레코드 수에 비례하는 비용)"""
         if not self.collected_data:
             return
 
-        new_df = pd.DataFrame(self.collected_data)
-        
-        if os.path.exists(self.output_file):
-            try:
-                old_df = pd.read_excel(self.output_file)
-                # 번호 기준 중복 제거 후 병합
-                combined_df = pd.concat([old_df, new_df]).drop_duplicates(subset=['번호'], keep='last')
-                try:
-                    combined_df.to_excel(self.output_file, index=False, engine='openpyxl')
-                except PermissionError:
-                    # 파일이 열려있어서 저장이 안되는 경우
-                    new_filename = self.output_file.replace(".xlsx", f"_backup_{datetime.now().strftime('%H%M%S')}.xlsx")
-                    logger.warning(f"파일이 열려있어 저장할 수 없습니다. 백업 파일로 저장합니다: {new_filename}")
-                    combined_df.to_excel(new_filename, index=False, engine='openpyxl')
-            except Exception as e:
-                logger.error(f"데이터 병합 저장 중 오류: {e}")
-                # 병합 실패 시 현재 데이터라도 따로 저장
-                new_filename = self.output_file.replace(".xlsx", f"_partial_{datetime.now().strftime('%H%M%S')}.xlsx")
-                new_df.to_excel(new_filename, index=False, engine='openpyxl')
-        else:
-            try:
-                new_df.to_excel(self.output_file, index=False, engine='openpyxl')
-            except PermissionError:
-                new_filename = self.output_file.replace(".xlsx", f"_new_{datetime.now().strftime('%H%M%S')}.xlsx")
-                logger.warning(f"파일이 열려있어 저장할 수 없습니다. 새 파일로 저장합니다: {new_filename}")
-                new_df.to_excel(new_filename, index=False, engine='openpyxl')
-            
-        logger.info(f"데이터 저장 완료: {self.output_file}")
+        with self.metrics.timer('save_seconds'):
+            self.store.upsert_records(self.collected_data, source=os.path.basename(self.output_file))
+        self.metrics.inc('records_saved_total', len(self.collected_data))
+        logger.info(f"데이터 저장 완료: {len(self.collected_data)}건 ({self.store.path})")
+        if self.parquet is not None:
+            self._parquet_buffer.extend(self.collected_data)
+
         # 메모리 정리
         self.collected_data = []
 
-    def run(self, start_page=1, test_mode=False):
-        logger.info(f"수집 시작 (대상 연도: {self.target_year}년 이상)")
+    def export_excel(self, output_file=None, whole_store=False, split=None):
+        """
+        저장소의 레코드를 엑셀로 내보냅니다 (스트리밍 방식).
+        기본은 해당 파일에 기록됐거나 이 파일로 저장한(다시 수집한 게시글 포함) 레코드만,
+        whole_store=True이면 저장소 전체를 내보냅니다.
+        split: 'year' 또는 'month'이면 등록일 기준으로 파일 분할
+        """
+        output_file = output_file or self.output_file
+        file_name = None if whole_store else os.path.basename(output_file)
+        with self.metrics.timer('export_seconds'):
+            written = exporter.export_store(self.store, output_file, file_name=file_name, split=split)
+        # 저장소에 이미 있는 내용이므로 다음 실행 시 다시 읽지 않음
+        for path in written:
+            self.store.mark_file_indexed(path)
+        return written
+
+    def flush_parquet(self, records=None, collected_on=config.TODAY_STR):
+        """
+        모아 둔 레코드(records를 주면 해당 레코드)를 Parquet 파티션에 새 파일로 추가합니다.
+        Parquet은 저장소의 사본이므로 실패해도 수집은 계속하고, --export-parquet로 다시 만들 수 있습니다.
+        """
+        if self.parquet is None:
+            return
+        if records is None:
+            records, self._parquet_buffer = self._parquet_buffer, []
+        if not records:
+            return
+        try:
+            with self.metrics.timer('parquet_write_seconds'):
+                self._parquet_partitions |= self.parquet.append(records, collected_on)
+        except Exception as e:
+            logger.error(f"Parquet 기록 실패 ({len(records)}건): {e}")
+
+    def compact_parquet(self, partitions=None):
+        """이번 실행에서 기록한 파티션(partitions를 주면 해당 파티션)의 파일을 하나로 합침"""
+        if self.parquet is None:
+            return
+        if partitions is None:
+            partitions, self._parquet_partitions = sorted(self._parquet_partitions), set()
+        try:
+            with self.metrics.timer('parquet_compact_seconds'):
+                merged = self.parquet.compact(partitions)
+        except Exception as e:
+            logger.error(f"Parquet 파티션 병합 실패: {e}")
+            return
+        if merged:
+            logger.info(f"Parquet 파티션 {merged}개 병합 ({self.parquet.root})")
+
+    def export_parquet(self):
+        """저장소 전체 레코드로 Parquet 데이터셋을 다시 만듭니다 (기존 엑셀 이력을 처음 옮길 때 등)"""
+        sink = self.parquet or parquet_sink.ParquetSink(self.board.parquet_dir())
+        with self.metrics.timer('parquet_write_seconds'):
+            count = sink.rebuild(self.store.iter_records(with_collected_on=True))
+        logger.info(f"Parquet 내보내기 완료: {count}건 ({sink.root})")
+        return count
+
+    def _begin_run(self):
+        """
+        이전 실행의 중단 복구 후 실행 중 표시 (정상 종료 전에 중단되면 다음 실행에서 엑셀을 다시 내보냄)
+        분산 수집 워커는 저장소를 공유하는 코디네이터의 표시를 건드리지 않도록 호출하지 않습니다.
+        """
+        self._recover_interrupted_run()
+        self.store.set_meta('active_run', json.dumps(
+            {'output_file': self.output_file, 'collected_on': config.TODAY_STR}, ensure_ascii=False
+        ))
+
+    def _finish_run(self):
+        """정상 종료: 남은 Parquet 기록 후 파티션 병합, 실행 중 표시를 지우고 WAL 로그를 DB 파일에 반영"""
+        self.flush_parquet()
+        self.compact_parquet()
+        self.store.set_meta('active_run', None)
+        self.store.checkpoint()
+
+    def _recover_interrupted_run(self):
+        """
+        이전 실행이 엑셀 내보내기 전에 중단되었으면, 저장소에 커밋된 레코드로 해당 엑셀을 다시 내보냅니다.
+        원본이 열려 있어 대체 파일(_backup_ 등)로 흩어진 내보내기도 원본으로 합칩니다.
+        """
+        active_run = self.store.get_meta('active_run')
+        if active_run:
+            run_info = json.loads(active_run)
+            file_name = os.path.basename(run_info['output_file'])
+            count = self.store.count_records(file_name)
+            logger.warning(f"이전 실행이 중단되었습니다. 저장된 {count}건으로 엑셀을 다시 내보냅니다.")
+            self.export_excel(run_info['output_file'])
+            # 기록 전에 중단된 Parquet 분량도 다시 추가 (이미 기록된 번호는 병합/읽기에서 중복 제거)
+            self.flush_parquet(list(self.store.iter_records(file_name)), run_info['collected_on'])
+            self._finish_run()
+
+        for path in exporter.merge_stray_exports(self.store, config.DATA_DIR):
+            self.store.mark_file_indexed(path)
+
+    def migrate_changes(self, export=True):
+        """
+        이번 실행에서 첨부파일을 받은 폴더만 마이그레이션하고,
+        변경된 폴더명을 저장소(첨부파일경로, 매니페스트)와 오늘 엑셀(export=True일 때)에 반영합니다.
+        비용은 전체 이력이 아니라 새로 수집한 데이터 양에 비례합니다.
+        """
+        if not self.changed_folders:
+            logger.info("이번 실행에서 변경된 첨부파일 폴더가 없습니다.")
+            return {}
+
+        title_to_date = {}
+        folder_ids = {}
+        for ntt_id, (folder_name, title, date_str) in self.changed_folders.items():
+            migrate_folders.add_title_date(title_to_date, title, date_str)
+            folder_ids.setdefault(folder_name, []).append(ntt_id)
+
+        renamed = migrate_folders.migrate_folders(folder_names=list(folder_ids), title_to_date=title_to_date)
+        for old_folder, new_folder in renamed.items():
+            self.store.rename_attachment_folder(old_folder, new_folder, folder_ids[old_folder])
+
+        if renamed and export:
+            self.export_excel()
+        if renamed and self.parquet is not None:
+            # 바뀐 첨부파일경로를 Parquet에도 반영 (같은 번호의 이전 행은 병합 시 제거,
+            # 분산 수집 워커는 병합하지 않음: 코디네이터가 종료 시 병합)
+            renamed_ids = {str(ntt_id) for old_folder in renamed for ntt_id in folder_ids[old_folder]}
+            self.flush_parquet([record for record in self.store.iter_records(os.path.basename(self.output_file))
+                                if str(record['번호']) in renamed_ids])
+            if export:
+                self.compact_parquet()
+        self.changed_folders = {}
+        return renamed
+
+    def apply_folder_renames(self, renamed):
+        """
+        전체 마이그레이션(--full-migrate)의 폴더명 변경을 저장소(첨부파일경로, 매니페스트)에 반영합니다.
+        엑셀 파일은 migrate_folders가 직접 갱신하므로, 저장소에서 다시 내보내도 이전 경로로 돌아가지 않게 합니다.
+        """
+        changed_ids = set()
+        for old_folder, new_folder in renamed.items():
+            changed_ids.update(self.store.rename_attachment_folder(old_folder, new_folder))
+        if changed_ids and self.parquet is not None:
+            self.flush_parquet([record for record in self.store.iter_records() if record['번호'] in changed_ids])
+            self.compact_parquet()
+        if changed_ids:
+            logger.info(f"폴더명 변경 {len(renamed)}건을 저장소에 반영했습니다 (게시글 {len(changed_ids)}건)")
+        return changed_ids
+
+    def _rate_report(self):
+        """적응형 속도 제어 요약 (고정 속도면 None)"""
+        if not isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            return None
+        return {
+            'final_rate': round(self.limiter.rate, 3),
+            'lowest_rate': round(self.limiter.lowest_rate, 3),
+            'highest_rate': round(self.limiter.highest_rate, 3),
+            'min_rate': self.limiter.min_rate,
+            'max_rate': self.limiter.max_rate,
+            'events': dict(self.limiter.events),
+        }
+
+    def write_report(self, report_path=None, prometheus_path=None):
+        """
+        실행 보고서(JSON)와 선택적으로 Prometheus textfile을 기록합니다.
+        계측이 비활성화되어 있으면 아무것도 하지 않습니다.
+        """
+        if not self.metrics.enabled:
+            return None
+
+        download_seconds = self.metrics.histogram_sum('attachment_download_seconds')
+        attachment_bytes = self.metrics.total('attachment_bytes_total')
+        extra = {
+            'target_year': self.target_year,
+            'date_from': f"{self.date_from:%Y-%m-%d}",
+            'date_to': f"{self.date_to:%Y-%m-%d}" if self.date_to else None,
+            'workers': self.workers,
+            'parse_workers': self.parse_workers,
+            'requests_per_second': self.limiter.rate,
+            'rate_control': self._rate_report(),
+            'offline': self.offline,
+            'test_mode': self.test_mode,
+            'output_file': self.output_file,
+            'board': self.board.key,
+            'boards': list(self.scheduler.keys),
+            'records_saved': self.metrics.total('records_saved_total'),
+            'pending_failures': self.store.count_failures(),
+            'attachment_bytes_per_second': round(attachment_bytes / download_seconds, 1) if download_seconds else None,
+        }
+        board_suffix = "" if self.board.is_default else f"_{self.board.key}"
+        # 같은 초에 끝난 코디네이터/워커 프로세스끼리 덮어쓰지 않도록 PID를 붙임
+        report_path = report_path or os.path.join(
+            config.REPORT_DIR, f"run_report{board_suffix}_{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}.json"
+        )
+        self.metrics.write_json(report_path, extra)
+        logger.info(f"실행 보고서 저장: {report_path}")
+
+        if prometheus_path:
+            self.metrics.write_prometheus(prometheus_path)
+            logger.info(f"Prometheus 지표 저장: {prometheus_path}")
+        return report_path
+
+    def _collect_detail(self, candidate):
+        """상세 수집 단위 작업 (순차/동시 모드 공용)"""
+        idx, total, ntt_id, date_str = candidate
+        # 진행 상황 로그 (터미널 출력용)
+        tqdm.write(f"  - [{idx+1}/{total}] 상세 수집 중: {ntt_id} ({date_str})")
+        return self.get_detail_page(ntt_id, date_str)
+
+    def _fetch_stage(self, candidate):
+        """파이프라인 1단계 (스레드): 상세 페이지 원본 수집"""
+        idx, total, ntt_id, date_str = candidate
+        tqdm.write(f"  - [{idx+1}/{total}] 상세 수집 중: {ntt_id} ({date_str})")
+        url, content, encoding = self.fetch_detail(ntt_id)
+        return (candidate, url), ntt_id, content, encoding, self.board.selectors
+
+    def _record_stage(self, job):
+        """파이프라인 3단계 (스레드): 첨부파일 수집 및 레코드 구성"""
+        (candidate, url), parsed = job
+        _, _, ntt_id, date_str = candidate
+        return self.build_record(ntt_id, date_str, url, parsed)
+
+    def _pipeline_details(self, candidates, executor, parse_executor):
+        """
+        수집(스레드) -> 파싱/요약(프로세스) -> 첨부파일(스레드) 파이프라인
+        진행 중인 항목 수는 config.PARSE_QUEUE_SIZE로 제한됩니다.
+        """
+        stages = [
+            (executor, self._fetch_stage),
+            (parse_executor, parsers.parse_detail_job),
+            (executor, self._record_stage),
+        ]
+        for candidate, future in pipeline.ordered_pipeline(candidates, stages, config.PARSE_QUEUE_SIZE):
+            try:
+                yield future.result()
+            except Exception as e:
+                _, _, ntt_id, date_str = candidate
+                logger.error(f"상세 페이지 {ntt_id} 파싱 실패: {e}")
+                self._record_failure('detail', ntt_id, e, date_str=date_str)
+                yield None
+
+    def _fetch_details(self, candidates, executor=None, parse_executor=None):
+        """
+        후보 목록의 상세 페이지를 수집합니다.
+        동시 모드에서도 결과는 후보 순서대로 반환되므로 저장 순서가 순차 실행과 동일합니다.
+        parse_executor(프로세스 풀)가 있으면 파싱을 네트워크 I/O와 분리된 프로세스에서 수행합니다.
+        """
+        if parse_executor is not None:
+            return self._pipeline_details(candidates, executor, parse_executor)
+        if executor is None:
+            return map(self._collect_detail, candidates)
+        return executor.map(self._collect_detail, candidates)
+
+    @contextmanager
+    def _detail_executors(self):
+        """
+        상세 수집용 (스레드 풀, 프로세스 풀). 순차 모드면 (None, None)
+        파싱 프로세스 풀을 쓰면 수집/첨부파일 단계는 항상 스레드 풀에서 실행
+        """
+        use_threads = self.workers > 1 or self.parse_workers > 0
+        executor = ThreadPoolExecutor(max_workers=self.workers) if use_threads else None
+        parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers > 0 else None
+        try:
+            yield executor, parse_executor
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if parse_executor is not None:
+                parse_executor.shutdown(wait=True)
+
+    def run(self, start_page=1, test_mode=False, sync=False, date_from=None, date_to=None,
+            engine=config.CRAWL_ENGINE, concurrency=config.ASYNC_CONCURRENCY):
+        """
+        engine: "threads" (requests + 스레드 풀) 또는 "async" (async_engine, aiohttp 필요)
+        concurrency: 비동기 엔진의 동시 요청 수 상한
+        """
+        self.test_mode = test_mode
+        # 비동기 엔진은 시작 전에 확인 (aiohttp 미설치, 오프라인 모드)
+        crawl_engine = async_engine.AsyncCrawlEngine(self, concurrency) if engine == "async" else None
+        end_page = None
+        if date_from or date_to:
+            # 기간 지정 시 이진 탐색으로 필요한 목록 페이지 구간만 수집
+            self.date_from = date_from or self.date_from
+            self.date_to = date_to
+            logger.info(f"수집 시작 (기간: {self.date_from:%Y-%m-%d} ~ {date_to or datetime.now():%Y-%m-%d})")
+            start_page, end_page = self.locate_pages(self.date_from, self.date_to)
+        else:
+            logger.info(f"수집 시작 (대상 연도: {self.target_year}년 이상)")
+        multi_board = len(self.scheduler.keys) > 1
+        if multi_board:
+            logger.info(f">> 게시판: {self.board.name} ({self.board.key}), 저장소 {self.store.path}")
         if test_mode:
             logger.info(">> 테스트 모드: 수집 건수가 5건에 도달하면 종료합니다.")
+        if sync:
+            hw_id, hw_date = self.store.get_high_water()
+            logger.info(f">> 동기화 모드: 마지막 수집 번호 {hw_id} ({hw_date}) 이후만 확인합니다.")
+        if crawl_engine is not None:
+            logger.info(f">> 비동기 엔진: 동시 요청 최대 {crawl_engine.concurrency}개, 초당 {self.limiter.rate}건 요청으로 시작")
+        elif self.workers > 1:
+            logger.info(f">> 동시 수집 모드: 워커 {self.workers}개, 초당 {self.limiter.rate}건 요청으로 시작")
+        if self.parse_workers > 0:
+            logger.info(f">> 파싱 프로세스 {self.parse_workers}개 사용")
 
         os.makedirs(config.DATA_DIR, exist_ok=True)
         os.makedirs(config.DOWNLOAD_DIR, exist_ok=True)
         
-        page = start_page
-        stop_flag = False
-        total_collected = 0
-        
         # tqdm 설정
-        pbar = tqdm(desc="페이지 수집", unit="page")
+        pbar = tqdm(desc=f"{self.board.name} 페이지 수집" if multi_board else "페이지 수집", unit="page")
         
+        self._begin_run()
+        try:
+            if crawl_engine is not None:
+                crawl_engine.crawl(start_page, test_mode, pbar, sync, end_page)
+            else:
+                with self._detail_executors() as (executor, parse_executor):
+                    self._crawl_pages(start_page, test_mode, pbar, executor, sync, end_page, parse_executor)
+        finally:
+            pbar.close()
+            # 중단되더라도 수집된 데이터는 저장 후 엑셀로 내보냄
+            # (여기까지 오지 못하고 종료되면 다음 실행 시작 시 내보냄)
+            self.save_data()
+            self.export_excel()
+            self._finish_run()
+        logger.info("수집 종료")
+
+    def retry_failed(self, max_attempts=config.FAILURE_MAX_ATTEMPTS):
+        """
+        실패 목록에 기록된 항목만 다시 수집합니다 (전체 목록을 다시 순회하지 않음).
+        - list: 목록 페이지를 다시 받아 아직 수집하지 않은 게시글을 상세 수집 대상에 추가
+        - detail: 해당 게시글 상세 페이지 재수집
+        - attachment: 해당 게시글 재수집 (받아 둔 첨부파일은 매니페스트로 재사용되므로 실패한 파일만 요청)
+        시도 횟수가 max_attempts에 도달한 항목은 건너뜁니다. 다시 실패하면 시도 횟수가 늘어납니다.
+        Returns:
+            dict: 재시도 항목 수, 복구된 레코드 수, 남은 실패 항목 수(종류별), 시도 횟수 초과 항목 수
+        """
+        failures = self.store.list_failures(max_attempts=max_attempts)
+        exhausted = sum(self.store.count_failures().values()) - len(failures)
+        if exhausted:
+            logger.warning(f"시도 횟수 {max_attempts}회에 도달해 재시도하지 않는 실패 항목: {exhausted}건")
+        if not failures:
+            logger.info("재시도할 실패 항목이 없습니다.")
+            return {'retried': 0, 'recovered': 0, 'remaining': self.store.count_failures(), 'exhausted': exhausted}
+
+        kinds = {}
+        for failure in failures:
+            kinds[failure['kind']] = kinds.get(failure['kind'], 0) + 1
+        logger.info(f"실패 항목 재시도: {len(failures)}건 {kinds}")
+
+        # 다시 수집할 게시글: 번호 -> 등록일 (실패 기록 순서 유지, 중복 제거)
+        targets = {}
+        for failure in failures:
+            if failure['kind'] == 'list':
+                for ntt_id, date_str in self.get_list_page(int(failure['item_key'])):
+                    dt = utils.parse_date(date_str)
+                    if str(ntt_id) in self.seen_ids or (dt and dt < self.date_from):
+                        continue
+                    targets.setdefault(str(ntt_id), date_str)
+            elif failure['kind'] == 'detail':
+                targets.setdefault(failure['item_key'], failure['reg_date'])
+            else:
+                targets.setdefault(failure['ntt_id'], failure['reg_date'])
+
+        candidates = [(idx, len(targets), ntt_id, date_str) for idx, (ntt_id, date_str) in enumerate(targets.items())]
+        recovered = 0
+        self._begin_run()
+        with self._detail_executors() as (executor, parse_executor):
+            try:
+                for data in self._fetch_details(candidates, executor, parse_executor):
+                    self.metrics.inc('details_total', result='ok' if data else 'failed')
+                    if data:
+                        self.save_record(data)
+                        recovered += 1
+            finally:
+                self.export_excel()
+                self._finish_run()
+
+        remaining = self.store.count_failures()
+        logger.info(f"실패 항목 재시도 완료: 게시글 {len(candidates)}건 중 {recovered}건 수집, 남은 실패 항목 {remaining}")
+        return {'retried': len(failures), 'recovered': recovered, 'remaining': remaining, 'exhausted': exhausted}
+
+    def _date_bounds(self):
+        """수집 기간을 매니페스트 조회용 문자열(YYYY-MM-DD)로"""
+        return f"{self.date_from:%Y-%m-%d}", (f"{self.date_to:%Y-%m-%d}" if self.date_to else None)
+
+    def build_manifest(self, date_from=None, date_to=None):
+        """
+        1단계: 기간 내 게시글 (번호, 등록일)을 목록 페이지만으로 모두 열거해 매니페스트에 저장합니다.
+        상세 페이지를 기다리지 않으므로 목록 순회가 밀리지 않으며, 목록 페이지는 --workers 스레드로
+        동시에 받습니다 (전역 속도 제한 공유).
+        Returns:
+            int: 열거된 게시글 수
+        """
+        self.date_from = date_from or self.date_from
+        self.date_to = date_to
+        start_page, end_page = self.locate_pages(self.date_from, self.date_to)
+
+        def fetch(page):
+            return page, self._list_cache.pop(page, None) or self.get_list_page(page)
+
+        pages = range(start_page, end_page + 1)
+        listed = 0
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            results = executor.map(fetch, pages) if executor is not None else map(fetch, pages)
+            with tqdm(total=len(pages), desc="목록 열거", unit="page") as pbar:
+                for page, items in results:
+                    rows = []
+                    for ntt_id, date_str in items:
+                        dt = utils.parse_date(date_str)
+                        if dt and (dt < self.date_from or (self.date_to and dt > self.date_to)):
+                            continue
+                        # 매니페스트 기간 조회는 문자열 비교이므로 YYYY-MM-DD로 통일
+                        rows.append((ntt_id, f"{dt:%Y-%m-%d}" if dt else date_str, page))
+                    self.store.add_manifest(rows)
+                    listed += len(rows)
+                    self.metrics.inc('list_pages_total')
+                    pbar.update(1)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        logger.info(f"1단계 완료: 목록 페이지 {len(pages)}개에서 게시글 {listed}건 열거")
+        return listed
+
+    def backfill(self, date_from=None, date_to=None, enumerate_pages=True):
+        """
+        2단계 백필: 매니페스트를 만든 뒤(enumerate_pages=False면 기존 매니페스트 사용)
+        아직 수집하지 않은 게시글의 상세 페이지/첨부파일만 일괄 수집합니다.
+        전체 작업량을 미리 알기 때문에 진행률과 남은 시간이 정확합니다.
+        Returns:
+            int: 수집한 게시글 수
+        """
+        if enumerate_pages:
+            self.build_manifest(date_from, date_to)
+        else:
+            self.date_from = date_from or self.date_from
+            self.date_to = date_to
+
+        missing = self.store.list_missing(*self._date_bounds())
+        logger.info(f"2단계: 매니페스트 {self.store.count_manifest(*self._date_bounds())}건 중 "
+                    f"미수집 {len(missing)}건 상세 수집")
+        if not missing:
+            return 0
+
+        candidates = [(idx, len(missing), ntt_id, reg_date) for idx, (ntt_id, reg_date, _) in enumerate(missing)]
+        collected = 0
+        self._begin_run()
+        pbar = tqdm(total=len(candidates), desc="상세 수집", unit="건")
+        try:
+            with self._detail_executors() as (executor, parse_executor):
+                for data in self._fetch_details(candidates, executor, parse_executor):
+                    self.metrics.inc('details_total', result='ok' if data else 'failed')
+                    if data:
+                        self.save_record(data)
+                        collected += 1
+                    pbar.update(1)
+        finally:
+            pbar.close()
+            self.export_excel()
+            self._finish_run()
+        logger.info(f"백필 종료: {len(candidates)}건 중 {collected}건 수집")
+        return collected
+
+    def report_missing(self, date_from=None, date_to=None, enumerate_pages=True, output_path=None):
+        """
+        매니페스트와 저장소를 비교해 아직 수집하지 않은 게시글을 월별 건수로 출력하고
+        전체 목록을 CSV(번호, 등록일, 목록 페이지)로 저장합니다. 상세 페이지는 요청하지 않습니다.
+        Returns:
+            list: (번호, 등록일, 목록 페이지) 튜플
+        """
+        if enumerate_pages:
+            self.build_manifest(date_from, date_to)
+        else:
+            self.date_from = date_from or self.date_from
+            self.date_to = date_to
+
+        missing = self.store.list_missing(*self._date_bounds())
+        by_month = {}
+        for _, reg_date, _ in missing:
+            by_month[reg_date[:7]] = by_month.get(reg_date[:7], 0) + 1
+        total = self.store.count_manifest(*self._date_bounds())
+        logger.info(f"미수집 게시글: 매니페스트 {total}건 중 {len(missing)}건")
+        for month in sorted(by_month, reverse=True):
+            logger.info(f"  {month or '날짜 없음'}: {by_month[month]}건")
+
+        output_path = output_path or os.path.join(config.REPORT_DIR, f"missing_{datetime.now():%Y%m%d_%H%M%S}.csv")
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['번호', '등록일', '목록페이지'])
+            writer.writerows(missing)
+        logger.info(f"미수집 목록 저장: {output_path}")
+        return missing
+
+    def run_coordinator(self, queue_path, date_from=None, date_to=None, shard_pages=config.SHARD_PAGES, wait=True):
+        """
+        분산 수집 코디네이터: 수집 기간의 목록 페이지 구간을 작업 큐에 게시합니다.
+        완료되지 않은 작업 큐가 있으면 새로 게시하지 않고 이어서 진행합니다.
+        wait=True이면 모든 작업이 끝날 때까지 진행 상황을 표시한 뒤 (워커들이 공유 저장소에 저장한)
+        오늘 수집분을 엑셀로 내보냅니다.
+        """
+        queue = work_queue.WorkQueue(queue_path)
+        if queue.is_ready() and not queue.is_finished():
+            logger.info(f"진행 중인 작업 큐를 이어서 사용합니다: {queue.progress()}")
+        else:
+            self.date_from = date_from or self.date_from
+            self.date_to = date_to
+            start_page, end_page = self.locate_pages(self.date_from, self.date_to)
+            settings = {
+                'date_from': f"{self.date_from:%Y-%m-%d}",
+                'date_to': f"{self.date_to:%Y-%m-%d}" if self.date_to else None,
+            }
+            queue.reset()
+            count = queue.publish_page_ranges(start_page, end_page, shard_pages, settings)
+            logger.info(f"목록 페이지 {start_page} ~ {end_page}를 작업 {count}개로 게시했습니다: {queue_path}")
+        if not wait:
+            return queue.progress()
+
+        self._begin_run()
+        pbar = tqdm(desc="분산 수집", unit="shard")
+        try:
+            while not queue.is_finished():
+                progress = queue.progress()
+                pbar.total = sum(sum(statuses.values()) for statuses in progress.values())
+                pbar.n = sum(statuses.get(status, 0) for statuses in progress.values()
+                             for status in (work_queue.DONE, work_queue.FAILED))
+                pbar.set_postfix(workers=queue.active_workers())
+                time.sleep(config.WORKER_POLL_SECONDS)
+        finally:
+            pbar.close()
+            self.export_excel()
+            self._finish_run()
+            # 워커들이 작업마다 추가한 Parquet 파일 병합
+            if self.parquet is not None:
+                self.compact_parquet(self.parquet.partitions())
+        progress = queue.progress()
+        logger.info(f"분산 수집 종료: {progress}")
+        return progress
+
+    def run_worker(self, queue_path, worker_id=None):
+        """
+        분산 수집 워커: 작업 큐에서 작업을 임대해 처리하고, 결과는 공유 저장소에 레코드 단위로 저장합니다.
+        - pages 작업: 목록 페이지를 받아 아직 수집하지 않은 게시글을 작업 완료 시 페이지별 details 작업으로 게시
+        - details 작업: 상세 페이지/첨부파일 수집
+        하트비트 스레드가 임대를 연장하고, 전역 요청 속도(--rps/--max-rps)를 활성 워커 수로 나눈 몫을
+        이 프로세스의 속도 상한으로 맞춥니다. 게시된 작업이 모두 끝나면 종료합니다.
+        """
+        queue = work_queue.WorkQueue(queue_path)
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        adaptive = isinstance(self.rate_limiter, AdaptiveRateLimiter)
+        global_rate = self.limiter.max_rate if adaptive else self.limiter.rate
+        current = {'shard': None}
+        stop = threading.Event()
+
+        def beat():
+            queue.heartbeat(worker_id, current['shard'])
+            if global_rate and global_rate > 0:
+                share = global_rate / max(1, queue.active_workers())
+                if share != (self.limiter.max_rate if adaptive else self.limiter.rate):
+                    self.limiter.set_ceiling(share)
+                    logger.info(f"요청 속도 상한 조정: 초당 {share:.2f}건 (전역 {global_rate}건)")
+
+        def heartbeat_loop():
+            while not stop.wait(config.HEARTBEAT_INTERVAL):
+                try:
+                    beat()
+                except Exception as e:
+                    logger.warning(f"하트비트 실패: {e}")
+
+        # 코디네이터가 게시를 마칠 때까지 대기
+        while not queue.is_ready():
+            time.sleep(config.WORKER_POLL_SECONDS)
+        settings = queue.get_settings()
+        if settings.get('date_from'):
+            self.date_from = utils.parse_date(settings['date_from'])
+        self.date_to = utils.parse_date(settings['date_to']) if settings.get('date_to') else None
+
+        beat()
+        heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
+        heartbeat_thread.start()
+        logger.info(f"워커 {worker_id} 시작 (작업 큐: {queue_path})")
+
+        shards_done = 0
+        try:
+            with self._detail_executors() as (executor, parse_executor):
+                while True:
+                    shard = queue.claim(worker_id)
+                    if shard is None:
+                        if queue.is_finished():
+                            break
+                        time.sleep(config.WORKER_POLL_SECONDS)
+                        continue
+
+                    current['shard'] = shard['id']
+                    try:
+                        count, details = self._process_shard(shard, executor, parse_executor)
+                    except Exception as e:
+                        logger.error(f"작업 {shard['id']} ({shard['kind']}) 실패: {e}")
+                        queue.fail(shard['id'], worker_id, e)
+                    else:
+                        if not queue.complete(shard['id'], worker_id, count, details):
+                            logger.warning(f"작업 {shard['id']}의 임대가 만료되어 다른 워커가 가져갔습니다.")
+                        shards_done += 1
+                    finally:
+                        current['shard'] = None
+        finally:
+            stop.set()
+            heartbeat_thread.join()
+            queue.unregister(worker_id)
+        logger.info(f"워커 {worker_id} 종료: 작업 {shards_done}개 처리")
+        return shards_done
+
+    def _process_shard(self, shard, executor, parse_executor):
+        """
+        작업 하나 처리. 수집 여부는 공유 저장소에서 확인합니다 (다른 워커가 저장한 게시글 제외).
+        - pages 작업: 목록 페이지를 받지 못하면 예외를 발생시켜 작업 큐의 재시도를 따름
+        - details 작업: 이미 수집된 게시글은 건너뜀
+        Returns:
+            tuple: (처리 건수, 작업 완료 시 게시할 페이지별 상세 수집 대상 목록)
+                   처리 건수는 pages 작업이면 찾은 상세 수집 대상 수, details 작업이면 저장한 레코드 수
+        """
+        if shard['kind'] == 'pages':
+            details = []
+            for page in range(shard['payload']['start'], shard['payload']['end'] + 1):
+                items = []
+                for ntt_id, date_str in self._fetch_list_page(page):
+                    dt = utils.parse_date(date_str)
+                    if dt and (dt < self.date_from or (self.date_to and dt > self.date_to)):
+                        continue
+                    items.append((ntt_id, date_str))
+                seen = self.store.seen_among(ntt_id for ntt_id, _ in items)
+                details.append([item for item in items if str(item[0]) not in seen])
+                self.metrics.inc('list_pages_total')
+            return sum(len(targets) for targets in details), details
+
+        seen = self.store.seen_among(ntt_id for ntt_id, _ in shard['payload'])
+        self.seen_ids.update(seen)
+        items = [(ntt_id, date_str) for ntt_id, date_str in shard['payload'] if str(ntt_id) not in seen]
+        candidates = [(idx, len(items), str(ntt_id), date_str) for idx, (ntt_id, date_str) in enumerate(items)]
+        saved = 0
+        for data in self._fetch_details(candidates, executor, parse_executor):
+            self.metrics.inc('details_total', result='ok' if data else 'failed')
+            if data:
+                self.save_record(data)
+                saved += 1
+        self.flush_parquet()
+        return saved, []
+
+    def _crawl_pages(self, page, test_mode, pbar, executor, sync=False, end_page=None, parse_executor=None):
+        """
+        목록 페이지를 순회하며 상세 수집 및 페이지 단위 저장
+        sync: 이미 수집된 게시글만 있는 페이지를 만나거나,
+              수집된 게시글이 연속으로 config.SYNC_KNOWN_STREAK건 나오면 종료
+        end_page: 지정 시 해당 페이지까지만 수집
+        """
+        stop_flag = False
+        total_collected = 0
+        known_streak = 0
+        high_water_id, _ = self.store.get_high_water()
+
         while not stop_flag:
+            if end_page is not None and page > end_page:
+                break
+
             pbar.set_description(f"Page {page}")
-            items = self.get_list_page(page)
+            items = self._list_cache.pop(page, None) or self.get_list_page(page)
             
             if not items:
                 logger.info("더 이상 게시글이 없거나 파싱에 실패했습니다.")
                 break
                 
             new_page_items = 0
+            candidates = []
             
             for idx, (ntt_id, date_str) in enumerate(items):
-                # 연도 체크
+                # 기간 체크 (목록은 최신순)
                 dt = utils.parse_date(date_str)
-                if dt and dt.year < self.target_year:
-                    logger.info(f"기준 연도({self.target_year}) 이전 데이터 도달 ({date_str}). 종료합니다.")
+                if dt and dt < self.date_from:
+                    logger.info(f"수집 시작일({self.date_from:%Y-%m-%d}) 이전 데이터 도달 ({date_str}). 종료합니다.")
                     stop_flag = True
                     break
+                if dt and self.date_to and dt > self.date_to:
+                    continue
                 
-                # 중복 체크
-                if str(ntt_id) in self.seen_ids and not test_mode:
+                seen = str(ntt_id) in self.seen_ids
+
+                # 동기화 모드: 최고 수위 이하의 번호도 이미 확인한 구간으로 간주
+                if sync:
+                    if seen or (high_water_id is not None and int(ntt_id) <= high_water_id):
+                        known_streak += 1
+                    else:
+                        known_streak = 0
+                    if known_streak >= config.SYNC_KNOWN_STREAK:
+                        logger.info(f"수집된 게시글이 연속 {known_streak}건 확인되어 동기화를 종료합니다.")
+                        stop_flag = True
+                        break
+
+                # 중복 체크 (오프라인 재파싱은 수집된 게시글도 다시 파싱하여 갱신)
+                if seen and not (test_mode or self.offline):
                     continue
-                    
-                # 상세 수집
-                # 진행 상황 로그 (터미널 출력용)
-                tqdm.write(f"  - [{idx+1}/{len(items)}] 상세 수집 중: {ntt_id} ({date_str})")
+
+                candidates.append((idx, len(items), ntt_id, date_str))
+
+            # 동시 모드에서는 작업이 한꺼번에 제출되므로 테스트 목표 건수만큼만 제출
+            if test_mode and executor is not None:
+                candidates = candidates[:max(0, 5 - total_collected)]
                 
-                data = self.get_detail_page(ntt_id, date_str)
+            # 상세 수집 (결과는 목록 순서대로 처리)
+            for data in self._fetch_details(candidates, executor, parse_executor):
+                self.metrics.inc('details_total', result='ok' if data else 'failed')
                 if data:
-                    self.collected_data.append(data)
-                    self.seen_ids.add(str(ntt_id))
+                    # 레코드 단위로 바로 커밋 (페이지 중간에 중단되어도 유실 없음)
+                    self.save_record(data)
                     new_page_items += 1
                     total_collected += 1
                     
@@ -385,53 +1429,240 @@ class PressReleaseScraper:
                         logger.info("테스트 목표 달성 (5건). 종료합니다.")
                         stop_flag = True
                         break
-                    
-                time.sleep(1) # 부하 조절
             
-            # 페이지 단위 저장
-            if self.collected_data:
-                self.save_data()
+            if new_page_items:
+                logger.info(f"데이터 저장 완료: {new_page_items}건 ({self.store.path})")
+                self.flush_parquet()
                 
             if new_page_items == 0 and not stop_flag and not test_mode:
                 logger.info(f"페이지 {page}의 모든 데이터가 이미 수집되었습니다. (중복)")
-                # 연속으로 중복이면 종료하는 로직도 고려 가능하지만 일단 진행
+                if sync and not candidates:
+                    logger.info("동기화 모드: 새 게시글이 없어 종료합니다.")
+                    stop_flag = True
                 
+            self.metrics.inc('list_pages_total')
             page += 1
             pbar.update(1)
             
             if test_mode and stop_flag:
                 break
-            
-        pbar.close()
-        logger.info("수집 종료")
+
+
+def run_boards(scrapers, **run_kwargs):
+    """
+    여러 게시판을 함께 수집합니다 (게시판마다 스레드 하나, 세션/속도 제한은 shared로 공유).
+    한 게시판이 실패해도 나머지는 끝까지 수집하고, 마지막에 첫 오류를 다시 발생시킵니다.
+    """
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        futures = [(scraper, executor.submit(scraper.run, **run_kwargs)) for scraper in scrapers]
+
+    errors = []
+    for scraper, future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"{scraper.board.name} 게시판 수집 실패: {e}")
+            errors.append(e)
+    if errors:
+        raise errors[0]
+
+
+def _board_path(path, board, multi_board):
+    """여러 게시판을 함께 수집할 때 보고서 파일이 겹치지 않도록 경로에 게시판 키를 붙임"""
+    if not path or not multi_board:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{board.key}{ext}"
+
+
+def _date_arg(value):
+    """argparse용 날짜 인자 파서 (YYYY-MM-DD 또는 YYYY.MM.DD)"""
+    dt = utils.parse_date(value)
+    if dt is None:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 올바르지 않습니다: {value}")
+    return dt
+
 
 def main():
     parser = argparse.ArgumentParser(description="과학기술정보통신부 보도자료 스크래퍼")
     parser.add_argument("--page", type=int, default=1, help="시작 페이지 번호")
     parser.add_argument("--year", type=int, default=config.TARGET_YEAR, help="수집 기준 연도 (이후 데이터 수집)")
     parser.add_argument("--test", action="store_true", help="테스트 모드 (1페이지만 수집하고 종료)")
+    parser.add_argument("--from", dest="date_from", type=_date_arg, metavar="YYYY-MM-DD",
+                        help="수집 시작일 (지정 시 목록 페이지를 이진 탐색하여 해당 구간만 수집)")
+    parser.add_argument("--to", dest="date_to", type=_date_arg, metavar="YYYY-MM-DD",
+                        help="수집 종료일")
+    parser.add_argument("--sync", action="store_true", help="증분 동기화 (이미 수집된 구간에 도달하면 종료)")
+    parser.add_argument("--workers", type=int, default=config.MAX_WORKERS, help="상세 페이지/첨부파일 동시 수집 워커 수")
+    parser.add_argument("--parse-workers", type=int, default=config.PARSE_WORKERS,
+                        help="상세 페이지 파싱/요약 프로세스 수 (0이면 수집 스레드에서 파싱)")
+    parser.add_argument("--rps", type=float, default=config.REQUESTS_PER_SECOND,
+                        help="전체 요청 속도 (초당 요청 수, 적응형 제어 시 시작 속도)")
+    parser.add_argument("--max-rps", type=float, default=config.MAX_REQUESTS_PER_SECOND,
+                        help="적응형 속도 제어의 상한 (초당 요청 수)")
+    parser.add_argument("--fixed-rate", action="store_true",
+                        help="적응형 속도 제어를 끄고 --rps로 고정")
+    parser.add_argument("--cache", action="store_true",
+                        help="HTTP 응답 캐시 사용 (목록/상세 HTML을 cache/에 저장, 용량 제한 없음)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="HTTP 응답 캐시 사용 안 함 (config.HTTP_CACHE_ENABLED = True일 때)")
+    parser.add_argument("--from-cache", action="store_true",
+                        help="오프라인 모드: 네트워크 없이 캐시된 응답(--cache로 수집)만으로 다시 파싱")
+    parser.add_argument("--verify-attachments", action="store_true",
+                        help="수집 없이 첨부파일 매니페스트의 파일 크기를 서버와 비교하고 종료")
+    parser.add_argument("--full-migrate", action="store_true",
+                        help="수집 후 폴더 마이그레이션을 이번 변경분이 아닌 전체 폴더/엑셀 대상으로 실행")
+    parser.add_argument("--export", nargs="?", const=config.EXPORT_ALL_PATH, metavar="PATH",
+                        help="수집 없이 저장소 전체를 엑셀로 내보내고 종료")
+    parser.add_argument("--export-split", choices=sorted(exporter.SPLIT_PERIODS), default=None,
+                        help="--export 시 등록일 기준 연/월 단위로 파일 분할")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="전체 수집 대신 실패 목록(목록/상세 페이지, 첨부파일)에 기록된 항목만 다시 수집")
+    parser.add_argument("--max-attempts", type=int, default=config.FAILURE_MAX_ATTEMPTS,
+                        help="--retry-failed 시 시도 횟수가 이 값에 도달한 항목은 건너뜀")
+    parser.add_argument("--backfill", action="store_true",
+                        help="2단계 백필: 기간 내 게시글을 목록 페이지로 먼저 열거한 뒤 미수집 게시글만 일괄 수집")
+    parser.add_argument("--missing", nargs="?", const="", default=None, metavar="CSV",
+                        help="기간 내 게시글을 열거해 아직 수집하지 않은 목록을 출력/저장하고 종료 "
+                             "(기본: logs/missing_YYYYMMDD_HHMMSS.csv)")
+    parser.add_argument("--reuse-manifest", action="store_true",
+                        help="--backfill/--missing 시 목록 열거를 건너뛰고 기존 매니페스트 사용")
+    parser.add_argument("--coordinator", metavar="QUEUE",
+                        help="분산 수집 코디네이터: 목록 페이지 구간을 작업 큐(SQLite 파일)에 게시하고 완료 후 엑셀 내보내기")
+    parser.add_argument("--worker", metavar="QUEUE", help="분산 수집 워커: 작업 큐의 작업을 가져와 공유 저장소에 저장")
+    parser.add_argument("--worker-id", default=None, help="워커 이름 (기본: 호스트명-PID)")
+    parser.add_argument("--shard-pages", type=int, default=config.SHARD_PAGES,
+                        help="--coordinator 시 작업 하나에 포함할 목록 페이지 수")
+    parser.add_argument("--engine", choices=("threads", "async"), default=config.CRAWL_ENGINE,
+                        help="수집 엔진: threads (requests + 스레드) 또는 async (asyncio + aiohttp, 일반 수집에만 적용)")
+    parser.add_argument("--concurrency", type=int, default=config.ASYNC_CONCURRENCY,
+                        help="--engine async 시 동시에 진행 중인 HTTP 요청 수 상한")
+    parser.add_argument("--parquet", action="store_true",
+                        help="엑셀과 함께 Parquet(data/parquet/year=YYYY/month=M/)으로도 기록 (pyarrow 필요)")
+    parser.add_argument("--export-parquet", action="store_true",
+                        help="수집 없이 저장소 전체로 Parquet 데이터셋을 다시 만들고 종료 (pyarrow 필요)")
+    parser.add_argument("--store", default=None,
+                        help="저장소 경로 (기본: 게시판별 저장소, 분산 수집 시 모든 워커가 같은 파일을 지정)")
+    parser.add_argument("--boards", default=config.DEFAULT_BOARD, metavar="KEY[,KEY...]",
+                        help=f"수집할 게시판 (config.BOARDS 키: {', '.join(config.BOARDS)}), "
+                             "여러 개면 커넥션 풀과 요청 속도를 공유하며 함께 수집")
+    parser.add_argument("--no-metrics", action="store_true", help="단계별 계측 및 실행 보고서 기록 안 함")
+    parser.add_argument("--report", metavar="PATH", default=None,
+                        help="실행 보고서(JSON) 경로 (기본: logs/run_report_YYYYMMDD_HHMMSS_PID.json)")
+    parser.add_argument("--prometheus-textfile", metavar="PATH", default=config.PROMETHEUS_TEXTFILE,
+                        help="node_exporter textfile collector용 지표 파일(.prom) 경로")
     
     args = parser.parse_args()
+
+    board_keys = [key.strip() for key in args.boards.split(",") if key.strip()]
+    unknown = [key for key in board_keys if key not in config.BOARDS]
+    if unknown or not board_keys:
+        parser.error(f"알 수 없는 게시판: {', '.join(unknown)} (config.BOARDS: {', '.join(config.BOARDS)})")
+    multi_board = len(board_keys) > 1
+    if multi_board and (args.export or args.export_parquet or args.verify_attachments or args.missing is not None or args.coordinator
+                        or args.worker or args.backfill or args.retry_failed or args.store):
+        parser.error("여러 게시판(--boards)은 일반 수집(--sync, --from/--to, --test 포함)에서만 사용할 수 있습니다. "
+                     "그 밖의 작업은 게시판별로 실행하세요.")
+    if args.engine == "async":
+        if args.from_cache:
+            parser.error("--engine async는 오프라인 모드(--from-cache)를 지원하지 않습니다.")
+        if args.coordinator or args.worker or args.backfill or args.retry_failed:
+            parser.error("--engine async는 일반 수집(--sync, --from/--to, --test 포함)에만 적용됩니다.")
+    if (args.parquet or args.export_parquet) and not parquet_sink.available():
+        parser.error("--parquet/--export-parquet에는 pyarrow가 필요합니다: pip install pyarrow")
     
     # 설정 오버라이드
     if args.year:
         config.TARGET_YEAR = args.year
+    if args.parquet:
+        config.PARQUET_ENABLED = True
         
-    scraper = PressReleaseScraper(year=config.TARGET_YEAR)
-    
-    if args.test:
-        # 테스트 모드 시 파일명 변경 (덮어쓰기 방지)
-        scraper.output_file = config.EXCEL_PATH.replace(".xlsx", "_test.xlsx")
+    scraper_kwargs = dict(
+        year=config.TARGET_YEAR,
+        workers=args.workers,
+        parse_workers=args.parse_workers,
+        rate=args.rps,
+        adaptive_rate=not args.fixed_rate,
+        max_rate=args.max_rps,
+        use_cache=(args.cache or config.HTTP_CACHE_ENABLED) and not args.no_cache,
+        offline=args.from_cache,
+        metrics_enabled=not args.no_metrics
+    )
+    # 여러 게시판이면 첫 스크래퍼의 세션(커넥션 풀)과 속도 제한을 나머지가 공유
+    scrapers = []
+    for board in boards.load_boards(board_keys):
+        if args.test:
+            # 테스트 모드 시 파일명 변경 (덮어쓰기 방지), 저장소는 메모리에서만 사용 (Parquet 기록 안 함)
+            board_kwargs = dict(output_file=board.excel_path().replace(".xlsx", "_test.xlsx"), store_path=":memory:",
+                                parquet=False)
+        else:
+            board_kwargs = dict(store_path=args.store)
+        scrapers.append(PressReleaseScraper(
+            board=board, shared=scrapers[0] if scrapers else None,
+            pool_size=max(10, args.workers * len(board_keys)),
+            **board_kwargs, **scraper_kwargs
+        ))
+    scraper = scrapers[0]
+
+    if args.export:
+        scraper.export_excel(args.export, whole_store=True, split=args.export_split)
+        return
+
+    if args.export_parquet:
+        scraper.export_parquet()
+        return
+
+    if args.verify_attachments:
+        scraper.verify_attachments()
+        return
+
+    if args.missing is not None:
+        scraper.report_missing(args.date_from, args.date_to, enumerate_pages=not args.reuse_manifest,
+                               output_path=args.missing or None)
+        return
         
-    scraper.run(start_page=args.page, test_mode=args.test)
-    
-    # 수집 완료 후 폴더명 변경 (마이그레이션) 자동 실행
-    if not args.test: # 테스트 모드가 아닐 때만 실행하거나, 필요에 따라 조정
-        logger.info("폴더명 마이그레이션(날짜 수정) 시작...")
-        try:
-            migrate_folders.migrate_folders()
-        except Exception as e:
-            logger.error(f"마이그레이션 실행 중 실패: {e}")
+    try:
+        if args.coordinator:
+            scraper.run_coordinator(args.coordinator, date_from=args.date_from, date_to=args.date_to,
+                                    shard_pages=args.shard_pages)
+        elif args.worker:
+            scraper.run_worker(args.worker, worker_id=args.worker_id)
+        elif args.backfill:
+            scraper.backfill(args.date_from, args.date_to, enumerate_pages=not args.reuse_manifest)
+        elif args.retry_failed:
+            scraper.retry_failed(max_attempts=args.max_attempts)
+        elif multi_board:
+            run_boards(scrapers, start_page=args.page, test_mode=args.test, sync=args.sync,
+                       date_from=args.date_from, date_to=args.date_to,
+                       engine=args.engine, concurrency=args.concurrency)
+        else:
+            scraper.run(start_page=args.page, test_mode=args.test, sync=args.sync,
+                        date_from=args.date_from, date_to=args.date_to,
+                        engine=args.engine, concurrency=args.concurrency)
+        
+        # 수집 완료 후 폴더명 변경 (마이그레이션) 자동 실행
+        if not args.test: # 테스트 모드가 아닐 때만 실행하거나, 필요에 따라 조정
+            logger.info("폴더명 마이그레이션(날짜 수정) 시작...")
+            try:
+                with scraper.metrics.timer('migrate_seconds'):
+                    if args.full_migrate:
+                        renamed = migrate_folders.migrate_folders()
+                        for board_scraper in scrapers:
+                            board_scraper.apply_folder_renames(renamed)
+                    else:
+                        # 기본: 이번 실행에서 만든 폴더/레코드만 처리 (게시판별 저장소/엑셀에 반영)
+                        # (워커는 엑셀을 내보내지 않음: 코디네이터가 공유 저장소에서 내보냄)
+                        for board_scraper in scrapers:
+                            board_scraper.migrate_changes(export=not args.worker)
+            except Exception as e:
+                logger.error(f"마이그레이션 실행 중 실패: {e}")
+    finally:
+        # 중단된 실행도 어느 단계까지 진행됐는지 남김
+        for board_scraper in scrapers:
+            board_scraper.write_report(
+                _board_path(args.report, board_scraper.board, multi_board),
+                _board_path(args.prometheus_textfile, board_scraper.board, multi_board)
+            )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,576 @@
+import os
+import re
+import sqlite3
+import logging
+import threading
+import pandas as pd
+from datetime import datetime
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 대상에서 제외할 엑셀 파일 (테스트 결과, 경로 업데이트 백업본)
+EXCLUDED_EXCEL_PATTERN = re.compile(r'(_test\.xlsx|\.backup(_\d+)?\.xlsx)$')
+
+# 엑셀 컬럼명 <-> 저장소 컬럼명 (엑셀 컬럼 순서 유지)
+RECORD_COLUMNS = [
+    ('번호', 'ntt_id'),
+    ('제목', 'title'),
+    ('등록일', 'reg_date'),
+    ('부서', 'dept'),
+    ('상세URL', 'detail_url'),
+    ('본문', 'content'),
+    ('핵심요약', 'summary'),
+    ('첨부파일목록', 'attachments'),
+    ('첨부파일경로', 'attachment_paths'),
+]
+EXCEL_COLUMNS = [excel_col for excel_col, _ in RECORD_COLUMNS]
+
+
+def _cell_to_str(value):
+    """엑셀에서 읽은 셀 값을 저장소용 문자열로 변환 (빈 값은 빈 문자열)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class ScraperStore:
+    """
+    실행 간 공유되는 수집 상태 저장소 (SQLite).
+    - seen_ids: 수집 완료된 게시글 번호(nttSeqNo) 인덱스
+    - indexed_files: 인덱스에 반영된 엑셀 파일과 수정 시각
+    - records: 수집된 게시글 (번호 기준 upsert, 엑셀은 여기서 내보냄)
+    - file_records: 엑셀 파일별 포함 게시글 (파일명, 번호). 수집일 엑셀은 이 목록으로 다시 내보내므로
+      처음 수집한 날과 관계없이 해당 파일에 기록됐거나 그 실행에서 다시 수집한 게시글이 모두 포함됨
+    - meta: 증분 동기화용 최고 수위(high-water mark) 등 상태 값
+    - attachments: 첨부파일 매니페스트 ((atchFileNo, fileOrd) -> 파일명, 경로, 크기, 해시)
+    - failures: 실패한 목록 페이지/상세 페이지/첨부파일 (사유, 시도 횟수, --retry-failed 대상)
+    - manifest: 목록 페이지에서 열거한 게시글 (번호, 등록일, 목록 페이지) (--backfill, --missing)
+
+    상세 수집 워커 스레드에서도 사용하므로 쓰기 작업은 잠금으로 직렬화합니다.
+    파일 저장소는 WAL 모드로 열어, 레코드 단위 커밋이 저렴하고 중단되어도 커밋된 내용은 유지됩니다.
+
+    path에 ":memory:"를 주면 파일 없이 메모리에서만 동작합니다 (테스트 모드용).
+    """
+
+    def __init__(self, path=config.STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 분산 수집 시 여러 워커 프로세스가 같은 저장소에 쓰므로 잠금 대기 허용
+        self.conn = sqlite3.connect(path, timeout=config.STORE_BUSY_TIMEOUT, check_same_thread=False)
+        self.lock = threading.RLock()
+        if path != ":memory:":
+            # WAL: 커밋마다 DB 파일 전체를 동기화하지 않고 로그에 추가 (프로세스가 죽어도 커밋된 레코드는 보존)
+            self.conn.execute(f"PRAGMA journal_mode={config.STORE_JOURNAL_MODE}")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self):
+        has_file_records = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'file_records'"
+        ).fetchone() is not None
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_ids (
+                ntt_id TEXT PRIMARY KEY,
+                reg_date TEXT,
+                source TEXT
+            );
+            CREATE TABLE IF NOT EXISTS indexed_files (
+                name TEXT PRIMARY KEY,
+                mtime REAL
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                ntt_id TEXT PRIMARY KEY,
+                title TEXT,
+                reg_date TEXT,
+                dept TEXT,
+                detail_url TEXT,
+                content TEXT,
+                summary TEXT,
+                attachments TEXT,
+                attachment_paths TEXT,
+                collected_on TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_collected_on ON records (collected_on);
+            CREATE TABLE IF NOT EXISTS file_records (
+                file_name TEXT,
+                ntt_id TEXT,
+                PRIMARY KEY (file_name, ntt_id)
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS attachments (
+                atch_file_no TEXT,
+                file_ord TEXT,
+                filename TEXT,
+                file_path TEXT,
+                size INTEGER,
+                sha256 TEXT,
+                PRIMARY KEY (atch_file_no, file_ord)
+            );
+            CREATE TABLE IF NOT EXISTS failures (
+                kind TEXT,
+                item_key TEXT,
+                ntt_id TEXT,
+                reg_date TEXT,
+                reason TEXT,
+                attempts INTEGER,
+                first_failed TEXT,
+                last_failed TEXT,
+                PRIMARY KEY (kind, item_key)
+            );
+            CREATE TABLE IF NOT EXISTS manifest (
+                ntt_id TEXT PRIMARY KEY,
+                reg_date TEXT,
+                page INTEGER,
+                listed_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS manifest_reg_date ON manifest (reg_date);
+        """)
+        if not has_file_records:
+            # 이전 버전 저장소: 게시글을 처음 기록한 파일(seen_ids.source)로 포함 목록 초기화
+            self.conn.execute(
+                "INSERT OR IGNORE INTO file_records (file_name, ntt_id) "
+                "SELECT source, ntt_id FROM seen_ids WHERE source LIKE '%.xlsx'"
+            )
+        self.conn.commit()
+
+    def close(self):
+        self.checkpoint()
+        self.conn.close()
+
+    def checkpoint(self):
+        """WAL 로그를 DB 파일에 반영하고 비움 (메모리 저장소면 아무것도 하지 않음)"""
+        if self.path == ":memory:":
+            return
+        with self.lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def get_meta(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        """상태 값 저장 (value가 None이면 삭제)"""
+        with self.lock, self.conn:
+            if value is None:
+                self.conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def load_seen_ids(self):
+        """수집 완료된 게시글 번호 전체를 집합으로 반환"""
+        return {row[0] for row in self.conn.execute("SELECT ntt_id FROM seen_ids")}
+
+    def seen_among(self, ntt_ids):
+        """
+        주어진 번호 중 수집 완료된 번호의 집합
+        (다른 프로세스가 같은 저장소에 저장한 게시글도 포함, 분산 수집 워커용)
+        """
+        ntt_ids = [str(ntt_id) for ntt_id in ntt_ids]
+        seen = set()
+        with self.lock:
+            for i in range(0, len(ntt_ids), 500):
+                chunk = ntt_ids[i:i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                seen.update(row[0] for row in self.conn.execute(
+                    f"SELECT ntt_id FROM seen_ids WHERE ntt_id IN ({placeholders})", chunk
+                ))
+        return seen
+
+    def add_seen_ids(self, items, source="", commit=True):
+        """
+        게시글 번호를 인덱스에 추가합니다.
+        items: (번호, 등록일) 튜플의 iterable
+        """
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_ids (ntt_id, reg_date, source) VALUES (?, ?, ?)",
+                [(str(ntt_id), str(date_str), source) for ntt_id, date_str in items]
+            )
+            if commit:
+                self.conn.commit()
+
+    def upsert_records(self, records, collected_on=None, source=""):
+        """
+        게시글 레코드(엑셀 컬럼명 딕셔너리)를 번호 기준으로 저장합니다.
+        기존 데이터를 다시 읽지 않으므로 비용은 새 레코드 수에 비례합니다.
+        source: 이 레코드를 내보낼 엑셀 파일명 (이미 수집된 게시글이어도 해당 파일의 포함 목록에 추가)
+        """
+        if not records:
+            return
+        collected_on = collected_on or config.TODAY_STR
+
+        db_cols = [db_col for _, db_col in RECORD_COLUMNS]
+        placeholders = ", ".join("?" for _ in range(len(db_cols) + 1))
+        updates = ", ".join(f"{c} = excluded.{c}" for c in db_cols[1:])
+        sql = (
+            f"INSERT INTO records ({', '.join(db_cols)}, collected_on) VALUES ({placeholders}) "
+            f"ON CONFLICT(ntt_id) DO UPDATE SET {updates}"
+        )
+        rows = [
+            tuple(_cell_to_str(record.get(excel_col)) for excel_col in EXCEL_COLUMNS) + (collected_on,)
+            for record in records
+        ]
+
+        with self.lock, self.conn:
+            self.conn.executemany(sql, rows)
+            self.add_seen_ids(((row[0], row[2]) for row in rows), source=source, commit=False)
+            self._add_file_records(source, (row[0] for row in rows))
+            self._update_high_water(rows)
+            # 저장된 게시글은 상세 수집 실패 목록에서 제거
+            self.conn.executemany(
+                "DELETE FROM failures WHERE kind = 'detail' AND item_key = ?", [(row[0],) for row in rows]
+            )
+
+    def _update_high_water(self, rows):
+        """수집된 최대 게시글 번호와 최신 등록일 갱신 (트랜잭션 내부에서 호출)"""
+        ntt_id, reg_date = self.get_high_water()
+        for row in rows:
+            if row[0].isdigit() and (ntt_id is None or int(row[0]) > ntt_id):
+                ntt_id = int(row[0])
+            if row[2] and (reg_date is None or row[2] > reg_date):
+                reg_date = row[2]
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [('high_water_id', str(ntt_id) if ntt_id is not None else ""),
+             ('high_water_date', reg_date or "")]
+        )
+
+    def get_high_water(self):
+        """
+        지금까지 수집된 최대 게시글 번호와 최신 등록일
+        Returns:
+            tuple: (int 또는 None, str 또는 None)
+        """
+        with self.lock:
+            meta = dict(self.conn.execute(
+                "SELECT key, value FROM meta WHERE key IN ('high_water_id', 'high_water_date')"
+            ))
+        ntt_id = meta.get('high_water_id')
+        return (int(ntt_id) if ntt_id else None), (meta.get('high_water_date') or None)
+
+    @staticmethod
+    def _member_filter(file_name, conditions, params):
+        if file_name:
+            conditions.append("ntt_id IN (SELECT ntt_id FROM file_records WHERE file_name = ?)")
+            params.append(file_name)
+
+    def iter_records(self, file_name=None, reg_period=None, period_length=None, with_collected_on=False):
+        """
+        저장된 레코드를 저장 순서대로 하나씩 반환 (엑셀 컬럼명 딕셔너리)
+        file_name: 해당 엑셀 파일의 포함 목록에 있는 레코드만
+        reg_period: 등록일 앞 period_length글자 필터 (예: '2024', '2024-05')
+        with_collected_on: True면 '수집일'(처음 수집한 날) 키를 함께 반환
+        """
+        db_cols = ", ".join(db_col for _, db_col in RECORD_COLUMNS)
+        columns = EXCEL_COLUMNS
+        if with_collected_on:
+            db_cols += ", collected_on"
+            columns = EXCEL_COLUMNS + ['수집일']
+        conditions, params = [], []
+        self._member_filter(file_name, conditions, params)
+        if reg_period is not None:
+            conditions.append("substr(reg_date, 1, ?) = ?")
+            params.extend([period_length or len(reg_period), reg_period])
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        cursor = self.conn.execute(f"SELECT {db_cols} FROM records {where}ORDER BY rowid", params)
+        for row in cursor:
+            yield dict(zip(columns, row))
+
+    def list_reg_periods(self, length, file_name=None):
+        """등록일 앞 length글자 기준 기간 목록 (연도: 4, 연월: 7)"""
+        conditions, params = [], [length]
+        self._member_filter(file_name, conditions, params)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT DISTINCT substr(reg_date, 1, ?) FROM records{where}"
+        return sorted(row[0] for row in self.conn.execute(sql, params))
+
+    def count_records(self, file_name=None):
+        conditions, params = [], []
+        self._member_filter(file_name, conditions, params)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.conn.execute(f"SELECT COUNT(*) FROM records{where}", params).fetchone()[0]
+
+    def mark_file_indexed(self, file_path):
+        """스크래퍼가 직접 기록한 파일은 다음 실행 시 다시 읽지 않도록 수정 시각 기록"""
+        if not os.path.exists(file_path):
+            return
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO indexed_files (name, mtime) VALUES (?, ?)",
+                (os.path.basename(file_path), os.path.getmtime(file_path))
+            )
+
+    def is_file_indexed(self, file_path):
+        """파일이 현재 수정 시각 그대로 저장소에 반영되어 있는지"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT mtime FROM indexed_files WHERE name = ?", (os.path.basename(file_path),)
+            ).fetchone()
+        return row is not None and os.path.exists(file_path) and row[0] == os.path.getmtime(file_path)
+
+    def sync_excel_files(self, data_dir=config.DATA_DIR, accept=None):
+        """
+        data 폴더의 엑셀 파일 중 저장소에 반영되지 않았거나 변경된 파일만 읽어 가져옵니다.
+        (이전 버전에서 만든 엑셀이나 사용자가 직접 넣은 파일 포함)
+        최초 1회 이후에는 파일 수정 시각만 비교하므로 엑셀 파싱 없이 끝납니다.
+        accept: 파일명을 받아 이 저장소의 파일인지 판단하는 함수 (게시판별 저장소 분리용)
+        """
+        if not os.path.exists(data_dir):
+            return 0
+
+        indexed = dict(self.conn.execute("SELECT name, mtime FROM indexed_files"))
+        added = 0
+
+        for excel_file in sorted(os.listdir(data_dir)):
+            if not excel_file.endswith('.xlsx') or EXCLUDED_EXCEL_PATTERN.search(excel_file):
+                continue
+            if accept is not None and not accept(excel_file):
+                continue
+
+            excel_path = os.path.join(data_dir, excel_file)
+            mtime = os.path.getmtime(excel_path)
+            if indexed.get(excel_file) == mtime:
+                continue
+
+            try:
+                df = pd.read_excel(excel_path)
+            except Exception as e:
+                logger.warning(f"인덱스 반영 실패 ({excel_file}): {e}")
+                continue
+
+            if '번호' in df.columns:
+                # 파일명의 날짜(YYYYMMDD)를 수집일로 사용
+                date_match = re.search(r'(\d{8})', excel_file)
+                collected_on = date_match.group(1) if date_match else ""
+                records = df.reindex(columns=EXCEL_COLUMNS).to_dict('records')
+
+                before = self.count_seen_ids()
+                self._import_records(records, collected_on, source=excel_file)
+                added += self.count_seen_ids() - before
+
+            self.mark_file_indexed(excel_path)
+            logger.info(f"인덱스 반영: {excel_file} ({len(df)}건)")
+
+        return added
+
+    def _import_records(self, records, collected_on, source):
+        """엑셀에서 가져온 레코드 저장 (이미 저장된 번호는 덮어쓰지 않음)"""
+        db_cols = [db_col for _, db_col in RECORD_COLUMNS]
+        placeholders = ", ".join("?" for _ in range(len(db_cols) + 1))
+        rows = [
+            tuple(_cell_to_str(record.get(excel_col)) for excel_col in EXCEL_COLUMNS) + (collected_on,)
+            for record in records
+            if _cell_to_str(record.get('번호'))
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO records ({', '.join(db_cols)}, collected_on) VALUES ({placeholders})",
+                rows
+            )
+            self.add_seen_ids(((row[0], row[2]) for row in rows), source=source, commit=False)
+            self._add_file_records(source, (row[0] for row in rows))
+
+    def _add_file_records(self, file_name, ntt_ids):
+        if file_name:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO file_records (file_name, ntt_id) VALUES (?, ?)",
+                [(file_name, ntt_id) for ntt_id in ntt_ids]
+            )
+
+    def add_file_records(self, file_name, ntt_ids):
+        """엑셀 파일의 포함 목록에 게시글 번호 추가"""
+        with self.lock, self.conn:
+            self._add_file_records(file_name, (str(ntt_id) for ntt_id in ntt_ids))
+
+    def count_seen_ids(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen_ids").fetchone()[0]
+
+    def get_attachment(self, atch_file_no, file_ord):
+        """
+        첨부파일 매니페스트 조회
+        Returns:
+            dict 또는 None: filename, file_path(프로젝트 루트 기준 상대 경로), size, sha256
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT filename, file_path, size, sha256 FROM attachments WHERE atch_file_no = ? AND file_ord = ?",
+                (str(atch_file_no), str(file_ord))
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('filename', 'file_path', 'size', 'sha256'), row))
+
+    def record_attachment(self, atch_file_no, file_ord, filename, file_path, size, sha256):
+        """다운로드가 끝난 첨부파일을 매니페스트에 기록 (실패 목록에 있었다면 제거)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO attachments (atch_file_no, file_ord, filename, file_path, size, sha256) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (str(atch_file_no), str(file_ord), filename, file_path, size, sha256)
+            )
+            self.conn.execute(
+                "DELETE FROM failures WHERE kind = 'attachment' AND item_key = ?",
+                (attachment_key(atch_file_no, file_ord),)
+            )
+
+    def remove_attachment(self, atch_file_no, file_ord):
+        """매니페스트에서 제거 (다음 수집 시 다시 다운로드)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM attachments WHERE atch_file_no = ? AND file_ord = ?",
+                (str(atch_file_no), str(file_ord))
+            )
+
+    def iter_attachments(self):
+        """매니페스트 전체 (atch_file_no, file_ord, filename, file_path, size)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT atch_file_no, file_ord, filename, file_path, size FROM attachments"
+            ).fetchall()
+        return rows
+
+    def rename_attachment_folder(self, old_folder, new_folder, ntt_ids=None):
+        """
+        다운로드 폴더명 변경을 저장소에 반영합니다.
+        - 해당 게시글들의 첨부파일경로(=HYPERLINK 수식)의 폴더 경로
+          (ntt_ids가 없으면 기존 폴더를 가리키는 모든 게시글, 전체 마이그레이션용)
+        - 첨부파일 매니페스트의 파일 경로
+        Returns:
+            list: 첨부파일경로를 바꾼 게시글 번호
+        """
+        download_dir_name = os.path.basename(config.DOWNLOAD_DIR)
+        old_rel = os.path.join(download_dir_name, old_folder)
+        new_rel = os.path.join(download_dir_name, new_folder)
+        old_link = f'"{os.path.join("..", old_rel)}"'
+        new_link = f'"{os.path.join("..", new_rel)}"'
+
+        with self.lock, self.conn:
+            if ntt_ids is None:
+                ntt_ids = [row[0] for row in self.conn.execute(
+                    "SELECT ntt_id FROM records WHERE instr(attachment_paths, ?) > 0", (old_link,)
+                )]
+            self.conn.executemany(
+                "UPDATE records SET attachment_paths = replace(attachment_paths, ?, ?) WHERE ntt_id = ?",
+                [(old_link, new_link, str(ntt_id)) for ntt_id in ntt_ids]
+            )
+            self.conn.execute(
+                "UPDATE attachments SET file_path = ? || substr(file_path, ?) WHERE substr(file_path, 1, ?) = ?",
+                (new_rel + os.sep, len(old_rel) + 2, len(old_rel) + 1, old_rel + os.sep)
+            )
+        return [str(ntt_id) for ntt_id in ntt_ids]
+
+    def record_failure(self, kind, item_key, reason, ntt_id="", reg_date=""):
+        """
+        실패 항목 기록 (같은 항목이 다시 실패하면 시도 횟수 증가)
+        kind: 'list'(item_key: 페이지 번호), 'detail'(게시글 번호),
+              'attachment'(attachment_key, ntt_id/reg_date: 해당 게시글)
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO failures (kind, item_key, ntt_id, reg_date, reason, attempts, first_failed, last_failed) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT(kind, item_key) DO UPDATE SET "
+                "reason = excluded.reason, attempts = attempts + 1, last_failed = excluded.last_failed, "
+                "ntt_id = coalesce(nullif(excluded.ntt_id, ''), ntt_id), "
+                "reg_date = coalesce(nullif(excluded.reg_date, ''), reg_date)",
+                (kind, str(item_key), str(ntt_id), str(reg_date), str(reason)[:500], now, now)
+            )
+
+    def resolve_failure(self, kind, item_key):
+        """성공한 항목을 실패 목록에서 제거"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM failures WHERE kind = ? AND item_key = ?", (kind, str(item_key)))
+
+    def list_failures(self, kind=None, max_attempts=None):
+        """
+        실패 목록 (오래된 순)
+        max_attempts: 지정 시 시도 횟수가 이보다 적은 항목만 (재시도 대상)
+        Returns:
+            list[dict]: kind, item_key, ntt_id, reg_date, reason, attempts, first_failed, last_failed
+        """
+        columns = ('kind', 'item_key', 'ntt_id', 'reg_date', 'reason', 'attempts', 'first_failed', 'last_failed')
+        conditions, params = [], []
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if max_attempts is not None:
+            conditions.append("attempts < ?")
+            params.append(max_attempts)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM failures {where}ORDER BY first_failed, kind, item_key", params
+            ).fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def count_failures(self):
+        """종류별 실패 항목 수"""
+        with self.lock:
+            return dict(self.conn.execute("SELECT kind, COUNT(*) FROM failures GROUP BY kind"))
+
+    def add_manifest(self, items):
+        """
+        목록에서 열거한 게시글을 매니페스트에 추가 (이미 있으면 등록일/페이지 갱신)
+        items: (번호, 등록일, 목록 페이지) 튜플의 iterable
+        """
+        listed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO manifest (ntt_id, reg_date, page, listed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(ntt_id) DO UPDATE SET reg_date = excluded.reg_date, page = excluded.page, "
+                "listed_at = excluded.listed_at",
+                [(str(ntt_id), str(date_str), page, listed_at) for ntt_id, date_str, page in items]
+            )
+
+    def _manifest_range(self, date_from=None, date_to=None):
+        """등록일(YYYY-MM-DD) 범위 조건절과 인자"""
+        conditions, params = [], []
+        if date_from:
+            conditions.append("m.reg_date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("m.reg_date <= ?")
+            params.append(date_to)
+        return conditions, params
+
+    def count_manifest(self, date_from=None, date_to=None):
+        conditions, params = self._manifest_range(date_from, date_to)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM manifest m{where}", params).fetchone()[0]
+
+    def list_missing(self, date_from=None, date_to=None):
+        """
+        매니페스트에는 있지만 아직 수집하지 않은 게시글 (최신 번호 순)
+        Returns:
+            list: (번호, 등록일, 목록 페이지) 튜플
+        """
+        conditions, params = self._manifest_range(date_from, date_to)
+        conditions.append("s.ntt_id IS NULL")
+        with self.lock:
+            return self.conn.execute(
+                "SELECT m.ntt_id, m.reg_date, m.page FROM manifest m "
+                "LEFT JOIN seen_ids s ON s.ntt_id = m.ntt_id "
+                f"WHERE {' AND '.join(conditions)} "
+                "ORDER BY CAST(m.ntt_id AS INTEGER) DESC", params
+            ).fetchall()
+
+
+def attachment_key(atch_file_no, file_ord):
+    """실패 목록에서 첨부파일을 가리키는 키"""
+    return f"{atch_file_no}:{file_ord}"
@@ -0,0 +1,60 @@
+"""
+테스트 공통 설정
+
+config 경로를 임시 작업 폴더로 재지정합니다 (기본 인자로 config 값을 쓰는 모듈이 있으므로
+테스트 모듈이 scraper/store 등을 import하기 전에 적용). 네트워크가 필요한 테스트는
+로컬 대역 서버(benchmarks/mock_server.py)만 사용합니다.
+"""
+import tempfile
+
+import pytest
+
+from benchmarks.bench_scraper import configure
+
+WORK_DIR = tempfile.mkdtemp(prefix="scraper_tests_")
+configure(WORK_DIR)
+
+import config  # noqa: E402
+from benchmarks.mock_server import MockMsitServer  # noqa: E402
+
+
+@pytest.fixture
+def mock_server(tmp_path, monkeypatch):
+    """
+    대역 서버를 띄우고 config.BASE_URL을 바꾼 뒤, 서버를 만드는 함수를 돌려줍니다.
+    (녹화본 없이 합성 페이지만 응답하도록 빈 fixtures 폴더 사용)
+    """
+    servers = []
+
+    def start(**kwargs):
+        kwargs.setdefault('fixtures_dir', str(tmp_path / "no_fixtures"))
+        kwargs.setdefault('latency', 0)
+        kwargs.setdefault('retry_after', 0)
+        server = MockMsitServer(**kwargs).start()
+        servers.append(server)
+        monkeypatch.setattr(config, 'BASE_URL', server.base_url)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """재시도 대기 없이 실행 (실패 응답을 주입하는 테스트용)"""
+    monkeypatch.setattr(config, 'BACKOFF_FACTOR', 0)
+
+
+@pytest.fixture
+def make_scraper():
+    """테스트용 스크래퍼를 만드는 함수 (메모리 저장소, 속도 제한/캐시/계측 없음)"""
+    from scraper import PressReleaseScraper
+
+    def make(**kwargs):
+        options = dict(year=2000, rate=0, adaptive_rate=False, use_cache=False,
+                       store_path=":memory:", metrics_enabled=False)
+        options.update(kwargs)
+        return PressReleaseScraper(**options)
+
+    return make
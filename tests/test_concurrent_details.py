@@ -0,0 +1,42 @@
+"""동시 상세 수집 (--workers): 순차 실행과 같은 순서/결과, 공유 요청 속도 제한 준수"""
+import time
+
+from benchmarks import sample_pages
+
+POSTS = 40
+
+
+def candidates():
+    items = [(str(sample_pages.list_ntt_id(position)), "2026-10-01") for position in range(POSTS)]
+    return [(idx, len(items), ntt_id, date_str) for idx, (ntt_id, date_str) in enumerate(items)]
+
+
+def fetch_records(scraper):
+    with scraper._detail_executors() as (executor, parse_executor):
+        return list(scraper._fetch_details(candidates(), executor, parse_executor))
+
+
+def test_workers_match_sequential_order(mock_server, make_scraper):
+    mock_server(pages=10, per_page=10, attachments=1, attachment_size=512, jitter=0.01)
+
+    sequential = fetch_records(make_scraper(workers=1))
+    concurrent = fetch_records(make_scraper(workers=8))
+
+    assert [record['번호'] for record in sequential] == [ntt_id for _, _, ntt_id, _ in candidates()]
+    assert concurrent == sequential
+
+
+def test_workers_share_rate_limit(mock_server, make_scraper):
+    rate = 40
+    server = mock_server(pages=10, per_page=10, attachments=1, attachment_size=512)
+    scraper = make_scraper(workers=8, rate=rate)
+
+    start = time.monotonic()
+    records = fetch_records(scraper)
+    elapsed = time.monotonic() - start
+
+    requests = server.stats['view'] + server.stats['file']
+    assert len(records) == POSTS and all(records)
+    # 워커 수와 관계없이 요청 간격은 1 / rate초 이상
+    assert requests >= POSTS
+    assert elapsed >= (requests - 1) / rate * 0.95
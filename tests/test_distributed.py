@@ -0,0 +1,57 @@
+"""분산 수집 워커의 작업 처리 (로컬 대역 서버, 공유 저장소 파일)"""
+import pytest
+
+import config
+from benchmarks import sample_pages
+from store import ScraperStore
+from work_queue import WorkQueue
+
+SETTINGS = {'date_from': "2000-01-01", 'date_to': None}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.db"))
+    yield queue
+    queue.close()
+
+
+def test_worker_collects_each_post_once(mock_server, make_scraper, queue, tmp_path):
+    server = mock_server(pages=3, per_page=5, attachments=0)
+    queue.publish_page_ranges(1, 3, shard_pages=2, settings=SETTINGS)
+    scraper = make_scraper(store_path=str(tmp_path / "scraper.db"))
+
+    scraper.run_worker(queue.path, worker_id="w1")
+
+    assert queue.progress() == {'pages': {'done': 2}, 'details': {'done': 3}}
+    assert scraper.store.count_records() == 15
+    assert server.stats['view'] == 15
+
+
+def test_failed_list_page_fails_the_shard(mock_server, make_scraper, queue, monkeypatch, no_backoff):
+    monkeypatch.setattr(config, 'MAX_RETRIES', 0)
+    mock_server(pages=3, per_page=5, attachments=0, error_rate=1.0)
+    queue.publish_page_ranges(1, 1, shard_pages=1, settings=SETTINGS)
+    scraper = make_scraper()
+    shard = queue.claim("w1")
+
+    with pytest.raises(Exception):
+        scraper._process_shard(shard, None, None)
+
+
+def test_details_skip_posts_saved_by_other_workers(mock_server, make_scraper, tmp_path):
+    server = mock_server(pages=1, per_page=5, attachments=0)
+    store_path = str(tmp_path / "scraper.db")
+    scraper = make_scraper(store_path=store_path)
+    items = [[str(sample_pages.list_ntt_id(position)), "2026-10-01"] for position in range(3)]
+
+    # 이 워커가 시작한 뒤 다른 워커가 저장한 게시글
+    other = ScraperStore(store_path)
+    other.upsert_records([{'번호': items[0][0], '제목': "다른 워커", '등록일': "2026-10-01"}])
+    other.close()
+
+    count, details = scraper._process_shard({'kind': 'details', 'payload': items}, None, None)
+
+    assert (count, details) == (2, [])
+    assert server.stats['view'] == 2
+    assert scraper.store.count_records() == 3
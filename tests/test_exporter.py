@@ -0,0 +1,74 @@
+"""대체 파일(_backup_ 등) 병합"""
+import os
+
+import pytest
+
+import exporter
+from store import ScraperStore
+
+
+def records(*ntt_ids):
+    return [{'번호': str(i), '제목': f"제목 {i}", '등록일': "2026-02-07"} for i in ntt_ids]
+
+
+@pytest.fixture
+def data_store():
+    data_store = ScraperStore(":memory:")
+    yield data_store
+    data_store.close()
+
+
+def write(data_dir, name, ntt_ids):
+    path = os.path.join(data_dir, name)
+    exporter.export_records(records(*ntt_ids), path)
+    return path
+
+
+def test_merge_keeps_rows_of_base_and_stray(data_store, tmp_path):
+    data_dir = str(tmp_path)
+    write(data_dir, "press_20260206.xlsx", [1, 2, 3])
+    base = write(data_dir, "press_20260207.xlsx", [1, 2, 3, 4, 5])
+    stray = write(data_dir, "press_20260207_backup_120000.xlsx", [1, 2, 3, 4, 5, 6])
+    data_store.sync_excel_files(data_dir)
+
+    assert exporter.merge_stray_exports(data_store, data_dir) == [base]
+
+    assert exporter.workbook_ids(base) == ["1", "2", "3", "4", "5", "6"]
+    assert not os.path.exists(stray)
+    assert exporter.workbook_ids(os.path.join(data_dir, "press_20260206.xlsx")) == ["1", "2", "3"]
+
+
+def test_merge_adds_rows_only_in_base(data_store, tmp_path):
+    data_dir = str(tmp_path)
+    base = write(data_dir, "press_20260207.xlsx", [7, 8])
+    stray = write(data_dir, "press_20260207_partial_090000.xlsx", [9])
+    data_store.sync_excel_files(data_dir)
+
+    exporter.merge_stray_exports(data_store, data_dir)
+
+    assert sorted(exporter.workbook_ids(base)) == ["7", "8", "9"]
+    assert not os.path.exists(stray)
+
+
+def test_stray_not_in_store_is_kept(data_store, tmp_path):
+    data_dir = str(tmp_path)
+    base = write(data_dir, "press_20260207.xlsx", [1, 2])
+    stray = write(data_dir, "press_20260207_backup_120000.xlsx", [3])
+
+    # 저장소에 반영되지 않은 대체 파일은 건드리지 않음
+    assert exporter.merge_stray_exports(data_store, data_dir) == []
+    assert os.path.exists(stray)
+    assert exporter.workbook_ids(base) == ["1", "2"]
+
+
+def test_stray_with_ids_missing_from_store_is_kept(data_store, tmp_path):
+    data_dir = str(tmp_path)
+    base = write(data_dir, "press_20260207.xlsx", [1, 2])
+    stray = write(data_dir, "press_20260207_backup_120000.xlsx", [3])
+    data_store.sync_excel_files(data_dir)
+    # 원본 파일이 저장소 반영 이후 다른 곳에서 바뀐 경우
+    write(data_dir, "press_20260207.xlsx", [1, 2, 4])
+
+    assert exporter.merge_stray_exports(data_store, data_dir) == []
+    assert os.path.exists(stray)
+    assert exporter.workbook_ids(base) == ["1", "2", "4"]
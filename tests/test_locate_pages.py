@@ -0,0 +1,70 @@
+"""수집 기간에 해당하는 목록 페이지 탐색 (로컬 대역 서버 사용)"""
+from datetime import timedelta
+
+import pytest
+
+import config
+from benchmarks import sample_pages
+
+PAGES = 30
+PER_PAGE = 10
+
+
+def expected_pages(days_from, days_to):
+    """합성 목록(하루 POSTS_PER_DAY건, 최신순)에서 [LATEST - days_from, LATEST - days_to] 구간의 페이지"""
+    first = days_to * sample_pages.POSTS_PER_DAY
+    last = (days_from + 1) * sample_pages.POSTS_PER_DAY - 1
+    return first // PER_PAGE + 1, last // PER_PAGE + 1
+
+
+def date_range(days_from, days_to):
+    return (sample_pages.LATEST_DATE - timedelta(days=days_from),
+            sample_pages.LATEST_DATE - timedelta(days=days_to))
+
+
+@pytest.fixture
+def no_http_retry(monkeypatch, no_backoff):
+    """세션 재시도 없이 실패 응답이 바로 예외가 되도록 (스크래퍼 생성 전에 적용)"""
+    monkeypatch.setattr(config, 'MAX_RETRIES', 0)
+
+
+@pytest.mark.parametrize("days_from, days_to", [(20, 10), (5, 0), (99, 90), (40, 40)])
+def test_locate_pages(mock_server, make_scraper, days_from, days_to):
+    mock_server(pages=PAGES, per_page=PER_PAGE, attachments=0)
+    scraper = make_scraper()
+
+    assert scraper.locate_pages(*date_range(days_from, days_to)) == expected_pages(days_from, days_to)
+
+
+def test_locate_pages_past_end_of_list(mock_server, make_scraper):
+    mock_server(pages=PAGES, per_page=PER_PAGE, attachments=0)
+    scraper = make_scraper()
+
+    date_from, date_to = date_range(500, 80)
+    assert scraper.locate_pages(date_from, date_to) == (expected_pages(80, 80)[0], PAGES)
+
+
+def test_transient_errors_do_not_truncate_range(mock_server, make_scraper, no_http_retry, monkeypatch):
+    monkeypatch.setattr(config, 'LOCATE_ATTEMPTS', 10)
+    server = mock_server(pages=PAGES, per_page=PER_PAGE, attachments=0, error_rate=0.3)
+    scraper = make_scraper()
+
+    assert scraper.locate_pages(*date_range(20, 10)) == expected_pages(20, 10)
+    assert server.stats[500] > 0
+    assert scraper.store.count_failures() == {}
+
+
+def test_failed_page_raises_and_is_not_cached(mock_server, make_scraper, no_http_retry):
+    server = mock_server(pages=PAGES, per_page=PER_PAGE, attachments=0, error_rate=1.0)
+    scraper = make_scraper()
+
+    with pytest.raises(RuntimeError):
+        scraper.locate_pages(*date_range(20, 10))
+    assert scraper._list_cache == {}
+    assert scraper.store.count_failures() == {'list': 1}
+    assert server.stats[500] == config.LOCATE_ATTEMPTS
+
+    # 서버가 회복되면 같은 스크래퍼로 다시 탐색
+    server.error_rate = 0
+    assert scraper.locate_pages(*date_range(20, 10)) == expected_pages(20, 10)
+    assert scraper.store.count_failures() == {}
@@ -0,0 +1,52 @@
+"""lxml 파서와 기존 BeautifulSoup(html.parser) 구현의 결과 비교"""
+import pytest
+
+import parsers
+from benchmarks import sample_pages
+
+
+@pytest.mark.parametrize("page", [1, 2, 7])
+@pytest.mark.parametrize("with_script", [True, False])
+def test_list_page_parity(page, with_script):
+    html = sample_pages.list_page(page, with_script=with_script)
+
+    items = parsers.parse_list_page(html, backend='lxml')
+
+    assert items == parsers.parse_list_page(html, backend='html.parser')
+    assert [ntt_id for ntt_id, _ in items] == [
+        str(sample_pages.list_ntt_id((page - 1) * 10 + idx)) for idx in range(10)
+    ]
+    assert all(date_str for _, date_str in items)
+
+
+def test_empty_list_page():
+    html = sample_pages.list_page(1, per_page=0)
+
+    assert parsers.parse_list_page(html, backend='lxml') == []
+    assert parsers.parse_list_page(html, backend='html.parser') == []
+
+
+@pytest.mark.parametrize("ntt_id", [3_200_000, 3_199_000])
+@pytest.mark.parametrize("attachments", [0, 3])
+def test_detail_page_parity(ntt_id, attachments):
+    html = sample_pages.detail_page(ntt_id, attachments=attachments)
+
+    detail = parsers.parse_detail_page(html, str(ntt_id), backend='lxml')
+
+    assert detail == parsers.parse_detail_page(html, str(ntt_id), backend='html.parser')
+    assert detail['title'] and detail['dept'] and detail['content']
+    assert len(detail['downloads']) == attachments
+
+
+@pytest.mark.parametrize("encoding", [None, "utf-8", "x-unknown-charset"])
+def test_decode_html_falls_back_to_utf8(encoding):
+    assert parsers.decode_html("보도자료".encode('utf-8'), encoding) == "보도자료"
+
+
+def test_parse_detail_job_with_unknown_charset():
+    html = sample_pages.detail_page(3_200_000, attachments=1)
+
+    context, parsed = parsers.parse_detail_job(("ctx", "3200000", html.encode('utf-8'), "x-unknown-charset"))
+
+    assert context == "ctx"
+    assert parsed['title'] == parsers.parse_detail_page(html, "3200000")['title']
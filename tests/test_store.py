@@ -0,0 +1,115 @@
+"""ScraperStore 레코드 저장, 엑셀 파일별 포함 목록, 폴더명 변경"""
+import sqlite3
+
+import pytest
+
+from store import ScraperStore
+
+
+def record(ntt_id, reg_date="2026-02-07", **fields):
+    return {'번호': str(ntt_id), '제목': f"제목 {ntt_id}", '등록일': reg_date, **fields}
+
+
+@pytest.fixture
+def data_store():
+    data_store = ScraperStore(":memory:")
+    yield data_store
+    data_store.close()
+
+
+def ids(records):
+    return [r['번호'] for r in records]
+
+
+def test_upsert_updates_existing_record(data_store):
+    data_store.upsert_records([record(1), record(2)])
+    data_store.upsert_records([record(1, 제목="수정된 제목")])
+
+    assert data_store.count_records() == 2
+    assert [r['제목'] for r in data_store.iter_records()] == ["수정된 제목", "제목 2"]
+    assert data_store.load_seen_ids() == {"1", "2"}
+
+
+def test_high_water(data_store):
+    assert data_store.get_high_water() == (None, None)
+
+    data_store.upsert_records([record(10, "2026-02-01"), record(9, "2026-02-03")])
+    data_store.upsert_records([record(5, "2026-01-01")])
+
+    assert data_store.get_high_water() == (10, "2026-02-03")
+
+
+def test_file_records_include_recollected_posts(data_store):
+    data_store.upsert_records([record(1), record(2)], collected_on="20260206", source="press_20260206.xlsx")
+    data_store.upsert_records([record(2), record(3)], collected_on="20260207", source="press_20260207.xlsx")
+
+    assert ids(data_store.iter_records(file_name="press_20260206.xlsx")) == ["1", "2"]
+    assert ids(data_store.iter_records(file_name="press_20260207.xlsx")) == ["2", "3"]
+    assert data_store.count_records(file_name="press_20260207.xlsx") == 2
+    # 수집일은 처음 수집한 날로 유지
+    collected = {r['번호']: r['수집일'] for r in data_store.iter_records(with_collected_on=True)}
+    assert collected == {"1": "20260206", "2": "20260206", "3": "20260207"}
+
+
+def test_reg_period_filter(data_store):
+    data_store.upsert_records([record(1, "2025-12-31"), record(2, "2026-01-02"), record(3, "2026-02-07")],
+                              source="press.xlsx")
+
+    assert data_store.list_reg_periods(4) == ["2025", "2026"]
+    assert data_store.list_reg_periods(7, file_name="press.xlsx") == ["2025-12", "2026-01", "2026-02"]
+    assert ids(data_store.iter_records(reg_period="2026", period_length=4)) == ["2", "3"]
+
+
+def test_sync_excel_files_keeps_stored_records(data_store, tmp_path):
+    import exporter
+
+    data_store.upsert_records([record(1, 제목="저장소 제목")])
+    exporter.export_records([record(1, 제목="엑셀 제목"), record(2)], str(tmp_path / "press_20260207.xlsx"))
+
+    assert data_store.sync_excel_files(str(tmp_path)) == 1
+    assert [r['제목'] for r in data_store.iter_records()] == ["저장소 제목", "제목 2"]
+    assert ids(data_store.iter_records(file_name="press_20260207.xlsx")) == ["1", "2"]
+    # 수정 시각이 그대로면 다시 읽지 않음
+    assert data_store.sync_excel_files(str(tmp_path)) == 0
+
+
+def test_file_records_seeded_from_previous_version(tmp_path):
+    path = str(tmp_path / "store.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE seen_ids (ntt_id TEXT PRIMARY KEY, reg_date TEXT, source TEXT)")
+    conn.executemany("INSERT INTO seen_ids VALUES (?, ?, ?)",
+                     [("1", "2026-02-06", "press_20260206.xlsx"), ("2", "2026-02-07", "scraped")])
+    conn.commit()
+    conn.close()
+
+    data_store = ScraperStore(path)
+    data_store.upsert_records([record(1), record(2)])
+
+    assert ids(data_store.iter_records(file_name="press_20260206.xlsx")) == ["1"]
+    data_store.close()
+
+
+def test_rename_attachment_folder(data_store):
+    old_link = '=HYPERLINK("../downloads/old_folder", "첨부파일 폴더")'
+    data_store.upsert_records([record(1, 첨부파일경로=old_link), record(2, 첨부파일경로="")])
+    data_store.record_attachment("10", "1", "a.hwpx", "downloads/old_folder/a.hwpx", 3, "sha")
+
+    assert data_store.rename_attachment_folder("old_folder", "new_folder") == ["1"]
+
+    paths = {r['번호']: r['첨부파일경로'] for r in data_store.iter_records()}
+    assert paths == {"1": '=HYPERLINK("../downloads/new_folder", "첨부파일 폴더")', "2": ""}
+    assert data_store.get_attachment("10", "1")['file_path'] == "downloads/new_folder/a.hwpx"
+
+
+def test_failures(data_store):
+    data_store.record_failure('detail', "1", "timeout", ntt_id="1", reg_date="2026-02-07")
+    data_store.record_failure('detail', "1", "timeout")
+    data_store.record_failure('list', "3", "HTTP 500")
+
+    assert data_store.count_failures() == {'detail': 1, 'list': 1}
+    assert data_store.list_failures('detail')[0]['attempts'] == 2
+
+    # 저장된 게시글은 상세 실패 목록에서 제거
+    data_store.upsert_records([record(1)])
+    data_store.resolve_failure('list', "3")
+    assert data_store.count_failures() == {}
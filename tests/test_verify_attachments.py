@@ -0,0 +1,36 @@
+"""첨부파일 매니페스트 검증 (--verify-attachments): 본문을 받지 않고 서버의 크기만 확인"""
+import pytest
+
+from benchmarks import sample_pages
+
+POSTS = 3
+
+
+def collect(scraper):
+    candidates = [(idx, POSTS, str(sample_pages.list_ntt_id(idx)), "2026-10-01") for idx in range(POSTS)]
+    records = list(scraper._fetch_details(candidates))
+    assert all(records)
+
+
+@pytest.mark.parametrize("allow_head", [True, False])
+def test_verify_reads_sizes_without_downloading(mock_server, make_scraper, allow_head):
+    server = mock_server(pages=1, attachments=1, attachment_size=4096, allow_head=allow_head)
+    scraper = make_scraper()
+    collect(scraper)
+    server.stats.clear()
+
+    assert scraper.verify_attachments() == 0
+    # 파일마다 HEAD 한 번, HEAD를 거부하는 서버면 첫 1바이트만 받는 GET 한 번 더
+    assert server.stats['HEAD'] == POSTS
+    assert server.stats['file'] == POSTS
+    assert len(scraper.store.iter_attachments()) == POSTS
+
+
+def test_verify_drops_mismatched_sizes(mock_server, make_scraper):
+    server = mock_server(pages=1, attachments=1, attachment_size=4096)
+    scraper = make_scraper()
+    collect(scraper)
+
+    server.attachment_size = 5000
+    assert scraper.verify_attachments() == POSTS
+    assert scraper.store.iter_attachments() == []
@@ -0,0 +1,120 @@
+"""WorkQueue 작업 임대/만료/재시도"""
+import pytest
+
+import work_queue
+from work_queue import WorkQueue
+
+
+class Clock:
+    """work_queue의 time.time()을 대신하는 수동 시계"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(work_queue.time, 'time', clock.time)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    queue = WorkQueue(str(tmp_path / "queue.db"), lease_seconds=10, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_publish_and_complete(queue):
+    assert queue.publish_page_ranges(1, 5, shard_pages=2, settings={'year': 2026}) == 3
+    assert queue.get_settings() == {'year': 2026}
+
+    payloads = []
+    while (shard := queue.claim("w1")) is not None:
+        payloads.append(shard['payload'])
+        assert queue.complete(shard['id'], "w1", result_count=1)
+
+    assert payloads == [{'start': 1, 'end': 2}, {'start': 3, 'end': 4}, {'start': 5, 'end': 5}]
+    assert queue.is_finished()
+    assert queue.progress() == {'pages': {'done': 3}}
+
+
+def test_details_claimed_first(queue):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    queue.publish_details([("100", "2026-01-01")])
+
+    shard = queue.claim("w1")
+    assert shard['kind'] == 'details'
+    assert shard['payload'] == [["100", "2026-01-01"]]
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    shard = queue.claim("w1")
+    assert queue.claim("w2") is None
+
+    clock.now += 11
+    reclaimed = queue.claim("w2")
+
+    assert reclaimed['id'] == shard['id']
+    assert reclaimed['attempts'] == 2
+    # 임대를 잃은 워커의 완료 기록은 무시
+    assert not queue.complete(shard['id'], "w1")
+    assert queue.complete(shard['id'], "w2")
+    assert queue.is_finished()
+
+
+def test_heartbeat_extends_lease(queue, clock):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    shard = queue.claim("w1")
+
+    clock.now += 8
+    queue.heartbeat("w1", shard['id'])
+    clock.now += 8
+
+    assert queue.claim("w2") is None
+    assert queue.complete(shard['id'], "w1")
+
+
+def test_shard_fails_after_max_attempts(queue, clock):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    queue.claim("w1")
+    clock.now += 11
+    queue.claim("w2")
+    clock.now += 11
+
+    assert queue.claim("w3") is None
+    assert queue.progress() == {'pages': {'failed': 1}}
+    assert queue.is_finished()
+
+
+def test_fail_requeues_until_max_attempts(queue):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    shard = queue.claim("w1")
+    queue.fail(shard['id'], "w1", "boom")
+
+    retry = queue.claim("w2")
+    assert retry['id'] == shard['id']
+    queue.fail(retry['id'], "w2", "boom")
+
+    assert queue.claim("w3") is None
+    assert queue.progress() == {'pages': {'failed': 1}}
+
+
+def test_complete_publishes_details_only_with_lease(queue, clock):
+    queue.publish_page_ranges(1, 1, shard_pages=1)
+    shard = queue.claim("w1")
+    clock.now += 11
+    reclaimed = queue.claim("w2")
+
+    # 임대를 잃은 워커가 찾은 대상은 게시하지 않음
+    assert not queue.complete(shard['id'], "w1", 1, [[("100", "2026-01-01")]])
+    assert queue.complete(reclaimed['id'], "w2", 1, [[("100", "2026-01-01")], []])
+
+    details = queue.claim("w2")
+    assert details['payload'] == [["100", "2026-01-01"]]
+    assert queue.claim("w2") is None
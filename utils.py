@@ -1,4 +1,6 @@
 import re
+import hashlib
+import pandas as pd
 from datetime import datetime
 
 def clean_text(text):
@@ -27,6 +29,12 @@ def parse_date(date_str):
             
     return None
 
+# 영어 월 이름 매핑 (normalize_date, normalize_date_series 공용)
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
+    'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
 def normalize_date(date_str: str) -> str:
     """
     다양한 날짜 포맷을 YYYY-MM-DD로 표준화합니다.
@@ -51,13 +59,9 @@ def normalize_date(date_str: str) -> str:
     
     # 영어 형식: Feb 6, 2026
     if ',' in date_str:
-        months = {
-            'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
-            'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-        }
         parts = date_str.replace(',', '').split()
         if len(parts) == 3:
-            month = months.get(parts[0], '01')
+            month = _MONTHS.get(parts[0], '01')
             day = parts[1].zfill(2)
             year = parts[2]
             return f"{year}-{month}-{day}"
@@ -74,6 +78,44 @@ def normalize_date(date_str: str) -> str:
     # 파싱 실패 시 원본 반환
     return date_str
 
+def normalize_date_series(series):
+    """
+    normalize_date의 컬럼 단위(벡터화) 버전. pandas Series를 받아 같은 규칙으로 변환합니다.
+    datetime 값은 YYYY-MM-DD로, 그 외 값은 문자열로 변환 후 표준화합니다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y-%m-%d")
+
+    is_datetime = series.map(lambda v: isinstance(v, datetime))
+    # astype(str)는 pandas 버전에 따라 결측값을 'nan'이 아닌 결측으로 남기므로 str()로 변환
+    result = series.map(str).astype(object).str.strip().str.rstrip('.')
+    resolved = result.eq("") | result.str.match(r'^\d{4}-\d{2}-\d{2}$')
+
+    # 영어 형식: Feb 6, 2026 (해당 후보 행만 정규식 적용)
+    candidates = ~resolved & result.str.contains(',', regex=False)
+    if candidates.any():
+        english = result[candidates].str.replace(',', '', regex=False).str.strip().str.extract(r'^(\S+)\s+(\S+)\s+(\S+)$')
+        english = english[english[0].notna()]
+        result.loc[english.index] = (
+            english[2] + "-" + english[0].map(_MONTHS).fillna('01') + "-" + english[1].str.zfill(2)
+        )
+        resolved.loc[english.index] = True
+
+    # 한국어/점 형식: 2026. 2. 6 또는 2026.02.06
+    candidates = ~resolved & result.str.contains('.', regex=False)
+    if candidates.any():
+        dotted = result[candidates].str.extract(r'^\D*?(\d+)\D+?(\d+)\D+?(\d+)')
+        dotted = dotted[dotted[0].notna()]
+        result.loc[dotted.index] = dotted[0] + "-" + dotted[1].str.zfill(2) + "-" + dotted[2].str.zfill(2)
+
+    # datetime 값
+    if is_datetime.any():
+        result = result.where(
+            ~is_datetime,
+            series[is_datetime].map(lambda v: v.strftime("%Y-%m-%d"))
+        )
+    return result
+
 def summarize_text(text, num_sentences=3):
     """규칙 기반 요약: 본문의 첫 N개 문장 추출 (길이 체크 포함)"""
     if not text:
@@ -92,3 +134,11 @@ def summarize_text(text, num_sentences=3):
         
     summary = " ".join(valid_sentences[:num_sentences])
     return summary
+
+def file_sha256(file_path, chunk_size=1024 * 1024):
+    """파일의 SHA-256 해시 (16진수 문자열)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,239 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class WorkQueue:
+    """
+    분산 수집용 작업 큐 (SQLite 파일, 공유 저장소에 두면 여러 호스트에서 사용 가능).
+
+    - shards: 작업 단위
+        pages   목록 페이지 구간 {"start": N, "end": M} (처리하면 페이지별 details 작업이 추가됨)
+        details 상세 수집 대상 [[번호, 등록일], ...]
+    - workers: 워커별 마지막 하트비트 (활성 워커 수로 전역 요청 속도를 나눔)
+    - meta: 작업 게시 완료 여부 등
+
+    워커는 작업을 임대(lease)하고 하트비트로 임대를 연장합니다.
+    워커가 죽어 임대가 만료되면 다른 워커가 가져가며, 시도 횟수가 max_attempts에 도달하면 failed로 남습니다.
+    임대 만료 판단에 시각(time.time())을 쓰므로 여러 호스트에서 실행할 때는 시계가 동기화되어 있어야 합니다.
+    """
+
+    def __init__(self, path, lease_seconds=config.LEASE_SECONDS, max_attempts=config.SHARD_MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE로 프로세스 간 작업 임대를 직렬화)
+        self.conn = sqlite3.connect(path, timeout=config.STORE_BUSY_TIMEOUT,
+                                    isolation_level=None, check_same_thread=False)
+        self.conn.execute(f"PRAGMA journal_mode={config.STORE_JOURNAL_MODE}")
+        self.lock = threading.RLock()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS shards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT,
+                payload TEXT,
+                status TEXT,
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER DEFAULT 0,
+                result_count INTEGER,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS shards_status ON shards (status, kind);
+            CREATE TABLE IF NOT EXISTS workers (
+                worker_id TEXT PRIMARY KEY,
+                heartbeat REAL,
+                shards_done INTEGER DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (다른 프로세스와 같은 작업을 동시에 임대하지 않도록)"""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    # --- 작업 게시 (코디네이터) ---
+
+    def reset(self):
+        """이전 작업 목록 삭제"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM shards")
+            conn.execute("DELETE FROM meta")
+
+    def publish_page_ranges(self, start_page, end_page, shard_pages=config.SHARD_PAGES, settings=None):
+        """
+        목록 페이지 [start_page, end_page]를 shard_pages개씩 나눠 게시하고 게시 완료로 표시
+        settings: 워커가 따를 수집 조건 (수집 기간 등, JSON으로 저장)
+        """
+        ranges = [
+            {'start': page, 'end': min(page + shard_pages - 1, end_page)}
+            for page in range(start_page, end_page + 1, shard_pages)
+        ]
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO shards (kind, payload, status) VALUES ('pages', ?, ?)",
+                [(json.dumps(r), PENDING) for r in ranges]
+            )
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('settings', ?)",
+                         (json.dumps(settings or {}, ensure_ascii=False),))
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('ready', '1')")
+        return len(ranges)
+
+    def publish_details(self, items):
+        """상세 수집 대상 [(번호, 등록일), ...]을 작업 하나로 게시"""
+        with self._transaction() as conn:
+            self._insert_details(conn, [items])
+
+    @staticmethod
+    def _insert_details(conn, batches):
+        """상세 수집 대상 목록마다 details 작업 하나씩 추가 (빈 목록은 제외, 트랜잭션 내부에서 호출)"""
+        conn.executemany(
+            "INSERT INTO shards (kind, payload, status) VALUES ('details', ?, ?)",
+            [(json.dumps([list(item) for item in items], ensure_ascii=False), PENDING)
+             for items in batches if items]
+        )
+
+    # --- 작업 처리 (워커) ---
+
+    def claim(self, worker_id):
+        """
+        대기 중이거나 임대가 만료된 작업 하나를 임대합니다 (상세 작업 우선).
+        Returns:
+            dict 또는 None: id, kind, payload, attempts
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            # 시도 횟수를 다 쓴 채 임대가 만료된 작업은 포기
+            conn.execute(
+                "UPDATE shards SET status = ?, error = 'lease expired' "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT id, kind, payload, attempts FROM shards "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                "ORDER BY CASE kind WHEN 'details' THEN 0 ELSE 1 END, id LIMIT 1",
+                (PENDING, LEASED, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE shards SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_seconds, row[0])
+            )
+        return {'id': row[0], 'kind': row[1], 'payload': json.loads(row[2]), 'attempts': row[3] + 1}
+
+    def heartbeat(self, worker_id, shard_id=None):
+        """워커 생존 신호, 처리 중인 작업의 임대 연장"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO workers (worker_id, heartbeat) VALUES (?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET heartbeat = excluded.heartbeat",
+                (worker_id, now)
+            )
+            if shard_id is not None:
+                conn.execute(
+                    "UPDATE shards SET lease_expires = ? WHERE id = ? AND owner = ? AND status = ?",
+                    (now + self.lease_seconds, shard_id, worker_id, LEASED)
+                )
+
+    def complete(self, shard_id, worker_id, result_count=0, details=None):
+        """
+        작업 완료 기록. 임대가 만료되어 다른 워커가 가져간 작업이면 False
+        (결과는 번호 기준 upsert라 중복 처리되어도 저장소에는 한 번만 남음)
+        details: 이 작업에서 찾은 상세 수집 대상 목록들 ([[(번호, 등록일), ...], ...]).
+                 완료와 같은 트랜잭션에서, 임대를 유지하고 있을 때만 details 작업으로 게시하므로
+                 실패 후 재시도되거나 다른 워커가 가져간 작업이 같은 대상을 두 번 게시하지 않음
+        """
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE shards SET status = ?, result_count = ?, error = NULL "
+                "WHERE id = ? AND owner = ? AND status = ?",
+                (DONE, result_count, shard_id, worker_id, LEASED)
+            ).rowcount
+            if updated:
+                conn.execute("UPDATE workers SET shards_done = shards_done + 1 WHERE worker_id = ?", (worker_id,))
+                self._insert_details(conn, details or [])
+        return updated == 1
+
+    def fail(self, shard_id, worker_id, error):
+        """작업 실패: 시도 횟수가 남아 있으면 다시 대기열로, 아니면 failed"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE shards SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "owner = NULL, lease_expires = NULL, error = ? "
+                "WHERE id = ? AND owner = ? AND status = ?",
+                (self.max_attempts, FAILED, PENDING, str(error)[:500], shard_id, worker_id, LEASED)
+            )
+
+    def unregister(self, worker_id):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    # --- 상태 조회 ---
+
+    def active_workers(self, ttl=None):
+        """최근 ttl초(기본: 하트비트 간격의 3배) 안에 하트비트를 보낸 워커 수"""
+        ttl = ttl or config.HEARTBEAT_INTERVAL * 3
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM workers WHERE heartbeat >= ?", (time.time() - ttl,)
+            ).fetchone()[0]
+
+    def get_settings(self):
+        """코디네이터가 게시한 수집 조건"""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def is_ready(self):
+        """코디네이터가 작업 게시를 마쳤는지"""
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM meta WHERE key = 'ready'").fetchone() is not None
+
+    def is_finished(self):
+        """게시가 끝났고 대기/임대 중인 작업이 없는지"""
+        with self.lock:
+            remaining = self.conn.execute(
+                "SELECT COUNT(*) FROM shards WHERE status IN (?, ?)", (PENDING, LEASED)
+            ).fetchone()[0]
+        return self.is_ready() and remaining == 0
+
+    def progress(self):
+        """{종류: {상태: 작업 수}}"""
+        result = {}
+        with self.lock:
+            rows = self.conn.execute("SELECT kind, status, COUNT(*) FROM shards GROUP BY kind, status").fetchall()
+        for kind, status, count in rows:
+            result.setdefault(kind, {})[status] = count
+        return result